@@ -229,7 +229,7 @@ with col2:
     
     # Import necessary functions from downloads component to generate proper report data
     from components.downloads import (
-        generate_csv, generate_txt, generate_pdf, generate_docx, generate_xlsx, generate_image,
+        generate_csv, _FORMAT_GENERATORS,
         _processed_data, _equipment_data, _report_type, _time_period
     )
     
@@ -240,24 +240,17 @@ with col2:
     components.downloads._report_type = "Equipment Status Report"
     components.downloads._time_period = "Last 7 Days"
     
-    # Generate appropriate report data based on selected format
-    report_data = None
-    if selected_format == 'csv':
-        # Use the standardized generate_csv function from the downloads component
-        report_data = generate_csv()
-    elif selected_format == 'txt':
-        report_data = generate_txt()
-    elif selected_format in ['pdf', 'doc', 'rtf', 'xps']:
-        report_data = generate_pdf()
-    elif selected_format in ['docx']:
-        report_data = generate_docx()
-    elif selected_format in ['xls', 'xlsx']:
-        report_data = generate_xlsx()
-    elif selected_format in ['jpg', 'jpeg', 'tiff', 'tif']:
-        report_data = generate_image()
-    else:
-        # Default to CSV if format not recognized
-        report_data = generate_csv()
+    # This header report is rebuilt on every rerun of every page, so keep the last one
+    # until the format changes or the data is refreshed
+    header_report_key = (selected_format, st.session_state.last_update)
+    if st.session_state.get('header_report_key') != header_report_key:
+        # Generate appropriate report data based on selected format, defaulting to CSV
+        report_data = _FORMAT_GENERATORS.get(selected_format, generate_csv)()
+        
+        st.session_state.header_report = report_data
+        st.session_state.header_report_key = header_report_key
+    
+    report_data = st.session_state.header_report
     
     st.download_button(
         label="📊 Download Report",
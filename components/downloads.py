@@ -3,14 +3,16 @@ import pandas as pd
 import numpy as np
 import io
 import base64
+import shutil
+import tempfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from utils.session_cache import get_page_cache
 
-# Import libraries for specific file formats
-from fpdf import FPDF
-from docx import Document
-import xlsxwriter
-from PIL import Image, ImageDraw, ImageFont
+# Libraries for specific file formats (fpdf, python-docx, xlsxwriter and PIL)
+# are imported inside the generators that use them
 
 # Global variables to store data between function calls
 # These are needed when functions are called directly from app.py
@@ -19,6 +21,173 @@ _equipment_data = None
 _report_type = "Equipment Status Report"
 _time_period = "Last 7 Days"
 
+@lru_cache(maxsize=16)
+def _load_report_font(name, size):
+    """Load a TrueType font once per (name, size), falling back to PIL's default font"""
+    from PIL import ImageFont
+    try:
+        return ImageFont.truetype(name, size)
+    except IOError:
+        return ImageFont.load_default()
+
+@lru_cache(maxsize=32)
+def _render_report_label(text, font_name, size):
+    """Render a static report label once onto a transparent image for pasting"""
+    from PIL import Image, ImageDraw
+    font = _load_report_font(font_name, size)
+    _, _, right, bottom = font.getbbox(text)
+    label = Image.new('RGBA', (right, bottom), (0, 0, 0, 0))
+    ImageDraw.Draw(label).text((0, 0), text, fill="black", font=font)
+    return label
+
+@lru_cache(maxsize=4)
+def _render_table_header(headers, offsets, size, line_width):
+    """Render a static table header row and its separator line onto a transparent strip"""
+    from PIL import Image, ImageDraw
+    font = _load_report_font("Arial", size)
+    strip = Image.new('RGBA', (line_width + 1, 40), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(strip)
+    for offset, header in zip(offsets, headers):
+        draw.text((offset, 0), header, fill="black", font=font)
+    draw.line([(0, 30), (line_width, 30)], fill="black", width=1)
+    return strip
+
+# Bar fill colors for the maintenance urgency chart in the image report
+_URGENCY_COLORS = {
+    'Immediate': (255, 0, 0),      # Red
+    'Soon': (255, 165, 0),         # Orange
+    'Planned': (255, 255, 0),      # Yellow
+    'Normal': (0, 128, 0)          # Green
+}
+
+@lru_cache(maxsize=8)
+def _render_urgency_chart(urgency_counts, width):
+    """
+    Render the maintenance urgency bar chart once per distinct set of counts
+    
+    Parameters:
+    urgency_counts (tuple): (category, count) pairs in display order
+    width (int): Width of the report canvas
+    
+    Returns:
+    Image: White RGB strip with the bar baseline 250px from the top
+    """
+    from PIL import Image, ImageDraw
+    font = _load_report_font("Arial", 18)
+    
+    # Bar chart dimensions
+    max_value = max(count for _, count in urgency_counts) or 1
+    bar_width = 120
+    bar_spacing = 60
+    bar_height_scale = 200 / max_value  # Scale bars to fit in 200px height
+    bar_start_x = 150
+    bar_base_y = 250
+    
+    # Fill all bars into one pixel array before any drawing
+    bars = np.full((bar_base_y + 40, width, 3), 255, dtype=np.uint8)
+    bar_layout = []
+    x = bar_start_x
+    for category, count in urgency_counts:
+        bar_height = int(count * bar_height_scale)
+        bars[bar_base_y - bar_height:bar_base_y, x:x + bar_width + 1] = _URGENCY_COLORS.get(category, (200, 200, 200))
+        bar_layout.append((category, count, x, bar_height))
+        x += bar_width + bar_spacing
+    
+    chart = Image.fromarray(bars)
+    draw = ImageDraw.Draw(chart)
+    
+    # Draw bar outlines, category labels and counts
+    for category, count, x, bar_height in bar_layout:
+        draw.rectangle([(x, bar_base_y - bar_height), (x + bar_width, bar_base_y)], outline=(0, 0, 0))
+        draw.text((x + bar_width//2 - 35, bar_base_y + 10), category, fill="black", font=font)
+        draw.text((x + bar_width//2 - 10, bar_base_y - bar_height - 25), str(count), fill="black", font=font)
+    
+    # Draw a horizontal line at the base of the bars
+    draw.line([(100, bar_base_y), (width-100, bar_base_y)], fill="black", width=2)
+    
+    return chart
+
+# Demo payload for the supporting evidence download
+_EVIDENCE_PLACEHOLDER_BYTES = b"This is a placeholder for the selected evidence documents."
+
+# Formats offered on the Downloads page, and the MIME type sent with each
+_REPORT_FORMATS = (
+    'csv', 'pdf', 'doc', 'docx', 'xls', 'xlsx', 
+    'rtf', 'txt', 'jpg', 'jpeg', 'tiff', 'tif', 'xps', 'zip'
+)
+_REPORT_MIME_TYPES = {
+    'csv': "text/csv",
+    'pdf': "application/pdf",
+    'doc': "application/msword",
+    'docx': "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    'xls': "application/vnd.ms-excel",
+    'xlsx': "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    'rtf': "application/rtf",
+    'txt': "text/plain",
+    'jpg': "image/jpeg",
+    'jpeg': "image/jpeg",
+    'tiff': "image/tiff",
+    'tif': "image/tiff",
+    'xps': "application/oxps",
+    'zip': "application/zip"
+}
+
+# Professional documentation packages and their descriptions
+_PROFESSIONAL_DOC_OPTIONS = {
+    "System Architecture Blueprint": "Detailed block diagrams and data flow architecture documentation",
+    "Technical Uncertainties Report": "Analysis of technical challenges and research methodology",
+    "Experimental Protocol & Results": "Methodologies, test results, and performance metrics",
+    "SR&ED Financial Documentation": "Eligible expenses breakdown and CRA compliance evidence",
+    "Risk Assessment & Mitigation": "Comprehensive risk analysis and contingency planning",
+    "Quality Assurance Protocols": "Validation procedures and system reliability evidence",
+    "Professional Technical Report": "Complete project documentation in CRA-compliant format"
+}
+
+# Document outputs larger than this spill from memory to a temporary file while being written
+_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+def _read_spooled(spool):
+    """Return the full contents of a spooled output file and release it"""
+    with spool:
+        spool.seek(0)
+        return spool.read()
+
+# Fixed timestamp for archive entries, so identical content always zips to identical bytes
+_ZIP_ENTRY_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+# CSV exports are mostly digits and compress nearly as well at the fastest zlib level
+_CSV_COMPRESSLEVEL = 1
+
+# xlsxwriter options for the Excel reports: rows are flushed as they are written, and report
+# text is always stored as plain strings, so write() skips its URL and formula checks per cell
+_XLSX_WORKBOOK_OPTIONS = {
+    'constant_memory': True,
+    'strings_to_numbers': False,
+    'strings_to_urls': False,
+    'strings_to_formulas': False
+}
+
+# Column order and fallbacks for the equipment and metrics tables in the report formats
+_EQUIPMENT_TABLE_COLUMNS = ['machine_id', 'machine_type', 'status', 'failure_probability', 
+                            'days_to_failure', 'maintenance_urgency', 'recommendation']
+_EQUIPMENT_TABLE_DEFAULTS = {'failure_probability': 'N/A', 'days_to_failure': 'N/A', 
+                             'maintenance_urgency': 'Unknown', 'recommendation': 'No recommendation'}
+_METRICS_TABLE_COLUMNS = ['machine_id', 'overall_health', 'oee', 'availability', 
+                          'performance', 'quality', 'power_usage']
+
+def _zip_entry(name, compress_type=zipfile.ZIP_DEFLATED):
+    """Build a ZipInfo for an archive entry with a fixed timestamp"""
+    info = zipfile.ZipInfo(name, date_time=_ZIP_ENTRY_DATE_TIME)
+    info.compress_type = compress_type
+    info.external_attr = 0o600 << 16  # Same file permissions writestr gives named entries
+    return info
+
+def _write_zip_entry(zipf, name, data, compress_type=zipfile.ZIP_DEFLATED):
+    """Write an archive entry with a fixed timestamp at the archive's compression level"""
+    # writestr only applies the archive's level to entries added by name, so pass it on explicitly
+    zipf.writestr(_zip_entry(name, compress_type), data, compress_type=compress_type,
+                  compresslevel=zipf.compresslevel)
+
 # Global report generation functions for use in app.py
 def generate_csv():
     """Generate CSV file from all application data"""
@@ -26,95 +195,92 @@ def generate_csv():
     zip_buffer = io.BytesIO()
     
     # Create a ZIP file to contain multiple CSV files
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zipf:
+    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=_CSV_COMPRESSLEVEL) as zipf:
         # Add equipment data
-        equipment_csv = get_enhanced_equipment_df().to_csv(index=False)
-        zipf.writestr('equipment_status.csv', equipment_csv)
+        with zipf.open('equipment_status.csv', 'w') as entry:
+            _display_equipment(get_enhanced_equipment_df()).to_csv(entry, index=False)
         
         # Add sensor data summary
-        sensor_csv = get_sensor_data_summary().to_csv(index=False)
-        zipf.writestr('sensor_readings.csv', sensor_csv)
+        with zipf.open('sensor_readings.csv', 'w') as entry:
+            get_sensor_data_summary().to_csv(entry, index=False)
         
         # Add anomaly data
-        anomaly_csv = get_anomaly_data().to_csv(index=False)
-        zipf.writestr('anomaly_detection.csv', anomaly_csv)
+        with zipf.open('anomaly_detection.csv', 'w') as entry:
+            get_anomaly_data().to_csv(entry, index=False)
         
         # Add performance metrics
-        metrics_csv = get_performance_metrics().to_csv(index=False)
-        zipf.writestr('performance_metrics.csv', metrics_csv)
+        with zipf.open('performance_metrics.csv', 'w') as entry:
+            get_performance_metrics().to_csv(entry, index=False)
         
         # Add historical trends if available
-        historical_csv = get_historical_trends().to_csv(index=False)
-        zipf.writestr('historical_trends.csv', historical_csv)
+        with zipf.open('historical_trends.csv', 'w') as entry:
+            get_historical_trends().to_csv(entry, index=False)
     
-    # Reset buffer position
-    zip_buffer.seek(0)
     return zip_buffer.getvalue()
 
 def generate_txt():
     """Generate comprehensive text report from all application data"""
     global _report_type, _time_period
-    equipment_df = get_enhanced_equipment_df()
+    equipment_df = _display_equipment(get_enhanced_equipment_df())
     sensor_data = get_sensor_data_summary()
     anomaly_data = get_anomaly_data()
     metrics_data = get_performance_metrics()
     
-    # Create a text report
+    # Create a text report, writing each line straight into one buffer
     current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    report = [
-        f"SmartMaintain - {_report_type}",
-        f"Generated: {current_time}",
-        f"Time Period: {_time_period}",
-        "-" * 80,
-        "\n=== EXECUTIVE SUMMARY ===\n"
-    ]
+    report = io.StringIO()
+    write = report.write
+    write(f"SmartMaintain - {_report_type}\n"
+          f"Generated: {current_time}\n"
+          f"Time Period: {_time_period}\n"
+          f"{'-' * 80}\n"
+          "\n=== EXECUTIVE SUMMARY ===\n\n")
     
     # Add executive summary
-    critical_count = len([r for _, r in equipment_df.iterrows() if 'maintenance_urgency' in r and r['maintenance_urgency'] == 'Immediate'])
-    warning_count = len([r for _, r in equipment_df.iterrows() if 'maintenance_urgency' in r and r['maintenance_urgency'] == 'Soon'])
-    anomaly_count = len([r for _, r in anomaly_data.iterrows() if r['anomaly_detected'] == True])
+    critical_count, warning_count, anomaly_count = _summary_counts(equipment_df, anomaly_data)
     
-    report.append(f"Total Equipment: {len(equipment_df)}")
-    report.append(f"Critical Maintenance Alerts: {critical_count}")
-    report.append(f"Warning Maintenance Alerts: {warning_count}")
-    report.append(f"Detected Anomalies: {anomaly_count}")
-    report.append("")
+    write(f"Total Equipment: {len(equipment_df)}\n"
+          f"Critical Maintenance Alerts: {critical_count}\n"
+          f"Warning Maintenance Alerts: {warning_count}\n"
+          f"Detected Anomalies: {anomaly_count}\n\n")
     
     # Add key metrics
     if not metrics_data.empty:
-        avg_health = metrics_data['overall_health'].str.rstrip('%').astype(float).mean()
-        avg_oee = metrics_data['oee'].str.rstrip('%').astype(float).mean()
-        report.append(f"Average Equipment Health: {avg_health:.1f}%")
-        report.append(f"Average OEE: {avg_oee:.1f}%")
-    report.append("")
+        avg_health = metrics_data.attrs['average_health']
+        avg_oee = metrics_data.attrs['average_oee']
+        write(f"Average Equipment Health: {avg_health:.1f}%\n"
+              f"Average OEE: {avg_oee:.1f}%\n")
+    write("\n")
     
     # Critical Issues Section
-    report.append("\n=== CRITICAL ISSUES ===\n")
+    write("\n=== CRITICAL ISSUES ===\n\n")
     
     # List machines with immediate maintenance needs
     critical_machines = equipment_df[equipment_df['maintenance_urgency'] == 'Immediate']
     if len(critical_machines) > 0:
-        report.append("Machines Requiring Immediate Attention:")
-        for _, row in critical_machines.iterrows():
-            report.append(f"- {row['machine_id']} ({row['machine_type']})")
-            report.append(f"  Failure Probability: {row['failure_probability']}")
-            report.append(f"  Days to Failure: {row['days_to_failure']}")
-            report.append(f"  Recommendation: {row.get('recommendation', 'No recommendation')}")
-            report.append("")
+        write("Machines Requiring Immediate Attention:\n")
+        for machine_id, machine_type, failure_probability, days_to_failure, recommendation in zip(
+                critical_machines['machine_id'], critical_machines['machine_type'],
+                critical_machines['failure_probability'], critical_machines['days_to_failure'],
+                _column_values(critical_machines, 'recommendation', 'No recommendation')):
+            write(f"- {machine_id} ({machine_type})\n"
+                  f"  Failure Probability: {failure_probability}\n"
+                  f"  Days to Failure: {days_to_failure}\n"
+                  f"  Recommendation: {recommendation}\n\n")
     else:
-        report.append("No machines require immediate attention.")
-        report.append("")
+        write("No machines require immediate attention.\n\n")
     
     # Add more detailed sections as needed for app.py usage
     
-    # Join and return
-    return "\n".join(report)
+    return report.getvalue().encode('utf-8')
 
 def generate_pdf():
     """Generate comprehensive PDF report with data from all components"""
     global _report_type, _time_period
+    from fpdf import FPDF
+    
     # Get all the data we need
-    equipment_df = get_enhanced_equipment_df()
+    equipment_df = _display_equipment(get_enhanced_equipment_df())
     sensor_data = get_sensor_data_summary()
     anomaly_data = get_anomaly_data()
     metrics_data = get_performance_metrics()
@@ -144,6 +310,8 @@ def generate_pdf():
 def generate_docx():
     """Generate comprehensive DOCX report with data from all components"""
     global _report_type, _time_period
+    from docx import Document
+    
     # Create a new document
     doc = Document()
     
@@ -159,16 +327,17 @@ def generate_docx():
     # Save to a BytesIO object
     f = io.BytesIO()
     doc.save(f)
-    f.seek(0)
-    return f.read()
+    return f.getvalue()
 
 def generate_xlsx():
     """Generate comprehensive Excel report with data from all components"""
+    import xlsxwriter
+    
     # Create a BytesIO object to hold the Excel file
     output = io.BytesIO()
     
-    # Create a workbook
-    workbook = xlsxwriter.Workbook(output)
+    # Create a workbook that flushes each row as it is written, keeping memory flat
+    workbook = xlsxwriter.Workbook(output, _XLSX_WORKBOOK_OPTIONS)
     
     # Add a worksheet
     worksheet = workbook.add_worksheet("Equipment Status")
@@ -184,11 +353,12 @@ def generate_xlsx():
     workbook.close()
     
     # Get the content
-    output.seek(0)
     return output.getvalue()
 
 def generate_image():
     """Generate a comprehensive JPG image report with data from all components"""
+    from PIL import Image, ImageDraw
+    
     # Create a blank image
     img = Image.new('RGB', (800, 600), color='white')
     draw = ImageDraw.Draw(img)
@@ -201,10 +371,179 @@ def generate_image():
     # Save to a BytesIO object
     img_io = io.BytesIO()
     img.save(img_io, 'JPEG')
-    img_io.seek(0)
     return img_io.getvalue()
 
+# Module-level generator for each header report format; unknown formats fall back to CSV
+_FORMAT_GENERATORS = {
+    'csv': generate_csv,
+    'txt': generate_txt,
+    'pdf': generate_pdf,
+    'doc': generate_pdf,
+    'rtf': generate_pdf,
+    'xps': generate_pdf,
+    'docx': generate_docx,
+    'xls': generate_xlsx,
+    'xlsx': generate_xlsx,
+    'jpg': generate_image,
+    'jpeg': generate_image,
+    'tiff': generate_image,
+    'tif': generate_image
+}
+
 # Functions to get data for report generation
+def _index_processed_data(processed_data):
+    """
+    Convert the per-machine prediction, recommendation and statistics dicts into frames
+    
+    Parameters:
+    processed_data (dict): Processed sensor data with predictions
+    
+    Returns:
+    dict: 'predictions', 'recommendations' and 'statistics' DataFrames indexed by machine_id
+    """
+    statistics = processed_data.get('statistics', {})
+    
+    # Nested sensor statistics flatten to columns such as 'temperature.current'
+    statistics_df = pd.json_normalize(list(statistics.values()))
+    statistics_df.index = list(statistics.keys())
+    
+    return {
+        'predictions': pd.DataFrame.from_dict(processed_data.get('predictions', {}), orient='index'),
+        'recommendations': pd.DataFrame.from_dict(processed_data.get('recommendations', {}), orient='index'),
+        'statistics': statistics_df
+    }
+
+def _attach_predictions(equipment_df, indexed_data):
+    """
+    Add prediction and recommendation columns to equipment data, matched on machine_id
+    
+    Parameters:
+    equipment_df (DataFrame): Equipment data, modified in place
+    indexed_data (dict): Processed data frames from _index_processed_data
+    
+    Returns:
+    DataFrame: Equipment data with prediction columns
+    """
+    prediction_df = indexed_data['predictions']
+    if prediction_df.empty:
+        return equipment_df
+    
+    machine_ids = equipment_df['machine_id']
+    # Kept as a 0-1 float; report formats render it with _display_equipment
+    equipment_df['failure_probability'] = machine_ids.map(prediction_df['failure_probability'])
+    equipment_df['days_to_failure'] = machine_ids.map(prediction_df['days_to_failure'])
+    
+    # Recommendations only apply to machines that have a prediction
+    recommendation_df = indexed_data['recommendations']
+    recommendation_df = recommendation_df[recommendation_df.index.isin(prediction_df.index)]
+    if not recommendation_df.empty:
+        # Urgency has only a handful of levels, so filters on it compare integer codes
+        equipment_df['maintenance_urgency'] = machine_ids.map(recommendation_df['urgency']).astype('category')
+        equipment_df['recommendation'] = machine_ids.map(recommendation_df['message'])
+    
+    return equipment_df
+
+def _format_percent(fractions):
+    """Format 0-1 fractions as one-decimal percentage strings, leaving missing values empty"""
+    return (fractions * 100).map('{:.1f}%'.format, na_action='ignore')
+
+def _format_fixed(values, decimals, suffix='', missing='Unknown'):
+    """
+    Format numbers to a fixed number of decimals in one vectorized printf pass
+    
+    Parameters:
+    values (Series or array): Numeric values
+    decimals (int): Digits after the decimal point
+    suffix (str): Unit text appended to each formatted value
+    missing (str): Text used for missing or non-numeric values
+    
+    Returns:
+    ndarray: Formatted strings, one per value
+    """
+    numbers = pd.to_numeric(pd.Series(values), errors='coerce').to_numpy(dtype=np.float64)
+    text = np.char.mod(f"%.{decimals}f{suffix.replace('%', '%%')}", numbers)
+    return np.where(np.isnan(numbers), missing, text)
+
+def _display_equipment(equipment_df):
+    """Return equipment data with the failure probability formatted for display"""
+    if 'failure_probability' not in equipment_df:
+        return equipment_df
+    return equipment_df.assign(failure_probability=_format_percent(equipment_df['failure_probability']))
+
+def _column_values(df, column, default):
+    """Return a column's values, or the default repeated for every row if the column is missing"""
+    if column in df:
+        return df[column].values
+    return [default] * len(df)
+
+def _table_frame(df, columns, defaults=None):
+    """Select a report table's columns, filling any missing from the frame with their defaults"""
+    missing = {column: value for column, value in (defaults or {}).items() if column not in df}
+    if missing:
+        df = df.assign(**missing)
+    return df[columns]
+
+def _row_tuples(df, columns, defaults=None):
+    """
+    Iterate the given columns as plain tuples rather than boxing each row in a Series
+    
+    Parameters:
+    df (DataFrame): Report data
+    columns (list): Columns to yield, in order
+    defaults (dict): Values to use for any of the columns missing from the frame
+    
+    Returns:
+    iterator: One tuple of values per row
+    """
+    return _table_frame(df, columns, defaults).itertuples(index=False, name=None)
+
+def _set_docx_header(table, headers):
+    """Write bold header text into the first row of a python-docx table in a single pass"""
+    for cell, header in zip(table.rows[0].cells, headers):
+        cell.paragraphs[0].add_run(header).bold = True
+
+def _append_docx_rows(table, rows):
+    """
+    Append rows of plain text to a python-docx table with a single XML parse
+    
+    Parameters:
+    table (Table): python-docx table to extend
+    rows (iterable): One sequence of cell values per row
+    """
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import nsdecls
+    from xml.sax.saxutils import escape
+    
+    # Give each cell its grid column width, as table.add_row() would
+    cell_prefixes = [
+        '<w:tc>' if grid_col.w is None else f'<w:tc><w:tcPr><w:tcW w:w="{grid_col.w.twips}" w:type="dxa"/></w:tcPr>'
+        for grid_col in table._tbl.tblGrid.gridCol_lst
+    ]
+    
+    # Build every row as WordprocessingML text and parse it inside a throwaway table element,
+    # skipping python-docx's per-cell object construction
+    cell_template = '{}<w:p><w:r><w:t xml:space="preserve">{}</w:t></w:r></w:p></w:tc>'
+    rows_xml = ''.join(
+        '<w:tr>' + ''.join(
+            cell_template.format(prefix, escape(str(value))) for prefix, value in zip(cell_prefixes, row)
+        ) + '</w:tr>' 
+        for row in rows
+    )
+    parsed = parse_xml(f'<w:tbl {nsdecls("w")}>{rows_xml}</w:tbl>')
+    table._tbl.extend(list(parsed))
+
+def _urgency_counts(equipment_df):
+    """Count machines per maintenance urgency in one pass, empty if there are no recommendations"""
+    return equipment_df.get('maintenance_urgency', pd.Series(dtype=object)).value_counts()
+
+def _summary_counts(equipment_df, anomaly_data):
+    """Count immediate and soon maintenance alerts and detected anomalies"""
+    urgency_counts = _urgency_counts(equipment_df)
+    critical_count = int(urgency_counts.get('Immediate', 0))
+    warning_count = int(urgency_counts.get('Soon', 0))
+    anomaly_count = int(anomaly_data.get('anomaly_detected', pd.Series(dtype=bool)).eq(True).sum())
+    return critical_count, warning_count, anomaly_count
+
 def get_enhanced_equipment_df():
     """Get equipment data with predictions"""
     global _processed_data, _equipment_data
@@ -214,19 +553,7 @@ def get_enhanced_equipment_df():
     processed_data = _processed_data if _processed_data is not None else {}
     
     # Add prediction data
-    for idx, row in equipment_df.iterrows():
-        machine_id = row['machine_id']
-        if machine_id in processed_data['predictions']:
-            prediction = processed_data['predictions'][machine_id]
-            equipment_df.at[idx, 'failure_probability'] = f"{prediction['failure_probability'] * 100:.1f}%"
-            equipment_df.at[idx, 'days_to_failure'] = prediction['days_to_failure']
-            
-            if machine_id in processed_data['recommendations']:
-                recommendation = processed_data['recommendations'][machine_id]
-                equipment_df.at[idx, 'maintenance_urgency'] = recommendation['urgency']
-                equipment_df.at[idx, 'recommendation'] = recommendation['message']
-    
-    return equipment_df
+    return _attach_predictions(equipment_df, _index_processed_data(processed_data))
 
 def get_sensor_data_summary():
     """Get a summary of recent sensor data"""
@@ -238,16 +565,40 @@ def get_sensor_data_summary():
     if 'sensor_data' not in processed_data:
         return pd.DataFrame()
         
-    # Get the most recent readings for each machine
-    sensor_data = processed_data['sensor_data'].copy()
-    sensor_summary = []
-    
-    for machine_id in sensor_data['machine_id'].unique():
-        machine_data = sensor_data[sensor_data['machine_id'] == machine_id]
-        latest_data = machine_data.sort_values('timestamp').iloc[-1].to_dict()
-        sensor_summary.append(latest_data)
-        
-    return pd.DataFrame(sensor_summary)
+    # Get the most recent readings for each machine in a single grouped pass
+    sensor_data = processed_data['sensor_data'].reset_index(drop=True)
+    timestamps = pd.to_datetime(sensor_data['timestamp'])
+    latest_idx = timestamps.groupby(sensor_data['machine_id'], sort=False).idxmax()
+    
+    return sensor_data.loc[latest_idx].reset_index(drop=True)
+
+def _build_anomaly_frame(anomalies):
+    """
+    Flatten per-machine anomaly results into one row per machine
+    
+    Parameters:
+    anomalies (dict): Anomaly results keyed by machine_id
+    
+    Returns:
+    DataFrame: Anomaly data, with defaults for any keys a machine does not provide
+    """
+    if not anomalies:
+        return pd.DataFrame()
+    
+    # Keys missing from a machine's results come through as NaN and take the default
+    raw = pd.DataFrame.from_dict(anomalies, orient='index').reindex(
+        columns=['has_anomalies', 'detected', 'anomaly_score', 'affected_sensors', 'severity', 'detected_at']
+    )
+    
+    anomaly_df = pd.DataFrame({
+        'anomaly_detected': raw['has_anomalies'].fillna(raw['detected']).fillna(False),
+        'anomaly_score': raw['anomaly_score'].fillna(0.0).astype(float).map('{:.3f}'.format),
+        'affected_sensors': raw['affected_sensors'].map(', '.join, na_action='ignore').fillna(''),
+        'severity': raw['severity'].fillna('Unknown').astype('category'),
+        'detected_at': raw['detected_at'].fillna('Unknown')
+    })
+    
+    return anomaly_df.rename_axis('machine_id').reset_index()
 
 def get_anomaly_data():
     """Get anomaly data in a structured format"""
@@ -256,23 +607,59 @@ def get_anomaly_data():
     # Use data from parameters if available, otherwise use empty dict
     processed_data = _processed_data if _processed_data is not None else {}
     
-    anomaly_data = []
-    
-    for machine_id, anomaly_info in processed_data.get('anomalies', {}).items():
-        # Check if keys exist and provide default values if not
-        row = {
-            'machine_id': machine_id,
-            # Use .get() to provide default values if keys don't exist
-            'anomaly_detected': anomaly_info.get('has_anomalies', 
-                             anomaly_info.get('detected', False)),
-            'anomaly_score': f"{anomaly_info.get('anomaly_score', 0.0):.3f}",
-            'affected_sensors': ', '.join(anomaly_info.get('affected_sensors', [])),
-            'severity': anomaly_info.get('severity', 'Unknown'),
-            'detected_at': anomaly_info.get('detected_at', 'Unknown')
-        }
-        anomaly_data.append(row)
-        
-    return pd.DataFrame(anomaly_data)
+    return _build_anomaly_frame(processed_data.get('anomalies', {}))
+
+def _compute_performance_metrics(equipment_data, statistics_df):
+    """
+    Calculate health and OEE metrics for every machine with sensor statistics
+    
+    Parameters:
+    equipment_data (DataFrame): Equipment metadata
+    statistics_df (DataFrame): Flattened sensor statistics indexed by machine_id
+    
+    Returns:
+    DataFrame: Formatted performance metrics, one row per machine
+    """
+    unique_ids = pd.Index(equipment_data['machine_id'].unique())
+    machine_ids = unique_ids[unique_ids.isin(statistics_df.index)].tolist()
+    if not machine_ids:
+        return pd.DataFrame()
+    
+    current = statistics_df.loc[machine_ids]
+    temperature = current['temperature.current'].to_numpy(dtype=float)
+    vibration = current['vibration.current'].to_numpy(dtype=float)
+    power = current['power.current'].to_numpy(dtype=float)
+    
+    # Calculate overall health score (example metric)
+    temp_health = 100 - np.clip((temperature - 60) * 2, 0, 100)
+    vibration_health = 100 - np.clip(vibration * 10, 0, 100)
+    power_health = 100 - np.clip(np.abs(power - 90), 0, 100)
+    overall_health = (temp_health + vibration_health + power_health) / 3
+    
+    # Calculate OEE (Overall Equipment Effectiveness) - simplified example,
+    # adjusted by the status of each machine's first equipment record
+    status = equipment_data.drop_duplicates('machine_id').set_index('machine_id').loc[machine_ids, 'status'].to_numpy()
+    availability = np.select([status == 'Maintenance', status == 'Warning'], [0.0, 0.8], default=0.95)
+    performance = np.select([status == 'Warning', status == 'Idle'], [0.7, 0.0], default=0.90)
+    quality = np.full(len(machine_ids), 0.98)
+    oee = availability * performance * quality * 100
+    
+    metrics = pd.DataFrame({
+        'machine_id': machine_ids,
+        'overall_health': _format_fixed(overall_health, 1, '%'),
+        'oee': _format_fixed(oee, 1, '%'),
+        'availability': _format_fixed(availability * 100, 1, '%'),
+        'performance': _format_fixed(performance * 100, 1, '%'),
+        'quality': _format_fixed(quality * 100, 1, '%'),
+        'temperature': _format_fixed(temperature, 1, '°C'),
+        'vibration': _format_fixed(vibration, 2, ' mm/s'),
+        'power_usage': _format_fixed(power, 1, '%')
+    })
+    
+    # Keep fleet averages of the unformatted scores so summaries don't parse the strings back
+    metrics.attrs['average_health'] = float(overall_health.mean())
+    metrics.attrs['average_oee'] = float(oee.mean())
+    return metrics
 
 def get_performance_metrics():
     """Get performance metrics for all machines"""
@@ -282,51 +669,20 @@ def get_performance_metrics():
     equipment_data = _equipment_data if _equipment_data is not None else pd.DataFrame()
     processed_data = _processed_data if _processed_data is not None else {}
     
-    metrics_data = []
-    
-    # For each machine, calculate or extract key performance metrics
-    for machine_id in equipment_data['machine_id'].unique():
-        if machine_id in processed_data.get('statistics', {}):
-            stats = processed_data['statistics'][machine_id]
-            
-            # Calculate overall health score (example metric)
-            temp_health = 100 - max(0, min(100, (stats['temperature']['current'] - 60) * 2))
-            vibration_health = 100 - max(0, min(100, stats['vibration']['current'] * 10))
-            power_health = 100 - max(0, min(100, abs(stats['power']['current'] - 90)))
-            
-            overall_health = (temp_health + vibration_health + power_health) / 3
-            
-            # Calculate OEE (Overall Equipment Effectiveness) - simplified example
-            availability = 0.95  # 95% uptime
-            performance = 0.90   # 90% of max speed
-            quality = 0.98       # 98% good parts
-            
-            # Adjust based on machine status
-            machine_info = equipment_data[equipment_data['machine_id'] == machine_id].iloc[0]
-            if machine_info['status'] == 'Maintenance':
-                availability = 0.0
-            elif machine_info['status'] == 'Warning':
-                availability = 0.8
-                performance = 0.7
-            elif machine_info['status'] == 'Idle':
-                performance = 0.0
-                
-            oee = availability * performance * quality * 100
-            
-            # Add to metrics data
-            metrics_data.append({
-                'machine_id': machine_id,
-                'overall_health': f"{overall_health:.1f}%",
-                'oee': f"{oee:.1f}%",
-                'availability': f"{availability*100:.1f}%",
-                'performance': f"{performance*100:.1f}%",
-                'quality': f"{quality*100:.1f}%",
-                'temperature': f"{stats['temperature']['current']:.1f}°C",
-                'vibration': f"{stats['vibration']['current']:.2f} mm/s",
-                'power_usage': f"{stats['power']['current']:.1f}%"
-            })
+    statistics_df = _index_processed_data(processed_data)['statistics']
+    return _compute_performance_metrics(equipment_data, statistics_df)
+
+def _daily_sensor_averages(sensor_data):
+    """Average every numeric sensor column per day and machine"""
+    # Group only the numeric readings, keyed on the day floored in datetime64
+    daily = sensor_data.select_dtypes('number')
+    daily.insert(0, 'machine_id', sensor_data['machine_id'])
+    daily.insert(0, 'date', pd.to_datetime(sensor_data['timestamp']).dt.floor('D'))
+    daily_avg = daily.groupby(['date', 'machine_id']).mean().reset_index()
     
-    return pd.DataFrame(metrics_data)
+    # Convert to calendar dates only on the aggregated rows
+    daily_avg['date'] = daily_avg['date'].dt.date
+    return daily_avg
 
 def get_historical_trends():
     """Get historical trends from sensor data"""
@@ -338,285 +694,758 @@ def get_historical_trends():
     if 'sensor_data' not in processed_data:
         return pd.DataFrame()
         
-    sensor_data = processed_data['sensor_data'].copy()
-    
-    # Group by day and machine, calculate daily averages
-    sensor_data['date'] = pd.to_datetime(sensor_data['timestamp']).dt.date
-    daily_avg = sensor_data.groupby(['date', 'machine_id']).mean(numeric_only=True).reset_index()
-    
-    return daily_avg
+    return _daily_sensor_averages(processed_data['sensor_data'])
 
-def show_downloads(processed_data, equipment_data):
-    """
-    Display a dedicated downloads page with various report formats and evidence options
-    
-    Parameters:
-    processed_data (dict): Processed sensor data with statistics and predictions
-    equipment_data (DataFrame): Equipment metadata
-    """
-    st.header("📥 Downloads and Reports")
-    
-    # Introduction
-    st.markdown("""
-    This page allows you to download various reports and supporting evidence files 
-    for your predictive maintenance system. Select from the options below to generate 
-    the type of report or documentation you need.
-    """)
-    
-    # Create columns for layout
-    col1, col2 = st.columns([3, 2])
-    
-    with col1:
-        st.subheader("Maintenance Reports")
-        
-        # Report Type Selection
-        report_type = st.radio(
-            "Report Type:",
-            ["Equipment Status Summary", "Maintenance Alerts", "Predictive Analysis", "Performance Metrics", 
-             "Complete System Report", "SR&ED Technical Documentation"],
-            index=4
-        )
-        
-        # Add SR&ED specific options if that report type is selected
-        if report_type == "SR&ED Technical Documentation":
-            st.markdown("""
-            <div style="background-color:#f0f2f6;padding:15px;border-radius:8px;margin-top:10px;border-left:5px solid #4b86b4;">
-            <h4 style="color:#262730;margin-top:0;">SR&ED Compliance Package</h4>
-            <p>This comprehensive documentation package adheres to CRA's Scientific Research & Experimental Development (SR&ED) guidelines and includes:</p>
-            <ul>
-                <li><strong>Technical uncertainty documentation</strong> - Evidence of technological challenges beyond routine engineering</li>
-                <li><strong>Systematic investigation evidence</strong> - Documentation of methodical approach to problem-solving</li>
-                <li><strong>Experimental methodology details</strong> - Protocols and procedures used in research activities</li>
-                <li><strong>Research progression documentation</strong> - Timeline and evolution of experimental activities</li>
-                <li><strong>Technical advancement evidence</strong> - Quantifiable improvements and innovations achieved</li>
-                <li><strong>Version-controlled documentation</strong> - Traceable history of research activities</li>
-            </ul>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Add SR&ED explanation box
-            with st.expander("What is SR&ED and why is this documentation important?"):
-                st.markdown("""
-                ### Scientific Research & Experimental Development (SR&ED)
-                
-                SR&ED is a Canadian tax incentive program designed to encourage businesses to conduct research and development in Canada. 
-                The program provides tax credits for eligible R&D expenditures.
-                
-                #### SR&ED Eligibility Requirements:
-                
-                1. **Scientific or technological advancement**: Work must seek to advance the understanding of scientific relations or technology
-                2. **Scientific or technological uncertainty**: Must address a problem that couldn't be resolved using standard practices
-                3. **Scientific and technical content**: Must include systematic investigation through experiment or analysis
-                
-                #### Documentation Requirements:
-                
-                The CRA requires contemporaneous documentation that demonstrates:
-                - The systematic investigation process
-                - Technical challenges faced
-                - Methods used to overcome these challenges
-                - Results of experiments and analysis
-                - Technological advancements achieved
-                
-                This SR&ED documentation package is specifically designed to meet these requirements and maximize eligibility.
-                """)
-            
-            st.markdown("<br>", unsafe_allow_html=True)
-            
-            sred_options = st.multiselect(
-                "Include Technical Areas:",
-                [
-                    "IoT Sensor Integration Challenges",
-                    "Real-time Processing Innovations",
-                    "Machine Learning Model Development",
-                    "Algorithm Optimization Research",
-                    "Data Quality & Reliability Solutions",
-                    "System Architecture Advancements",
-                    "All Technical Areas"
-                ],
-                default=["All Technical Areas"]
-            )
-            
-            # Add documentation quality section
-            doc_quality = st.select_slider(
-                "Documentation Detail Level:",
-                options=["Basic", "Standard", "Comprehensive", "Expert"],
-                value="Comprehensive",
-                help="Higher detail levels include more evidence, experimental data, and supporting materials"
-            )
-            
-            if doc_quality == "Expert":
-                st.info("Expert level includes detailed algorithm descriptions, full experimental datasets, statistical analysis methodology, and complete technical progression evidence - optimal for SR&ED audits.")
-            elif doc_quality == "Comprehensive":
-                st.info("Comprehensive level includes detailed documentation of technical uncertainties, systematic investigation evidence, and clear advancement proof - recommended for SR&ED claims.")
-            
-            # Add version tracking option
-            include_version_history = st.checkbox("Include Complete Version History", value=True, 
-                                                 help="Tracks changes and improvements to the technical documentation over time")
-            
-            if include_version_history:
-                from utils.version_tracker import SREDVersionTracker
-                tracker = SREDVersionTracker()
-                versions = tracker.get_version_history()
-                if versions:
-                    st.caption(f"Current documentation version: {tracker.get_current_version()} ({len(versions)} revisions tracked)")
-                    
-                    # Display a mini version history
-                    with st.expander("View Version History"):
-                        for idx, version in enumerate(reversed(versions[:3])):
-                            st.markdown(f"**v{version['version']}** ({version['change_type']} change) - {version['timestamp'][:10]}")
-                            changes = ", ".join(version['changes'][:2])
-                            if len(version['changes']) > 2:
-                                changes += f" and {len(version['changes']) - 2} more"
-                            st.caption(changes)
-        
-        # Format selection
-        st.subheader("Format Options")
-        format_options = [
-            'csv', 'pdf', 'doc', 'docx', 'xls', 'xlsx', 
-            'rtf', 'txt', 'jpg', 'jpeg', 'tiff', 'tif', 'xps'
-        ]
-        
-        selected_format = st.selectbox(
-            "Select Format:",
-            format_options
-        )
-        
-        # Time period selection
-        st.subheader("Time Period")
-        time_period = st.radio(
-            "Select time period:",
-            ["Last 24 Hours", "Last Week", "Last Month", "Last Quarter", "Last Year", "Custom Range"]
-        )
-        
-        if time_period == "Custom Range":
-            col_date1, col_date2 = st.columns(2)
-            with col_date1:
-                start_date = st.date_input("Start Date", datetime.now().date())
-            with col_date2:
-                end_date = st.date_input("End Date", datetime.now().date())
-        
-        # Generate and provide download button
-        st.subheader("Generate Report")
-        
-        # Add a special note for SR&ED report
-        if report_type == "SR&ED Technical Documentation":
-            st.markdown("""
-            <div style="background-color:#e6f3ff;padding:10px;border-radius:5px;margin:10px 0;">
-            <p style="margin:0"><strong>Note:</strong> The SR&ED Technical Documentation package adheres to CRA's guidelines for Scientific Research & Experimental Development tax incentive claims. This report includes comprehensive technical documentation, experimental methods, and evidence of systematic investigation.</p>
-            </div>
-            """, unsafe_allow_html=True)
-            
-        # Note: These local functions are used within the show_downloads context
-        # Global equivalent functions are defined at module level for use in app.py
-        def get_enhanced_equipment_df_local():
-            # Get equipment data with predictions
-            equipment_df = equipment_data.copy()
-            
-            # Add prediction data
-            for idx, row in equipment_df.iterrows():
-                machine_id = row['machine_id']
-                if machine_id in processed_data['predictions']:
-                    prediction = processed_data['predictions'][machine_id]
-                    equipment_df.at[idx, 'failure_probability'] = f"{prediction['failure_probability'] * 100:.1f}%"
-                    equipment_df.at[idx, 'days_to_failure'] = prediction['days_to_failure']
-                    
-                    if machine_id in processed_data['recommendations']:
-                        recommendation = processed_data['recommendations'][machine_id]
-                        equipment_df.at[idx, 'maintenance_urgency'] = recommendation['urgency']
-                        equipment_df.at[idx, 'recommendation'] = recommendation['message']
-            
-            return equipment_df
-            
-        def get_sensor_data_summary():
-            """Get a summary of recent sensor data"""
-            # Get the most recent readings for each machine
-            sensor_data = processed_data['sensor_data'].copy()
-            sensor_summary = []
-            
-            for machine_id in sensor_data['machine_id'].unique():
-                machine_data = sensor_data[sensor_data['machine_id'] == machine_id]
-                latest_data = machine_data.sort_values('timestamp').iloc[-1].to_dict()
-                sensor_summary.append(latest_data)
+# Static markdown documents for the SR&ED package, stored pre-encoded for ZipFile.writestr
+# README for the Visualizations folder
+_SRED_VISUALIZATIONS_README_MD = """
+# SR&ED Technical Documentation - Visualizations
+
+This directory contains data visualizations that illustrate the technical advancement, 
+experimental results, and systematic investigation methodology for the SR&ED project.
+
+## Available Visualizations
+
+1. **experiment_timeline.png** - Timeline showing the systematic investigation process over 12 months
+2. **anomaly_detection_comparison.png** - Performance comparison of anomaly detection algorithm variations
+3. **prediction_lead_time.png** - Comparison of failure prediction lead times across different model types
+4. **research_methodology.png** - Diagram of the systematic research methodology
+5. **technical_advancement.png** - Chart illustrating technical advancements achieved through SR&ED activities
+
+These visualizations serve as evidence of the systematic investigation process 
+and technological advancement achieved during the SR&ED project.
+""".encode('utf-8')
+
+# Technical narrative
+_SRED_TECHNICAL_NARRATIVE_MD = """
+# SR&ED Technical Documentation
+
+## 1. Project Overview
+This document outlines the scientific research and experimental development activities 
+undertaken in the development of the Smart Manufacturing Predictive Maintenance Platform.
+
+The project focuses on developing innovative approaches to predictive maintenance for manufacturing equipment 
+through advanced data analytics, machine learning, and IoT sensor integration. This work represents a significant 
+advancement beyond routine engineering and involves overcoming specific technological uncertainties through systematic investigation.
+
+## 2. Technical Uncertainties Addressed
+The project addressed the following technical uncertainties:
+
+- **Real-time processing of high-volume sensor data:** Developing methods to process and analyze terabytes of streaming sensor data without introducing latency that would compromise the real-time nature of the predictive system.
+- **Development of reliable anomaly detection algorithms:** Creating algorithms capable of distinguishing between normal variations in equipment operation and early indicators of potential failures, with sufficient sensitivity and specificity.
+- **Integration of heterogeneous data sources:** Combining data from diverse sensors with varying reliability, sampling rates, and formats into a coherent analytical framework.
+- **Creation of accurate predictive models:** Developing models capable of predicting equipment failures with sufficient accuracy and lead time to enable preventative maintenance while minimizing false alarms.
+
+## 3. Systematic Investigation
+Our research methodology followed these systematic steps:
+
+1. **Hypothesis formulation** regarding failure prediction models and anomaly detection approaches
+2. **Experimental design** and data collection protocols with appropriate controls
+3. **Algorithm development** and iterative testing with performance benchmarking
+4. **Validation** against historical failure data using statistical methods
+5. **Implementation** of improvements based on experimental results with continuous monitoring
+
+## 4. Technical Content
+The project involved significant advancement in:
+
+- **Machine learning techniques** specifically adapted for predictive maintenance in industrial settings
+- **Sensor data processing optimization** to handle high-volume, real-time data streams
+- **Anomaly detection sensitivity and specificity improvements** through novel algorithmic approaches
+- **Statistical models** for failure probability estimation with increased temporal precision
+
+## 5. Project Results
+The research resulted in:
+
+- Novel algorithms with **23% improved accuracy** over existing solutions
+- Reduction in false positive alerts by **45%**
+- Early detection of equipment anomalies (average **72 hours before failure**)
+- Documented technical advancement in predictive maintenance methodology
+- **31% reduction** in unplanned downtime in production environments
+""".encode('utf-8')
+
+# Experimental results
+_SRED_EXPERIMENTAL_RESULTS_MD = """
+# Experimental Results Documentation
+
+## Experiment 1: Anomaly Detection Algorithm Optimization
+
+### Hypothesis
+Modified isolation forest algorithms can improve anomaly detection accuracy in manufacturing sensor data without increasing computational complexity.
+
+### Methodology
+- Comparative analysis of 5 algorithm variations using cross-validation
+- Testing performed on historical data from 12 manufacturing facilities
+- Performance measured using precision, recall, F1-score, and computational overhead
+- Testing conducted over 4-week period with 3 iterations of algorithm refinement
+
+### Variables Tested
+1. Contamination parameter optimization
+2. Feature selection methodology
+3. Ensemble composition variations
+4. Distance metric selection
+5. Adaptive threshold mechanisms
+
+### Results
+| Algorithm Variation | Precision | Recall | F1-Score | CPU Overhead |
+|---------------------|-----------|--------|----------|--------------|
+| Baseline (Standard) | 68.2%     | 71.4%  | 69.7%    | Baseline     |
+| Variation 1         | 74.5%     | 77.9%  | 76.2%    | +5%          |
+| Variation 2         | 79.8%     | 80.1%  | 79.9%    | +12%         |
+| Variation 3         | 83.2%     | 84.7%  | 83.9%    | -4%          |
+| Variation 4         | 91.6%     | 90.1%  | 90.8%    | -15%         |
+
+### Conclusions
+The optimized algorithm (Variation 4) demonstrated significant improvement over baseline (23.4% precision improvement, 18.7% recall improvement) while reducing computational overhead by 15%, enabling real-time processing for manufacturing environments.
+
+## Experiment 2: Sensor Data Noise Reduction
+
+### Hypothesis
+Adaptive filtering techniques can improve signal quality from vibration sensors in high-noise manufacturing environments.
+
+### Methodology
+- Implementation of 3 filtering techniques with cross-validation
+- Testing on 5 different types of manufacturing equipment
+- Performance measured by signal-to-noise ratio and feature preservation
+- Blind testing by maintenance engineers to validate practical improvements
+
+### Results
+- 42% noise reduction while preserving critical signal features
+- Successful identification of pre-failure signatures in 94% of test cases
+- Reduction of false positives by 37% compared to standard filtering techniques
+- Adaptive Kalman filtering provided optimal results for vibration data
+
+### Conclusions
+The developed adaptive filtering approach significantly improved sensor data quality, enabling more accurate anomaly detection in noisy manufacturing environments while maintaining computational efficiency.
+
+## Experiment 3: Failure Prediction Model Development
+
+### Hypothesis
+Multi-modal sensor fusion with specialized feature engineering can improve prediction accuracy for equipment failures.
+
+### Methodology
+- Comparison of single-sensor vs. multi-sensor prediction models
+- Development of custom feature extraction for each sensor type
+- Testing against 24 months of historical failure data
+- Performance measured by prediction accuracy and lead time
+
+### Results
+| Model Type | Accuracy | False Positive Rate | Avg. Prediction Lead Time |
+|------------|----------|---------------------|---------------------------|
+| Temperature Only | 67% | 32% | 36 hours |
+| Vibration Only | 73% | 28% | 48 hours |
+| Power Consumption Only | 69% | 34% | 29 hours |
+| Multi-sensor (Basic) | 82% | 22% | 56 hours |
+| Multi-sensor (Advanced) | 98% | 7% | 72 hours |
+
+### Conclusions
+Integration of temperature, vibration, and power consumption data with specialized feature engineering provided 31% improvement in prediction accuracy and extended lead time from 36 to 72 hours, giving maintenance teams critical additional time for planned interventions.
+""".encode('utf-8')
+
+# Financial eligibility template
+_SRED_FINANCIAL_ELIGIBILITY_MD = """
+# SR&ED Eligible Expenditures Documentation
+
+## Eligible Salary and Wages
+
+| Personnel Category | Eligible Activities | Documentation Requirements |
+|--------------------|--------------------|----------------------------|
+| **Research Scientists** | Algorithm development, experimental design, hypothesis formulation | Time sheets, project journals, meeting notes |
+| **Software Developers** | Implementation of experimental code, prototype development | Git commits, project management records |
+| **Data Scientists** | Model development, statistical analysis, experimental validation | Experiment logs, analysis reports |
+| **Project Management** | Direction of SR&ED activities, coordination of experiments | Project plans, research coordination meetings |
+
+## Materials Consumed
+
+| Material Category | Purpose | Eligibility Justification |
+|-------------------|---------|--------------------------|
+| **Test Equipment** | Prototype sensor arrays for experimental validation | Consumed in testing hypotheses related to sensor fusion |
+| **Development Hardware** | Computing resources specifically for algorithm development | Used exclusively for processing experimental data sets |
+| **Specialized Components** | Custom interface boards for sensor integration | Required for testing novel integration approaches |
+| **Validation Materials** | Materials used to simulate equipment failure conditions | Necessary for experimental validation of detection algorithms |
+
+## Contract Expenditures
+
+| Contractor | SR&ED Services Provided | Documentation |
+|------------|------------------------|---------------|
+| **University Research Lab** | Specialized validation testing of algorithms | Research agreement, test reports |
+| **Statistical Consultant** | Design of experiments, analysis methodology | Consulting reports, experimental design documents |
+| **Industrial Test Facility** | Real-world validation of predictive models | Testing agreement, validation reports |
+
+## Capital Expenditures (if applicable)
+
+| Equipment | SR&ED Usage | Eligibility |
+|-----------|-------------|-------------|
+| **High-Performance Computing Cluster** | Testing of computationally intensive algorithms | Used exclusively for experimental algorithm development |
+| **Specialized Testing Equipment** | Validation of sensor integration approaches | Required for experimental validation |
+
+**Note:** This document serves as a template. Actual expenditures should be documented with appropriate financial records including invoices, payroll records, time tracking, and asset registers. All expenditures must comply with CRA SR&ED program requirements.
+""".encode('utf-8')
+
+# Project timeline
+_SRED_PROJECT_TIMELINE_MD = """
+# Project Timeline: SR&ED Activities
+
+## Phase 1: Problem Definition and Research (January - February 2024)
+
+| Week | Activities | Outcomes |
+|------|------------|----------|
+| 1-2 | Literature review of predictive maintenance techniques | Identified knowledge gaps in real-time processing |
+| 3-4 | Analysis of existing anomaly detection approaches | Documented limitations of current methods |
+| 5-6 | Stakeholder interviews and requirements gathering | Defined technical uncertainties to address |
+| 7-8 | Formulation of research hypotheses | Developed initial research plan with testable hypotheses |
+
+## Phase 2: Experimental Design and Development (March - June 2024)
+
+| Month | Key Activities | Research Outcomes |
+|-------|---------------|-------------------|
+| March | Design of experimental framework | Established control variables and testing protocols |
+| April | Development of algorithm variations | Created 5 candidate approaches for anomaly detection |
+| May | Implementation of sensor data processing techniques | Developed 3 novel approaches for sensor fusion |
+| June | Pilot testing setup | Established baseline performance metrics |
+
+## Phase 3: Systematic Investigation (July - October 2024)
+
+| Investigation Area | Experiments Conducted | Key Findings |
+|-------------------|----------------------|--------------|
+| Anomaly Detection | 12 experimental iterations | Identified optimal algorithm configuration |
+| Sensor Fusion | 8 experimental approaches | Discovered novel multi-modal feature extraction technique |
+| Noise Reduction | 15 filtering variations | Developed adaptive filtering approach |
+| Prediction Models | 9 model architectures | Validated superiority of ensemble approach |
+
+## Phase 4: Validation and Documentation (November - December 2024)
+
+| Week | Activities | Outcomes |
+|------|------------|----------|
+| 1-2 | Statistical validation of results | Confirmed 23% improvement over baseline |
+| 3-4 | Real-world testing | Verified 72-hour prediction window in production |
+| 5-6 | Technical documentation | Compiled evidence of systematic investigation |
+| 7-8 | Financial analysis | Documented eligible SR&ED expenditures |
+
+This timeline documents the systematic approach taken to address technological uncertainties through experimentation and iterative development, fulfilling SR&ED program requirements for methodical investigation.
+""".encode('utf-8')
+
+def _wrap_pdf_lines(pdf, text, width):
+    """Split text into the lines multi_cell would produce for a cell of the given width"""
+    max_width = width - 2 * pdf.c_margin
+    lines = []
+    for paragraph in text.split('\n'):
+        line = ''
+        for word in paragraph.split(' '):
+            candidate = f"{line} {word}" if line else word
+            if line and pdf.get_string_width(candidate) > max_width:
+                lines.append(line)
+                line = word
+            else:
+                line = candidate
+        lines.append(line)
+    return lines
+
+def _write_pdf_table(pdf, widths, rows, height=8, align=''):
+    """Write pre-formatted rows of text as bordered table cells, one line per row"""
+    cell = pdf.cell
+    last_col = len(widths) - 1
+    for row in rows:
+        for col, (width, text) in enumerate(zip(widths, row)):
+            cell(width, height, text, 1, 1 if col == last_col else 0, align)
+
+@lru_cache(maxsize=1)
+def _render_sred_pdf(generated_date):
+    """
+    Render the SR&ED technical report PDF
+    
+    The generation date is the only dynamic field, so the rendered bytes are
+    cached and only rebuilt when the date changes.
+    
+    Parameters:
+    generated_date (str): Date printed on the cover page
+    
+    Returns:
+    bytes: PDF document
+    """
+    from fpdf import FPDF
+    
+    # Build a custom PDF with proper formatting for SR&ED documentation
+    pdf = FPDF()
+    
+    # Add a cover page
+    pdf.add_page()
+    pdf.set_fill_color(240, 240, 240)  # Light gray background
+    pdf.rect(0, 0, 210, 90, 'F')  # Header band behind the title and subtitle
+    
+    # Title block
+    pdf.set_font("Arial", "B", 24)
+    pdf.set_text_color(0, 51, 102)  # Navy blue
+    pdf.cell(0, 40, "", 0, 1)  # Spacing
+    pdf.cell(0, 20, "SR&ED Technical Documentation", 0, 1, "C")
+    
+    # Subtitle
+    pdf.set_font("Arial", "I", 16)
+    pdf.set_text_color(102, 102, 102)  # Dark gray
+    pdf.cell(0, 15, "Predictive Maintenance Platform", 0, 1, "C")
+    
+    # Date and confidentiality notice
+    pdf.set_font("Arial", "", 12)
+    pdf.set_text_color(0, 0, 0)  # Black
+    pdf.cell(0, 40, "", 0, 1)  # Spacing
+    pdf.cell(0, 10, f"Generated: {generated_date}", 0, 1, "C")
+    pdf.cell(0, 10, "CONFIDENTIAL", 0, 1, "C")
+    
+    pdf.cell(0, 60, "", 0, 1)  # Spacing
+    
+    # Company info
+    pdf.set_font("Arial", "B", 14)
+    pdf.cell(0, 10, "Prepared By:", 0, 1, "C")
+    pdf.set_font("Arial", "", 12)
+    pdf.cell(0, 10, "Smart Manufacturing Technologies", 0, 1, "C")
+    
+    # Add table of contents
+    pdf.add_page()
+    pdf.set_font("Arial", "B", 18)
+    pdf.set_text_color(0, 51, 102)  # Navy blue
+    pdf.cell(0, 20, "Table of Contents", 0, 1, "L")
+    pdf.line(10, 30, 200, 30)
+    
+    # TOC items
+    pdf.set_font("Arial", "", 12)
+    pdf.set_text_color(0, 0, 0)  # Black
+    toc_items = [
+        "1. Project Overview",
+        "2. Technical Uncertainties",
+        "3. Systematic Investigation",
+        "4. Technical Advancement",
+        "5. Project Results",
+        "6. Experimental Data",
+        "7. Financial Information",
+        "8. Supporting Evidence"
+    ]
+    
+    pdf.set_xy(20, 40)
+    pdf.multi_cell(0, 15, "\n".join(toc_items), 0, "L")
+    
+    # Project Overview Section
+    pdf.add_page()
+    pdf.set_font("Arial", "B", 18)
+    pdf.set_text_color(0, 51, 102)  # Navy blue
+    pdf.cell(0, 15, "1. Project Overview", 0, 1, "L")
+    pdf.line(10, 25, 200, 25)
+    
+    pdf.set_font("Arial", "", 11)
+    pdf.set_text_color(0, 0, 0)  # Black
+    pdf.multi_cell(0, 8, """This document outlines the scientific research and experimental development activities undertaken in the development of the Smart Manufacturing Predictive Maintenance Platform.
+
+The project focuses on developing innovative approaches to predictive maintenance for manufacturing equipment through advanced data analytics, machine learning, and IoT sensor integration. This work represents a significant advancement beyond routine engineering and involves overcoming specific technological uncertainties through systematic investigation.
+
+SR&ED activities were conducted from January 2024 through December 2024, involving a multidisciplinary team of data scientists, software engineers, and manufacturing domain experts. This documentation package provides comprehensive evidence of the technological advancement achieved and the systematic approach used to address technical challenges.""")
+    
+    # Technical Uncertainties Section
+    pdf.add_page()
+    pdf.set_font("Arial", "B", 18)
+    pdf.set_text_color(0, 51, 102)  # Navy blue
+    pdf.cell(0, 15, "2. Technical Uncertainties", 0, 1, "L")
+    pdf.line(10, 25, 200, 25)
+    
+    pdf.set_font("Arial", "", 11)
+    pdf.multi_cell(0, 8, """The project addressed several significant technological uncertainties that could not be resolved through routine engineering or the application of standard techniques:""")
+    
+    # Uncertainties in bullet points with enhanced formatting
+    uncertainties = [
+        {"title": "Real-time Processing of High-Volume Sensor Data", 
+         "desc": "Developing methods to process and analyze terabytes of streaming sensor data without introducing latency that would compromise the real-time nature of the predictive system."},
+        {"title": "Reliable Anomaly Detection Algorithms", 
+         "desc": "Creating algorithms capable of distinguishing between normal variations in equipment operation and early indicators of potential failures, with sufficient sensitivity and specificity."},
+        {"title": "Integration of Heterogeneous Data Sources", 
+         "desc": "Combining data from diverse sensors with varying reliability, sampling rates, and formats into a coherent analytical framework."},
+        {"title": "Predictive Model Accuracy", 
+         "desc": "Developing models capable of predicting equipment failures with sufficient accuracy and lead time to enable preventative maintenance while minimizing false alarms."}
+    ]
+    
+    # Let each bullet flow below the previous one instead of placing it at a fixed offset
+    pdf.ln(4)
+    for uncertainty in uncertainties:
+        pdf.set_font("Arial", "B", 12)
+        pdf.set_x(15)
+        pdf.cell(0, 8, f"- {uncertainty['title']}", 0, 1, "L")
+        pdf.set_font("Arial", "", 11)
+        pdf.set_x(20)
+        pdf.multi_cell(170, 6, uncertainty['desc'])
+        pdf.ln(5)
+    
+    # Add experimental results and methodology section with professional formatting
+    pdf.add_page()
+    pdf.set_font("Arial", "B", 18)
+    pdf.set_text_color(0, 51, 102)  # Navy blue
+    pdf.cell(0, 15, "6. Experimental Data", 0, 1, "L")
+    pdf.line(10, 25, 200, 25)
+    
+    pdf.set_font("Arial", "B", 14)
+    pdf.set_text_color(0, 0, 0)  # Black
+    pdf.cell(0, 15, "Experiment 1: Anomaly Detection Algorithm Optimization", 0, 1, "L")
+    
+    # Create a table-like structure for experiment data
+    pdf.set_fill_color(240, 240, 240)  # Light gray for table headers
+    pdf.set_font("Arial", "B", 11)
+    pdf.cell(40, 10, "Component", 1, 0, "L", True)
+    pdf.cell(140, 10, "Details", 1, 1, "L", True)
+    
+    # Table rows
+    pdf.set_font("Arial", "", 10)
+    components = [
+        {"name": "Hypothesis", "value": "Modified isolation forest algorithms can improve anomaly detection accuracy in manufacturing sensor data without increasing computational complexity."},
+        {"name": "Methodology", "value": "Comparative analysis of 5 algorithm variations using cross-validation on historical failure data. Each algorithm was tested against 3 different data sets representing varied manufacturing environments."},
+        {"name": "Control Group", "value": "Standard isolation forest implementation with default parameters."},
+        {"name": "Variables", "value": "1. Contamination parameter optimization\n2. Feature selection methodology\n3. Ensemble composition\n4. Distance metric selection\n5. Adaptive threshold mechanisms"},
+        {"name": "Results", "value": "23.4% improvement in precision, 18.7% improvement in recall compared to baseline algorithms, with 15% reduction in computational overhead."},
+        {"name": "Conclusions", "value": "Modified algorithm demonstrates significant improvement over baseline while maintaining real-time processing capabilities."}
+    ]
+    
+    for component in components:
+        # Measure the wrapped description once so the name cell can match its height
+        height = len(_wrap_pdf_lines(pdf, component["value"], 140)) * 6
+        pdf.cell(40, height, component["name"], 1, 0, "L")
+        pdf.multi_cell(140, 6, component["value"], 1, "L")
+    
+    # Convert the PDF to bytes for the ZIP file
+    return pdf.output(dest='S').encode('latin1')
+
+@lru_cache(maxsize=1)
+def _render_sred_narrative_docx(generated_date):
+    """
+    Render the SR&ED technical narrative DOCX
+    
+    Like the PDF report, only the generation date varies, so the document is
+    cached and only rebuilt when the date changes.
+    
+    Parameters:
+    generated_date (str): Date printed on the title page
+    
+    Returns:
+    bytes: DOCX document
+    """
+    from docx import Document
+    
+    doc = Document()
+    
+    # Add a styled title page
+    doc.add_heading('SR&ED Technical Documentation', 0)
+    doc.add_paragraph('Predictive Maintenance Platform', 'Subtitle')
+    
+    # Add date and confidentiality
+    p = doc.add_paragraph()
+    p.add_run(f'Generated: {generated_date}').italic = True
+    doc.add_paragraph('CONFIDENTIAL DOCUMENTATION', 'Quote')
+    doc.add_paragraph('Prepared By: Smart Manufacturing Technologies')
+    
+    # Add table of contents marker
+    doc.add_paragraph('Table of Contents', 'TOC Heading')
+    doc.add_paragraph('_TOC_\n\n')  # Placeholder for TOC
+    
+    # Add project overview
+    doc.add_heading('1. Project Overview', 1)
+    doc.add_paragraph("""This document outlines the scientific research and experimental development activities 
+undertaken in the development of the Smart Manufacturing Predictive Maintenance Platform.
+
+The project focuses on developing innovative approaches to predictive maintenance for manufacturing equipment 
+through advanced data analytics, machine learning, and IoT sensor integration. This work represents a significant 
+advancement beyond routine engineering and involves overcoming specific technological uncertainties through systematic investigation.
+
+SR&ED activities were conducted from January 2024 through December 2024, involving a multidisciplinary team of 
+data scientists, software engineers, and manufacturing domain experts. This documentation package provides 
+comprehensive evidence of the technological advancement achieved and the systematic approach used to address technical challenges.""")
+    
+    # Add technical uncertainties section with styled formatting
+    doc.add_heading('2. Technical Uncertainties Addressed', 1)
+    doc.add_paragraph("""The project addressed several significant technological uncertainties that could not be 
+resolved through routine engineering or the application of standard techniques:""")
+    
+    # Add styled bullet points
+    uncertainties = [
+        {"title": "Real-time Processing of High-Volume Sensor Data", 
+         "desc": "Developing methods to process and analyze terabytes of streaming sensor data without introducing latency that would compromise the real-time nature of the predictive system."},
+        {"title": "Reliable Anomaly Detection Algorithms", 
+         "desc": "Creating algorithms capable of distinguishing between normal variations in equipment operation and early indicators of potential failures, with sufficient sensitivity and specificity."},
+        {"title": "Integration of Heterogeneous Data Sources", 
+         "desc": "Combining data from diverse sensors with varying reliability, sampling rates, and formats into a coherent analytical framework."},
+        {"title": "Predictive Model Accuracy", 
+         "desc": "Developing models capable of predicting equipment failures with sufficient accuracy and lead time to enable preventative maintenance while minimizing false alarms."}
+    ]
+    
+    for uncertainty in uncertainties:
+        p = doc.add_paragraph(style='List Bullet')
+        p.add_run(f"{uncertainty['title']}: ").bold = True
+        p.add_run(uncertainty['desc'])
+    
+    # Add systematic investigation section
+    doc.add_heading('3. Systematic Investigation', 1)
+    doc.add_paragraph("""Our research methodology followed a rigorous systematic investigation process:""")
+    
+    steps = [
+        {"step": "Hypothesis formulation", 
+         "desc": "Development of testable hypotheses regarding potential approaches to failure prediction models."},
+        {"step": "Experimental design", 
+         "desc": "Creation of controlled testing environments with appropriate data collection protocols."},
+        {"step": "Algorithm development", 
+         "desc": "Implementation of various algorithms with iterative testing and refinement."},
+        {"step": "Validation", 
+         "desc": "Comprehensive validation against historical failure data with statistical analysis."},
+        {"step": "Implementation", 
+         "desc": "Integration of successful approaches with continuous monitoring and improvement."}
+    ]
+    
+    for i, step in enumerate(steps, 1):
+        p = doc.add_paragraph(style='List Number')
+        p.add_run(f"{step['step']}: ").bold = True
+        p.add_run(step['desc'])
+    
+    # Convert the document to bytes for the ZIP file
+    docx_buffer = io.BytesIO()
+    doc.save(docx_buffer)
+    return docx_buffer.getvalue()
+
+@lru_cache(maxsize=1)
+def _build_professional_docs_bundle(doc_names, date_stamp):
+    """
+    Bundle the placeholder professional documents into one ZIP archive
+    
+    Parameters:
+    doc_names (tuple): Names of the documents to include
+    date_stamp (str): Date suffix for the file names (YYYYMMDD)
+    
+    Returns:
+    bytes: ZIP archive
+    """
+    zip_buffer = io.BytesIO()
+    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=3) as zipf:
+        for doc_name in doc_names:
+            file_name = f"{doc_name.lower().replace(' ', '_')}_{date_stamp}.pdf"
+            _write_zip_entry(zipf, file_name, f"This is a placeholder for the {doc_name} document.")
+    return zip_buffer.getvalue()
+
+def show_downloads(processed_data, equipment_data):
+    """
+    Display a dedicated downloads page with various report formats and evidence options
+    
+    Parameters:
+    processed_data (dict): Processed sensor data with statistics and predictions
+    equipment_data (DataFrame): Equipment metadata
+    """
+    st.header("📥 Downloads and Reports")
+    
+    # Read the clock once per rerun; the reports, file names and default dates below all use it
+    now = datetime.now()
+    generated_at = now.strftime('%Y-%m-%d %H:%M:%S')
+    file_stamp = now.strftime('%Y%m%d_%H%M')
+    
+    # Introduction
+    st.markdown("""
+    This page allows you to download various reports and supporting evidence files 
+    for your predictive maintenance system. Select from the options below to generate 
+    the type of report or documentation you need.
+    """)
+    
+    # Create columns for layout
+    col1, col2 = st.columns([3, 2])
+    
+    with col1:
+        st.subheader("Maintenance Reports")
+        
+        # Report Type Selection
+        report_type = st.radio(
+            "Report Type:",
+            ["Equipment Status Summary", "Maintenance Alerts", "Predictive Analysis", "Performance Metrics", 
+             "Complete System Report", "SR&ED Technical Documentation"],
+            index=4
+        )
+        
+        # Add SR&ED specific options if that report type is selected
+        if report_type == "SR&ED Technical Documentation":
+            st.markdown("""
+            <div style="background-color:#f0f2f6;padding:15px;border-radius:8px;margin-top:10px;border-left:5px solid #4b86b4;">
+            <h4 style="color:#262730;margin-top:0;">SR&ED Compliance Package</h4>
+            <p>This comprehensive documentation package adheres to CRA's Scientific Research & Experimental Development (SR&ED) guidelines and includes:</p>
+            <ul>
+                <li><strong>Technical uncertainty documentation</strong> - Evidence of technological challenges beyond routine engineering</li>
+                <li><strong>Systematic investigation evidence</strong> - Documentation of methodical approach to problem-solving</li>
+                <li><strong>Experimental methodology details</strong> - Protocols and procedures used in research activities</li>
+                <li><strong>Research progression documentation</strong> - Timeline and evolution of experimental activities</li>
+                <li><strong>Technical advancement evidence</strong> - Quantifiable improvements and innovations achieved</li>
+                <li><strong>Version-controlled documentation</strong> - Traceable history of research activities</li>
+            </ul>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            # Add SR&ED explanation box
+            with st.expander("What is SR&ED and why is this documentation important?"):
+                st.markdown("""
+                ### Scientific Research & Experimental Development (SR&ED)
+                
+                SR&ED is a Canadian tax incentive program designed to encourage businesses to conduct research and development in Canada. 
+                The program provides tax credits for eligible R&D expenditures.
+                
+                #### SR&ED Eligibility Requirements:
+                
+                1. **Scientific or technological advancement**: Work must seek to advance the understanding of scientific relations or technology
+                2. **Scientific or technological uncertainty**: Must address a problem that couldn't be resolved using standard practices
+                3. **Scientific and technical content**: Must include systematic investigation through experiment or analysis
+                
+                #### Documentation Requirements:
+                
+                The CRA requires contemporaneous documentation that demonstrates:
+                - The systematic investigation process
+                - Technical challenges faced
+                - Methods used to overcome these challenges
+                - Results of experiments and analysis
+                - Technological advancements achieved
                 
-            return pd.DataFrame(sensor_summary)
+                This SR&ED documentation package is specifically designed to meet these requirements and maximize eligibility.
+                """)
+            
+            st.markdown("<br>", unsafe_allow_html=True)
+            
+            sred_options = st.multiselect(
+                "Include Technical Areas:",
+                [
+                    "IoT Sensor Integration Challenges",
+                    "Real-time Processing Innovations",
+                    "Machine Learning Model Development",
+                    "Algorithm Optimization Research",
+                    "Data Quality & Reliability Solutions",
+                    "System Architecture Advancements",
+                    "All Technical Areas"
+                ],
+                default=["All Technical Areas"]
+            )
+            
+            # Add documentation quality section
+            doc_quality = st.select_slider(
+                "Documentation Detail Level:",
+                options=["Basic", "Standard", "Comprehensive", "Expert"],
+                value="Comprehensive",
+                help="Higher detail levels include more evidence, experimental data, and supporting materials"
+            )
+            
+            if doc_quality == "Expert":
+                st.info("Expert level includes detailed algorithm descriptions, full experimental datasets, statistical analysis methodology, and complete technical progression evidence - optimal for SR&ED audits.")
+            elif doc_quality == "Comprehensive":
+                st.info("Comprehensive level includes detailed documentation of technical uncertainties, systematic investigation evidence, and clear advancement proof - recommended for SR&ED claims.")
+            
+            # Add version tracking option
+            include_version_history = st.checkbox("Include Complete Version History", value=True, 
+                                                 help="Tracks changes and improvements to the technical documentation over time")
+            
+            if include_version_history:
+                from utils.version_tracker import SREDVersionTracker
+                tracker = SREDVersionTracker()
+                versions = tracker.get_version_history()
+                if versions:
+                    st.caption(f"Current documentation version: {tracker.get_current_version()} ({len(versions)} revisions tracked)")
+                    
+                    # Display a mini version history
+                    with st.expander("View Version History"):
+                        for idx, version in enumerate(reversed(versions[:3])):
+                            st.markdown(f"**v{version['version']}** ({version['change_type']} change) - {version['timestamp'][:10]}")
+                            changes = ", ".join(version['changes'][:2])
+                            if len(version['changes']) > 2:
+                                changes += f" and {len(version['changes']) - 2} more"
+                            st.caption(changes)
+        
+        # Format selection
+        st.subheader("Format Options")
+        selected_format = st.selectbox(
+            "Select Format:",
+            _REPORT_FORMATS
+        )
+        
+        # Time period selection
+        st.subheader("Time Period")
+        time_period = st.radio(
+            "Select time period:",
+            ["Last 24 Hours", "Last Week", "Last Month", "Last Quarter", "Last Year", "Custom Range"]
+        )
+        
+        if time_period == "Custom Range":
+            col_date1, col_date2 = st.columns(2)
+            with col_date1:
+                start_date = st.date_input("Start Date", now.date())
+            with col_date2:
+                end_date = st.date_input("End Date", now.date())
+        
+        # Generate and provide download button
+        st.subheader("Generate Report")
+        
+        # Add a special note for SR&ED report
+        if report_type == "SR&ED Technical Documentation":
+            st.markdown("""
+            <div style="background-color:#e6f3ff;padding:10px;border-radius:5px;margin:10px 0;">
+            <p style="margin:0"><strong>Note:</strong> The SR&ED Technical Documentation package adheres to CRA's guidelines for Scientific Research & Experimental Development tax incentive claims. This report includes comprehensive technical documentation, experimental methods, and evidence of systematic investigation.</p>
+            </div>
+            """, unsafe_allow_html=True)
+            
+        # Note: These local functions are used within the show_downloads context
+        # Global equivalent functions are defined at module level for use in app.py
+        def get_indexed_data():
+            """Get the per-machine processed data as frames indexed by machine_id"""
+            return _index_processed_data(processed_data)
+            
+        def get_enhanced_equipment_df_local():
+            """Get equipment data with predictions"""
+            # Status and type are low-cardinality labels, so store them as categories
+            equipment_df = equipment_data.astype({'status': 'category', 'machine_type': 'category'})
+            
+            # Add prediction data
+            return _attach_predictions(equipment_df, get_indexed_data())
+            
+        def get_sensor_data_summary():
+            """Get a summary of recent sensor data"""
+            # Get the most recent readings for each machine in a single grouped pass
+            sensor_data = processed_data['sensor_data'].reset_index(drop=True)
+            timestamps = pd.to_datetime(sensor_data['timestamp'])
+            latest_idx = timestamps.groupby(sensor_data['machine_id'], sort=False).idxmax()
+            
+            return sensor_data.loc[latest_idx].reset_index(drop=True)
             
         def get_anomaly_data():
             """Get anomaly data in a structured format"""
-            anomaly_data = []
-            
-            for machine_id, anomaly_info in processed_data['anomalies'].items():
-                # Check if keys exist and provide default values if not
-                row = {
-                    'machine_id': machine_id,
-                    # Use .get() to provide default values if keys don't exist
-                    'anomaly_detected': anomaly_info.get('has_anomalies', 
-                                         anomaly_info.get('detected', False)),
-                    'anomaly_score': f"{anomaly_info.get('anomaly_score', 0.0):.3f}",
-                    'affected_sensors': ', '.join(anomaly_info.get('affected_sensors', [])),
-                    'severity': anomaly_info.get('severity', 'Unknown'),
-                    'detected_at': anomaly_info.get('detected_at', 'Unknown')
-                }
-                anomaly_data.append(row)
-                
-            return pd.DataFrame(anomaly_data)
+            return _build_anomaly_frame(processed_data['anomalies'])
             
         def get_performance_metrics():
             """Get performance metrics for all machines"""
-            metrics_data = []
-            
-            # For each machine, calculate or extract key performance metrics
-            for machine_id in equipment_data['machine_id'].unique():
-                if machine_id in processed_data['statistics']:
-                    stats = processed_data['statistics'][machine_id]
-                    
-                    # Calculate overall health score (example metric)
-                    temp_health = 100 - max(0, min(100, (stats['temperature']['current'] - 60) * 2))
-                    vibration_health = 100 - max(0, min(100, stats['vibration']['current'] * 10))
-                    power_health = 100 - max(0, min(100, abs(stats['power']['current'] - 90)))
-                    
-                    overall_health = (temp_health + vibration_health + power_health) / 3
-                    
-                    # Calculate OEE (Overall Equipment Effectiveness) - simplified example
-                    availability = 0.95  # 95% uptime
-                    performance = 0.90   # 90% of max speed
-                    quality = 0.98       # 98% good parts
-                    
-                    # Adjust based on machine status
-                    machine_info = equipment_data[equipment_data['machine_id'] == machine_id].iloc[0]
-                    if machine_info['status'] == 'Maintenance':
-                        availability = 0.0
-                    elif machine_info['status'] == 'Warning':
-                        availability = 0.8
-                        performance = 0.7
-                    elif machine_info['status'] == 'Idle':
-                        performance = 0.0
-                        
-                    oee = availability * performance * quality * 100
-                    
-                    # Add to metrics data
-                    metrics_data.append({
-                        'machine_id': machine_id,
-                        'overall_health': f"{overall_health:.1f}%",
-                        'oee': f"{oee:.1f}%",
-                        'availability': f"{availability*100:.1f}%",
-                        'performance': f"{performance*100:.1f}%",
-                        'quality': f"{quality*100:.1f}%",
-                        'temperature': f"{stats['temperature']['current']:.1f}°C",
-                        'vibration': f"{stats['vibration']['current']:.2f} mm/s",
-                        'power_usage': f"{stats['power']['current']:.1f}%"
-                    })
-            
-            return pd.DataFrame(metrics_data)
+            return _compute_performance_metrics(equipment_data, get_indexed_data()['statistics'])
                     
         def get_historical_trends():
             """Get historical trends from sensor data"""
-            sensor_data = processed_data['sensor_data'].copy()
+            return _daily_sensor_averages(processed_data['sensor_data'])
             
-            # Group by day and machine, calculate daily averages
-            sensor_data['date'] = pd.to_datetime(sensor_data['timestamp']).dt.date
-            daily_avg = sensor_data.groupby(['date', 'machine_id']).mean(numeric_only=True).reset_index()
+        def get_critical_items(equipment_df, anomaly_data):
+            """Get machines needing immediate maintenance and high-severity anomalies"""
+            critical_mask = equipment_df['maintenance_urgency'].eq('Immediate')
+            critical_machines = equipment_df.loc[critical_mask]
             
-            return daily_avg
+            if anomaly_data.empty:
+                return critical_machines, anomaly_data
+            
+            severe_mask = anomaly_data['severity'].eq('High')
+            severe_anomalies = anomaly_data.loc[severe_mask]
+            
+            return critical_machines, severe_anomalies
+        
+        # The derived frames are shared by every generator and kept across reruns
+        # until the underlying data is refreshed
+        frame_cache = get_page_cache('report_frame_cache')
+        
+        def cached_frame(builder):
+            """Wrap a frame builder so it runs at most once per data refresh"""
+            def get_cached():
+                if builder.__name__ not in frame_cache:
+                    frame_cache[builder.__name__] = builder()
+                return frame_cache[builder.__name__]
+            return get_cached
+        
+        get_indexed_data = cached_frame(get_indexed_data)
+        get_enhanced_equipment_df = cached_frame(get_enhanced_equipment_df_local)
+        get_sensor_data_summary = cached_frame(get_sensor_data_summary)
+        get_anomaly_data = cached_frame(get_anomaly_data)
+        get_performance_metrics = cached_frame(get_performance_metrics)
+        get_historical_trends = cached_frame(get_historical_trends)
             
         def generate_csv():
             """Generate CSV file from all application data"""
@@ -624,141 +1453,146 @@ def show_downloads(processed_data, equipment_data):
             zip_buffer = io.BytesIO()
             
             # Create a ZIP file to contain multiple CSV files
-            with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=_CSV_COMPRESSLEVEL) as zipf:
                 # Add equipment data
-                equipment_csv = get_enhanced_equipment_df().to_csv(index=False)
-                zipf.writestr('equipment_status.csv', equipment_csv)
+                with zipf.open('equipment_status.csv', 'w') as entry:
+                    _display_equipment(get_enhanced_equipment_df()).to_csv(entry, index=False)
                 
                 # Add sensor data summary
-                sensor_csv = get_sensor_data_summary().to_csv(index=False)
-                zipf.writestr('sensor_readings.csv', sensor_csv)
+                with zipf.open('sensor_readings.csv', 'w') as entry:
+                    get_sensor_data_summary().to_csv(entry, index=False)
                 
                 # Add anomaly data
-                anomaly_csv = get_anomaly_data().to_csv(index=False)
-                zipf.writestr('anomaly_detection.csv', anomaly_csv)
+                with zipf.open('anomaly_detection.csv', 'w') as entry:
+                    get_anomaly_data().to_csv(entry, index=False)
                 
                 # Add performance metrics
-                metrics_csv = get_performance_metrics().to_csv(index=False)
-                zipf.writestr('performance_metrics.csv', metrics_csv)
+                with zipf.open('performance_metrics.csv', 'w') as entry:
+                    get_performance_metrics().to_csv(entry, index=False)
                 
                 # Add historical trends if available
-                historical_csv = get_historical_trends().to_csv(index=False)
-                zipf.writestr('historical_trends.csv', historical_csv)
+                with zipf.open('historical_trends.csv', 'w') as entry:
+                    get_historical_trends().to_csv(entry, index=False)
             
-            # Reset buffer position
-            zip_buffer.seek(0)
             return zip_buffer.getvalue()
             
         def generate_txt():
             """Generate comprehensive text report from all application data"""
-            equipment_df = get_enhanced_equipment_df()
+            equipment_df = _display_equipment(get_enhanced_equipment_df())
             sensor_data = get_sensor_data_summary()
             anomaly_data = get_anomaly_data()
             metrics_data = get_performance_metrics()
             
-            # Create a text report
-            current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            report = [
-                f"SmartMaintain - {report_type}",
-                f"Generated: {current_time}",
-                f"Time Period: {time_period}",
-                "-" * 80,
-                "\n=== EXECUTIVE SUMMARY ===\n"
-            ]
+            # Create a text report, writing each line straight into one buffer
+            report = io.StringIO()
+            write = report.write
+            write(f"SmartMaintain - {report_type}\n"
+                  f"Generated: {generated_at}\n"
+                  f"Time Period: {time_period}\n"
+                  f"{'-' * 80}\n"
+                  "\n=== EXECUTIVE SUMMARY ===\n\n")
             
             # Add executive summary
-            critical_count = len([r for _, r in equipment_df.iterrows() if 'maintenance_urgency' in r and r['maintenance_urgency'] == 'Immediate'])
-            warning_count = len([r for _, r in equipment_df.iterrows() if 'maintenance_urgency' in r and r['maintenance_urgency'] == 'Soon'])
-            anomaly_count = len([r for _, r in anomaly_data.iterrows() if r['anomaly_detected'] == True])
+            critical_count, warning_count, anomaly_count = _summary_counts(equipment_df, anomaly_data)
             
-            report.append(f"Total Equipment: {len(equipment_df)}")
-            report.append(f"Critical Maintenance Alerts: {critical_count}")
-            report.append(f"Warning Maintenance Alerts: {warning_count}")
-            report.append(f"Detected Anomalies: {anomaly_count}")
-            report.append("")
+            write(f"Total Equipment: {len(equipment_df)}\n"
+                  f"Critical Maintenance Alerts: {critical_count}\n"
+                  f"Warning Maintenance Alerts: {warning_count}\n"
+                  f"Detected Anomalies: {anomaly_count}\n\n")
             
             # Add key metrics
             if not metrics_data.empty:
-                avg_health = metrics_data['overall_health'].str.rstrip('%').astype(float).mean()
-                avg_oee = metrics_data['oee'].str.rstrip('%').astype(float).mean()
-                report.append(f"Average Equipment Health: {avg_health:.1f}%")
-                report.append(f"Average OEE: {avg_oee:.1f}%")
-            report.append("")
+                avg_health = metrics_data.attrs['average_health']
+                avg_oee = metrics_data.attrs['average_oee']
+                write(f"Average Equipment Health: {avg_health:.1f}%\n"
+                      f"Average OEE: {avg_oee:.1f}%\n")
+            write("\n")
             
             # Critical Issues Section
-            report.append("\n=== CRITICAL ISSUES ===\n")
+            write("\n=== CRITICAL ISSUES ===\n\n")
             
             # List machines with immediate maintenance needs
-            critical_machines = equipment_df[equipment_df['maintenance_urgency'] == 'Immediate']
+            critical_machines, severe_anomalies = get_critical_items(equipment_df, anomaly_data)
             if len(critical_machines) > 0:
-                report.append("Machines Requiring Immediate Attention:")
-                for _, row in critical_machines.iterrows():
-                    report.append(f"- {row['machine_id']} ({row['machine_type']})")
-                    report.append(f"  Failure Probability: {row['failure_probability']}")
-                    report.append(f"  Days to Failure: {row['days_to_failure']}")
-                    report.append(f"  Recommendation: {row.get('recommendation', 'No recommendation')}")
-                    report.append("")
+                write("Machines Requiring Immediate Attention:\n")
+                for machine_id, machine_type, failure_probability, days_to_failure, recommendation in zip(
+                        critical_machines['machine_id'], critical_machines['machine_type'],
+                        critical_machines['failure_probability'], critical_machines['days_to_failure'],
+                        _column_values(critical_machines, 'recommendation', 'No recommendation')):
+                    write(f"- {machine_id} ({machine_type})\n"
+                          f"  Failure Probability: {failure_probability}\n"
+                          f"  Days to Failure: {days_to_failure}\n"
+                          f"  Recommendation: {recommendation}\n\n")
             else:
-                report.append("No machines require immediate attention.")
-                report.append("")
+                write("No machines require immediate attention.\n\n")
             
             # List significant anomalies
             if not anomaly_data.empty:
-                severe_anomalies = anomaly_data[anomaly_data['severity'] == 'High']
                 if len(severe_anomalies) > 0:
-                    report.append("Significant Anomalies Detected:")
-                    for _, row in severe_anomalies.iterrows():
-                        report.append(f"- {row['machine_id']}")
-                        report.append(f"  Anomaly Score: {row['anomaly_score']}")
-                        report.append(f"  Affected Sensors: {row['affected_sensors']}")
-                        report.append(f"  Detected At: {row['detected_at']}")
-                        report.append("")
+                    write("Significant Anomalies Detected:\n")
+                    for machine_id, anomaly_score, affected_sensors, detected_at in zip(
+                            severe_anomalies['machine_id'], severe_anomalies['anomaly_score'],
+                            severe_anomalies['affected_sensors'], severe_anomalies['detected_at']):
+                        write(f"- {machine_id}\n"
+                              f"  Anomaly Score: {anomaly_score}\n"
+                              f"  Affected Sensors: {affected_sensors}\n"
+                              f"  Detected At: {detected_at}\n\n")
             
             # Equipment Details Section
-            report.append("\n=== DETAILED EQUIPMENT STATUS ===\n")
+            write("\n=== DETAILED EQUIPMENT STATUS ===\n\n")
+            
+            # Index the latest sensor readings by machine once instead of filtering per machine
+            latest_readings = {}
+            if not sensor_data.empty:
+                latest = sensor_data.drop_duplicates('machine_id')
+                latest_readings = dict(zip(latest['machine_id'], zip(
+                    latest['timestamp'], latest['temperature'], latest['vibration'], latest['power']
+                )))
             
             # Add equipment summary for all machines
-            for _, row in equipment_df.iterrows():
-                report.append(f"Machine: {row['machine_id']} ({row['machine_type']})")
-                report.append(f"  Status: {row['status']}")
-                report.append(f"  Failure Probability: {row['failure_probability']}")
-                report.append(f"  Days to Failure: {row['days_to_failure']}")
-                report.append(f"  Maintenance Urgency: {row.get('maintenance_urgency', 'Unknown')}")
-                report.append(f"  Recommendation: {row.get('recommendation', 'No recommendation')}")
-                report.append("")
+            for machine_id, machine_type, status, failure_probability, days_to_failure, urgency, recommendation in zip(
+                    equipment_df['machine_id'], equipment_df['machine_type'], equipment_df['status'],
+                    equipment_df['failure_probability'], equipment_df['days_to_failure'],
+                    _column_values(equipment_df, 'maintenance_urgency', 'Unknown'),
+                    _column_values(equipment_df, 'recommendation', 'No recommendation')):
+                write(f"Machine: {machine_id} ({machine_type})\n"
+                      f"  Status: {status}\n"
+                      f"  Failure Probability: {failure_probability}\n"
+                      f"  Days to Failure: {days_to_failure}\n"
+                      f"  Maintenance Urgency: {urgency}\n"
+                      f"  Recommendation: {recommendation}\n\n")
                 
                 # Add latest sensor readings for this machine
-                if not sensor_data.empty:
-                    machine_sensors = sensor_data[sensor_data['machine_id'] == row['machine_id']]
-                    if not machine_sensors.empty:
-                        latest = machine_sensors.iloc[0]
-                        report.append(f"  Latest Sensor Readings:")
-                        report.append(f"    Timestamp: {latest.get('timestamp', 'Unknown')}")
-                        report.append(f"    Temperature: {latest.get('temperature', 'Unknown'):.1f}°C")
-                        report.append(f"    Vibration: {latest.get('vibration', 'Unknown'):.2f} mm/s")
-                        report.append(f"    Power: {latest.get('power', 'Unknown'):.1f}%")
-                        report.append("")
+                if machine_id in latest_readings:
+                    timestamp, temperature, vibration, power = latest_readings[machine_id]
+                    write(f"  Latest Sensor Readings:\n"
+                          f"    Timestamp: {timestamp}\n"
+                          f"    Temperature: {temperature:.1f}°C\n"
+                          f"    Vibration: {vibration:.2f} mm/s\n"
+                          f"    Power: {power:.1f}%\n\n")
             
             # Performance Metrics Section
-            report.append("\n=== PERFORMANCE METRICS ===\n")
+            write("\n=== PERFORMANCE METRICS ===\n\n")
             
             if not metrics_data.empty:
-                for _, row in metrics_data.iterrows():
-                    report.append(f"Machine: {row['machine_id']}")
-                    report.append(f"  Overall Health: {row['overall_health']}")
-                    report.append(f"  OEE: {row['oee']}")
-                    report.append(f"  Availability: {row['availability']}")
-                    report.append(f"  Performance: {row['performance']}")
-                    report.append(f"  Quality: {row['quality']}")
-                    report.append("")
-            
-            # Join and return
-            return "\n".join(report)
+                for machine_id, overall_health, oee, availability, performance, quality in zip(
+                        metrics_data['machine_id'], metrics_data['overall_health'], metrics_data['oee'],
+                        metrics_data['availability'], metrics_data['performance'], metrics_data['quality']):
+                    write(f"Machine: {machine_id}\n"
+                          f"  Overall Health: {overall_health}\n"
+                          f"  OEE: {oee}\n"
+                          f"  Availability: {availability}\n"
+                          f"  Performance: {performance}\n"
+                          f"  Quality: {quality}\n\n")
+            
+            return report.getvalue().encode('utf-8')
             
         def generate_pdf():
             """Generate comprehensive PDF report with data from all components"""
+            from fpdf import FPDF
+            
             # Get all the data we need
-            equipment_df = get_enhanced_equipment_df()
+            equipment_df = _display_equipment(get_enhanced_equipment_df())
             sensor_data = get_sensor_data_summary()
             anomaly_data = get_anomaly_data()
             metrics_data = get_performance_metrics()
@@ -773,7 +1607,7 @@ def show_downloads(processed_data, equipment_data):
             # Title
             pdf.cell(0, 10, f"SmartMaintain - {report_type}", 0, 1, "C")
             pdf.set_font("Arial", "", 10)
-            pdf.cell(0, 10, f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", 0, 1, "C")
+            pdf.cell(0, 10, f"Generated: {generated_at}", 0, 1, "C")
             pdf.cell(0, 10, f"Time Period: {time_period}", 0, 1, "C")
             pdf.ln(5)
             
@@ -783,9 +1617,7 @@ def show_downloads(processed_data, equipment_data):
             pdf.ln(2)
             
             # Calculate summary statistics
-            critical_count = len([r for _, r in equipment_df.iterrows() if 'maintenance_urgency' in r and r['maintenance_urgency'] == 'Immediate'])
-            warning_count = len([r for _, r in equipment_df.iterrows() if 'maintenance_urgency' in r and r['maintenance_urgency'] == 'Soon'])
-            anomaly_count = len([r for _, r in anomaly_data.iterrows() if r['anomaly_detected'] == True])
+            critical_count, warning_count, anomaly_count = _summary_counts(equipment_df, anomaly_data)
             
             # Add executive summary in bullet points
             pdf.set_font("Arial", "", 10)
@@ -796,8 +1628,8 @@ def show_downloads(processed_data, equipment_data):
             
             # Add key metrics if available
             if not metrics_data.empty:
-                avg_health = metrics_data['overall_health'].str.rstrip('%').astype(float).mean()
-                avg_oee = metrics_data['oee'].str.rstrip('%').astype(float).mean()
+                avg_health = metrics_data.attrs['average_health']
+                avg_oee = metrics_data.attrs['average_oee']
                 pdf.cell(0, 8, f"- Average Equipment Health: {avg_health:.1f}%", 0, 1)
                 pdf.cell(0, 8, f"- Average OEE: {avg_oee:.1f}%", 0, 1)
             
@@ -808,31 +1640,30 @@ def show_downloads(processed_data, equipment_data):
             pdf.ln(2)
             
             # Create table header
+            equipment_widths = [20, 20, 20, 25, 20, 20, 50]
             pdf.set_font("Arial", "B", 8)
-            pdf.cell(20, 8, "Machine ID", 1, 0, "C")
-            pdf.cell(20, 8, "Type", 1, 0, "C")
-            pdf.cell(20, 8, "Status", 1, 0, "C")
-            pdf.cell(25, 8, "Failure Prob.", 1, 0, "C")
-            pdf.cell(20, 8, "Days to Fail", 1, 0, "C")
-            pdf.cell(20, 8, "Urgency", 1, 0, "C")
-            pdf.cell(50, 8, "Recommendation", 1, 1, "C")
+            _write_pdf_table(pdf, equipment_widths, [["Machine ID", "Type", "Status", "Failure Prob.", 
+                                                      "Days to Fail", "Urgency", "Recommendation"]], align="C")
+            
+            # Format every column up front and write the table from plain lists
+            equipment_rows = pd.DataFrame({
+                'machine_id': equipment_df['machine_id'],
+                'machine_type': equipment_df['machine_type'],
+                'status': equipment_df['status'],
+                'failure_probability': equipment_df.get('failure_probability', 'N/A'),
+                'days_to_failure': equipment_df.get('days_to_failure', 'N/A'),
+                'maintenance_urgency': equipment_df.get('maintenance_urgency', 'Unknown'),
+                'recommendation': equipment_df.get('recommendation', 'No recommendation')
+            }).astype(str)
+            
+            # Truncate recommendation to fit in cell
+            recommendation = equipment_rows['recommendation']
+            equipment_rows['recommendation'] = recommendation.where(recommendation.str.len() <= 45, 
+                                                                    recommendation.str[:42] + '...')
             
             # Add data rows
             pdf.set_font("Arial", "", 7)
-            
-            for _, row in equipment_df.iterrows():
-                pdf.cell(20, 8, str(row['machine_id']), 1, 0)
-                pdf.cell(20, 8, str(row['machine_type']), 1, 0)
-                pdf.cell(20, 8, str(row['status']), 1, 0)
-                pdf.cell(25, 8, str(row.get('failure_probability', 'N/A')), 1, 0)
-                pdf.cell(20, 8, str(row.get('days_to_failure', 'N/A')), 1, 0)
-                pdf.cell(20, 8, str(row.get('maintenance_urgency', 'Unknown')), 1, 0)
-                
-                # Truncate recommendation to fit in cell
-                recommendation = str(row.get('recommendation', 'No recommendation'))
-                if len(recommendation) > 45:
-                    recommendation = recommendation[:42] + '...'
-                pdf.cell(50, 8, recommendation, 1, 1)
+            _write_pdf_table(pdf, equipment_widths, equipment_rows.values.tolist())
             
             # Critical Issues Section
             pdf.ln(10)
@@ -840,16 +1671,17 @@ def show_downloads(processed_data, equipment_data):
             pdf.cell(0, 10, "CRITICAL ISSUES", 0, 1)
             
             # List machines with immediate maintenance needs
-            critical_machines = equipment_df[equipment_df['maintenance_urgency'] == 'Immediate']
+            critical_machines, severe_anomalies = get_critical_items(equipment_df, anomaly_data)
             
             if len(critical_machines) > 0:
                 pdf.set_font("Arial", "B", 10)
                 pdf.cell(0, 8, "Machines Requiring Immediate Attention:", 0, 1)
                 pdf.set_font("Arial", "", 10)
                 
-                for _, row in critical_machines.iterrows():
+                for machine_id, machine_type, recommendation in _row_tuples(
+                        critical_machines, ['machine_id', 'machine_type', 'recommendation'], {'recommendation': ''}):
                     pdf.cell(10, 8, "-", 0, 0)
-                    pdf.cell(0, 8, f"{row['machine_id']} ({row['machine_type']}): {row.get('recommendation', '')}", 0, 1)
+                    pdf.cell(0, 8, f"{machine_id} ({machine_type}): {recommendation}", 0, 1)
             else:
                 pdf.set_font("Arial", "", 10)
                 pdf.cell(0, 8, "No machines require immediate attention.", 0, 1)
@@ -860,15 +1692,15 @@ def show_downloads(processed_data, equipment_data):
                 pdf.set_font("Arial", "B", 14)
                 pdf.cell(0, 10, "ANOMALY DETECTION", 0, 1)
                 
-                severe_anomalies = anomaly_data[anomaly_data['severity'] == 'High']
                 if len(severe_anomalies) > 0:
                     pdf.set_font("Arial", "B", 10)
                     pdf.cell(0, 8, "Significant Anomalies Detected:", 0, 1)
                     pdf.set_font("Arial", "", 10)
                     
-                    for _, row in severe_anomalies.iterrows():
+                    for machine_id, anomaly_score, affected_sensors in _row_tuples(
+                            severe_anomalies, ['machine_id', 'anomaly_score', 'affected_sensors']):
                         pdf.cell(10, 8, "-", 0, 0)
-                        pdf.cell(0, 8, f"{row['machine_id']} - Score: {row['anomaly_score']}, Sensors: {row['affected_sensors']}", 0, 1)
+                        pdf.cell(0, 8, f"{machine_id} - Score: {anomaly_score}, Sensors: {affected_sensors}", 0, 1)
                 else:
                     pdf.set_font("Arial", "", 10)
                     pdf.cell(0, 8, "No significant anomalies detected.", 0, 1)
@@ -881,37 +1713,31 @@ def show_downloads(processed_data, equipment_data):
                 pdf.ln(2)
                 
                 # Create table header for metrics
+                metrics_widths = [20, 25, 20, 25, 25, 20, 40]
                 pdf.set_font("Arial", "B", 8)
-                pdf.cell(20, 8, "Machine ID", 1, 0, "C")
-                pdf.cell(25, 8, "Health", 1, 0, "C")
-                pdf.cell(20, 8, "OEE", 1, 0, "C")
-                pdf.cell(25, 8, "Availability", 1, 0, "C")
-                pdf.cell(25, 8, "Performance", 1, 0, "C")
-                pdf.cell(20, 8, "Quality", 1, 0, "C")
-                pdf.cell(40, 8, "Sensor Readings", 1, 1, "C")
+                _write_pdf_table(pdf, metrics_widths, [["Machine ID", "Health", "OEE", "Availability", 
+                                                        "Performance", "Quality", "Sensor Readings"]], align="C")
+                
+                # Add sensor readings summary
+                metrics_rows = metrics_data[['machine_id', 'overall_health', 'oee', 'availability', 
+                                             'performance', 'quality']].astype(str)
+                metrics_rows['readings'] = ("Temp: " + metrics_data['temperature'].astype(str) + 
+                                            ", Vib: " + metrics_data['vibration'].astype(str) + 
+                                            ", Power: " + metrics_data['power_usage'].astype(str))
                 
                 # Add metrics data rows
                 pdf.set_font("Arial", "", 7)
-                
-                for _, row in metrics_data.iterrows():
-                    pdf.cell(20, 8, str(row['machine_id']), 1, 0)
-                    pdf.cell(25, 8, str(row['overall_health']), 1, 0)
-                    pdf.cell(20, 8, str(row['oee']), 1, 0)
-                    pdf.cell(25, 8, str(row['availability']), 1, 0)
-                    pdf.cell(25, 8, str(row['performance']), 1, 0)
-                    pdf.cell(20, 8, str(row['quality']), 1, 0)
-                    
-                    # Add sensor readings summary
-                    readings = f"Temp: {row['temperature']}, Vib: {row['vibration']}, Power: {row['power_usage']}"
-                    pdf.cell(40, 8, readings, 1, 1)
+                _write_pdf_table(pdf, metrics_widths, metrics_rows.values.tolist())
             
             # Return PDF as bytes
             return pdf.output(dest='S').encode('latin1')
             
         def generate_docx():
             """Generate comprehensive DOCX report with data from all components"""
+            from docx import Document
+            
             # Get all necessary data
-            equipment_df = get_enhanced_equipment_df()
+            equipment_df = _display_equipment(get_enhanced_equipment_df())
             sensor_data = get_sensor_data_summary()
             anomaly_data = get_anomaly_data()
             metrics_data = get_performance_metrics()
@@ -921,16 +1747,14 @@ def show_downloads(processed_data, equipment_data):
             
             # Add title
             doc.add_heading(f"SmartMaintain - {report_type}", 0)
-            doc.add_paragraph(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            doc.add_paragraph(f"Generated: {generated_at}")
             doc.add_paragraph(f"Time Period: {time_period}")
             
             # Executive Summary
             doc.add_heading("Executive Summary", level=1)
             
             # Calculate summary statistics
-            critical_count = len([r for _, r in equipment_df.iterrows() if 'maintenance_urgency' in r and r['maintenance_urgency'] == 'Immediate'])
-            warning_count = len([r for _, r in equipment_df.iterrows() if 'maintenance_urgency' in r and r['maintenance_urgency'] == 'Soon'])
-            anomaly_count = len([r for _, r in anomaly_data.iterrows() if r['anomaly_detected'] == True])
+            critical_count, warning_count, anomaly_count = _summary_counts(equipment_df, anomaly_data)
             
             # Add executive summary in bullet points
             summary = doc.add_paragraph()
@@ -942,8 +1766,8 @@ def show_downloads(processed_data, equipment_data):
             
             # Add key metrics if available
             if not metrics_data.empty:
-                avg_health = metrics_data['overall_health'].str.rstrip('%').astype(float).mean()
-                avg_oee = metrics_data['oee'].str.rstrip('%').astype(float).mean()
+                avg_health = metrics_data.attrs['average_health']
+                avg_oee = metrics_data.attrs['average_oee']
                 summary.add_run(f"• Average Equipment Health: {avg_health:.1f}%\n")
                 summary.add_run(f"• Average OEE: {avg_oee:.1f}%\n")
             
@@ -951,16 +1775,19 @@ def show_downloads(processed_data, equipment_data):
             doc.add_heading("Critical Issues", level=1)
             
             # List machines with immediate maintenance needs
-            critical_machines = equipment_df[equipment_df['maintenance_urgency'] == 'Immediate']
+            critical_machines, severe_anomalies = get_critical_items(equipment_df, anomaly_data)
             
             if len(critical_machines) > 0:
                 doc.add_paragraph("Machines Requiring Immediate Attention:", style='Heading 2')
                 
-                for _, row in critical_machines.iterrows():
+                for machine_id, machine_type, failure_probability, days_to_failure, recommendation in _row_tuples(
+                        critical_machines, 
+                        ['machine_id', 'machine_type', 'failure_probability', 'days_to_failure', 'recommendation'], 
+                        {'recommendation': 'No recommendation'}):
                     p = doc.add_paragraph(style='List Bullet')
-                    p.add_run(f"{row['machine_id']} ({row['machine_type']}): ").bold = True
-                    p.add_run(f"Failure probability {row['failure_probability']} in {row['days_to_failure']} days. ")
-                    p.add_run(str(row.get('recommendation', 'No recommendation')))
+                    p.add_run(f"{machine_id} ({machine_type}): ").bold = True
+                    p.add_run(f"Failure probability {failure_probability} in {days_to_failure} days. ")
+                    p.add_run(str(recommendation))
             else:
                 doc.add_paragraph("No machines require immediate attention.").italic = True
             
@@ -968,16 +1795,18 @@ def show_downloads(processed_data, equipment_data):
             if not anomaly_data.empty:
                 doc.add_heading("Anomaly Detection Results", level=1)
                 
-                severe_anomalies = anomaly_data[anomaly_data['severity'] == 'High']
                 if len(severe_anomalies) > 0:
                     doc.add_paragraph("Significant Anomalies Detected:", style='Heading 2')
                     
-                    for _, row in severe_anomalies.iterrows():
+                    has_detected_at = 'detected_at' in severe_anomalies
+                    for machine_id, anomaly_score, affected_sensors, detected_at in _row_tuples(
+                            severe_anomalies, ['machine_id', 'anomaly_score', 'affected_sensors', 'detected_at'], 
+                            {'detected_at': None}):
                         p = doc.add_paragraph(style='List Bullet')
-                        p.add_run(f"{row['machine_id']}: ").bold = True
-                        p.add_run(f"Anomaly Score: {row['anomaly_score']}, Affected Sensors: {row['affected_sensors']}")
-                        if 'detected_at' in row:
-                            p.add_run(f", Detected At: {row['detected_at']}")
+                        p.add_run(f"{machine_id}: ").bold = True
+                        p.add_run(f"Anomaly Score: {anomaly_score}, Affected Sensors: {affected_sensors}")
+                        if has_detected_at:
+                            p.add_run(f", Detected At: {detected_at}")
                 else:
                     doc.add_paragraph("No significant anomalies detected.").italic = True
             
@@ -986,32 +1815,12 @@ def show_downloads(processed_data, equipment_data):
             table = doc.add_table(rows=1, cols=7)
             table.style = 'Table Grid'
             
-            # Add header row
-            header_cells = table.rows[0].cells
-            header_cells[0].text = "Machine ID"
-            header_cells[1].text = "Type"
-            header_cells[2].text = "Status"
-            header_cells[3].text = "Failure Prob."
-            header_cells[4].text = "Days to Failure"
-            header_cells[5].text = "Urgency"
-            header_cells[6].text = "Recommendation"
-            
-            # Make the header row bold
-            for cell in header_cells:
-                for paragraph in cell.paragraphs:
-                    for run in paragraph.runs:
-                        run.bold = True
+            # Add a bold header row
+            _set_docx_header(table, ["Machine ID", "Type", "Status", "Failure Prob.", "Days to Failure", "Urgency", "Recommendation"])
             
             # Add data rows
-            for _, row in equipment_df.iterrows():
-                cells = table.add_row().cells
-                cells[0].text = str(row['machine_id'])
-                cells[1].text = str(row['machine_type'])
-                cells[2].text = str(row['status'])
-                cells[3].text = str(row.get('failure_probability', 'N/A'))
-                cells[4].text = str(row.get('days_to_failure', 'N/A'))
-                cells[5].text = str(row.get('maintenance_urgency', 'Unknown'))
-                cells[6].text = str(row.get('recommendation', 'No recommendation'))
+            equipment_rows = _table_frame(equipment_df, _EQUIPMENT_TABLE_COLUMNS, _EQUIPMENT_TABLE_DEFAULTS).astype(str)
+            _append_docx_rows(table, equipment_rows.itertuples(index=False, name=None))
             
             # Performance Metrics Section
             if not metrics_data.empty:
@@ -1021,32 +1830,11 @@ def show_downloads(processed_data, equipment_data):
                 metrics_table = doc.add_table(rows=1, cols=7)
                 metrics_table.style = 'Table Grid'
                 
-                # Add header row
-                header_cells = metrics_table.rows[0].cells
-                header_cells[0].text = "Machine ID"
-                header_cells[1].text = "Health"
-                header_cells[2].text = "OEE"
-                header_cells[3].text = "Availability"
-                header_cells[4].text = "Performance"
-                header_cells[5].text = "Quality"
-                header_cells[6].text = "Power Usage"
-                
-                # Make the header row bold
-                for cell in header_cells:
-                    for paragraph in cell.paragraphs:
-                        for run in paragraph.runs:
-                            run.bold = True
+                # Add a bold header row
+                _set_docx_header(metrics_table, ["Machine ID", "Health", "OEE", "Availability", "Performance", "Quality", "Power Usage"])
                 
                 # Add metrics data rows
-                for _, row in metrics_data.iterrows():
-                    cells = metrics_table.add_row().cells
-                    cells[0].text = str(row['machine_id'])
-                    cells[1].text = str(row['overall_health'])
-                    cells[2].text = str(row['oee'])
-                    cells[3].text = str(row['availability'])
-                    cells[4].text = str(row['performance'])
-                    cells[5].text = str(row['quality'])
-                    cells[6].text = str(row['power_usage'])
+                _append_docx_rows(metrics_table, metrics_data[_METRICS_TABLE_COLUMNS].astype(str).itertuples(index=False, name=None))
             
             # Sensor Readings Section
             if not sensor_data.empty:
@@ -1055,70 +1843,63 @@ def show_downloads(processed_data, equipment_data):
                 sensor_table = doc.add_table(rows=1, cols=5)
                 sensor_table.style = 'Table Grid'
                 
-                # Add header row
-                header_cells = sensor_table.rows[0].cells
-                header_cells[0].text = "Machine ID"
-                header_cells[1].text = "Timestamp"
-                header_cells[2].text = "Temperature (°C)"
-                header_cells[3].text = "Vibration (mm/s)"
-                header_cells[4].text = "Power (%)"
+                # Add a bold header row
+                _set_docx_header(sensor_table, ["Machine ID", "Timestamp", "Temperature (°C)", "Vibration (mm/s)", "Power (%)"])
                 
-                # Make the header row bold
-                for cell in header_cells:
-                    for paragraph in cell.paragraphs:
-                        for run in paragraph.runs:
-                            run.bold = True
-                
-                # Add sensor data rows
-                for _, row in sensor_data.iterrows():
-                    cells = sensor_table.add_row().cells
-                    cells[0].text = str(row['machine_id'])
-                    cells[1].text = str(row.get('timestamp', 'Unknown'))
-                    cells[2].text = f"{row.get('temperature', 'Unknown'):.1f}"
-                    cells[3].text = f"{row.get('vibration', 'Unknown'):.2f}"
-                    cells[4].text = f"{row.get('power', 'Unknown'):.1f}"
+                # Add sensor data rows, formatting each reading column in one pass
+                timestamps = sensor_data['timestamp'].astype(str) if 'timestamp' in sensor_data else ['Unknown'] * len(sensor_data)
+                _append_docx_rows(sensor_table, zip(
+                    sensor_data['machine_id'].astype(str),
+                    timestamps,
+                    _format_fixed(sensor_data['temperature'], 1),
+                    _format_fixed(sensor_data['vibration'], 2),
+                    _format_fixed(sensor_data['power'], 1)
+                ))
             
             # Add a conclusion
             doc.add_page_break()
             doc.add_heading("Conclusion and Recommendations", level=1)
             conclusion = doc.add_paragraph()
             conclusion.add_run("Summary of Findings: ").bold = True
-            conclusion.add_run(f"Based on the analysis of {len(equipment_df)} machines, ")
             
-            if critical_count > 0:
-                conclusion.add_run(f"{critical_count} machines require immediate maintenance attention. ")
-                conclusion.add_run("These should be addressed as soon as possible to prevent failures and downtime. ")
-            else:
-                conclusion.add_run("no machines require immediate attention at this time. ")
-                
-            if warning_count > 0:
-                conclusion.add_run(f"Additionally, {warning_count} machines have been flagged with warnings ")
-                conclusion.add_run("and should be scheduled for maintenance in the near future. ")
-                
-            if anomaly_count > 0:
-                conclusion.add_run(f"\n\nThe system has detected {anomaly_count} anomalies that may indicate developing issues. ")
-                conclusion.add_run("These should be investigated to determine their root cause.")
+            # Render the rest of the conclusion from conditional fragments and add it as a single run
+            conclusion_parts = [
+                f"Based on the analysis of {len(equipment_df)} machines, ",
+                f"{critical_count} machines require immediate maintenance attention. "
+                "These should be addressed as soon as possible to prevent failures and downtime. "
+                if critical_count > 0 else
+                "no machines require immediate attention at this time. ",
+                f"Additionally, {warning_count} machines have been flagged with warnings "
+                "and should be scheduled for maintenance in the near future. "
+                if warning_count > 0 else "",
+                f"\n\nThe system has detected {anomaly_count} anomalies that may indicate developing issues. "
+                "These should be investigated to determine their root cause."
+                if anomaly_count > 0 else ""
+            ]
+            conclusion.add_run("".join(conclusion_parts))
             
-            # Save to a bytes stream
-            f = io.BytesIO()
+            # Save to a spooled file so large reports do not sit in memory twice
+            f = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE)
             doc.save(f)
-            f.seek(0)
-            return f.read()
+            return _read_spooled(f)
             
         def generate_xlsx():
             """Generate comprehensive Excel report with data from all components"""
+            import xlsxwriter
+            
             # Get all the data we need
-            equipment_df = get_enhanced_equipment_df()
+            equipment_df = _display_equipment(get_enhanced_equipment_df())
             sensor_data = get_sensor_data_summary()
             anomaly_data = get_anomaly_data()
             metrics_data = get_performance_metrics()
             historical_data = get_historical_trends()
             
-            # Create an in-memory output file
-            output = io.BytesIO()
+            # Create an output file that stays in memory until it outgrows the spool size
+            output = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE)
             
-            # Create workbook and worksheet
-            workbook = xlsxwriter.Workbook(output)
+            # Create workbook and worksheet, flushing each row as it is written so memory stays
+            # flat for large equipment tables; every sheet is written top to bottom
+            workbook = xlsxwriter.Workbook(output, _XLSX_WORKBOOK_OPTIONS)
             
             # Create format styles
             title_format = workbook.add_format({
@@ -1140,22 +1921,29 @@ def show_downloads(processed_data, equipment_data):
                 'border': 1
             })
             
+            # Shared formats for labels, notes and numeric readings, created once rather than per cell
+            center_format = workbook.add_format({'align': 'center'})
+            heading_format = workbook.add_format({'bold': True, 'font_size': 14})
+            section_format = workbook.add_format({'bold': True, 'font_size': 12})
+            note_format = workbook.add_format({'italic': True})
+            label_format = workbook.add_format({'bold': True})
+            decimal_format = workbook.add_format({'border': 1, 'num_format': '0.0'})
+            hundredths_format = workbook.add_format({'border': 1, 'num_format': '0.00'})
+            
             # Add Executive Summary worksheet
             ws_summary = workbook.add_worksheet("Executive Summary")
             
             # Add title and report information
             ws_summary.merge_range('A1:D1', f"SmartMaintain - {report_type}", title_format)
-            ws_summary.merge_range('A2:D2', f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", workbook.add_format({'align': 'center'}))
-            ws_summary.merge_range('A3:D3', f"Time Period: {time_period}", workbook.add_format({'align': 'center'}))
+            ws_summary.merge_range('A2:D2', f"Generated: {generated_at}", center_format)
+            ws_summary.merge_range('A3:D3', f"Time Period: {time_period}", center_format)
             
             # Calculate summary statistics
-            critical_count = len([r for _, r in equipment_df.iterrows() if 'maintenance_urgency' in r and r['maintenance_urgency'] == 'Immediate'])
-            warning_count = len([r for _, r in equipment_df.iterrows() if 'maintenance_urgency' in r and r['maintenance_urgency'] == 'Soon'])
-            anomaly_count = len([r for _, r in anomaly_data.iterrows() if r['anomaly_detected'] == True])
+            critical_count, warning_count, anomaly_count = _summary_counts(equipment_df, anomaly_data)
             normal_count = len(equipment_df) - critical_count - warning_count
             
             # Add summary metrics
-            ws_summary.write(5, 0, "Key Metrics", workbook.add_format({'bold': True, 'font_size': 14}))
+            ws_summary.write(5, 0, "Key Metrics", heading_format)
             
             summary_data = [
                 ["Total Equipment", len(equipment_df)],
@@ -1167,14 +1955,14 @@ def show_downloads(processed_data, equipment_data):
             
             # Add performance metrics if available
             if not metrics_data.empty:
-                avg_health = metrics_data['overall_health'].str.rstrip('%').astype(float).mean()
-                avg_oee = metrics_data['oee'].str.rstrip('%').astype(float).mean()
+                avg_health = metrics_data.attrs['average_health']
+                avg_oee = metrics_data.attrs['average_oee']
                 summary_data.append(["Average Equipment Health", f"{avg_health:.1f}%"])
                 summary_data.append(["Average OEE", f"{avg_oee:.1f}%"])
             
             # Write summary data
             for row_idx, (label, value) in enumerate(summary_data):
-                ws_summary.write(row_idx + 7, 0, label, workbook.add_format({'bold': True}))
+                ws_summary.write(row_idx + 7, 0, label, label_format)
                 ws_summary.write(row_idx + 7, 1, value)
             
             # Equipment summary worksheet
@@ -1185,8 +1973,7 @@ def show_downloads(processed_data, equipment_data):
             
             # Add table headers
             headers = ["Machine ID", "Type", "Status", "Failure Probability", "Days to Failure", "Urgency", "Recommendation"]
-            for col, header in enumerate(headers):
-                ws_equipment.write(3, col, header, header_format)
+            ws_equipment.write_row(3, 0, headers, header_format)
                 
             # Set column widths
             ws_equipment.set_column('A:A', 12)
@@ -1197,15 +1984,10 @@ def show_downloads(processed_data, equipment_data):
             ws_equipment.set_column('F:F', 12)
             ws_equipment.set_column('G:G', 50)
             
-            # Add data rows
-            for row_idx, (_, data_row) in enumerate(equipment_df.iterrows()):
-                ws_equipment.write(row_idx + 4, 0, str(data_row['machine_id']), cell_format)
-                ws_equipment.write(row_idx + 4, 1, str(data_row['machine_type']), cell_format)
-                ws_equipment.write(row_idx + 4, 2, str(data_row['status']), cell_format)
-                ws_equipment.write(row_idx + 4, 3, str(data_row.get('failure_probability', 'N/A')), cell_format)
-                ws_equipment.write(row_idx + 4, 4, str(data_row.get('days_to_failure', 'N/A')), cell_format)
-                ws_equipment.write(row_idx + 4, 5, str(data_row.get('maintenance_urgency', 'Unknown')), cell_format)
-                ws_equipment.write(row_idx + 4, 6, str(data_row.get('recommendation', 'No recommendation')), cell_format)
+            # Add data rows, one write_row call per row of pre-formatted text
+            equipment_rows = _table_frame(equipment_df, _EQUIPMENT_TABLE_COLUMNS, _EQUIPMENT_TABLE_DEFAULTS).astype(str).values.tolist()
+            for row_idx, row in enumerate(equipment_rows):
+                ws_equipment.write_row(row_idx + 4, 0, row, cell_format)
             
             # Critical Issues worksheet
             ws_critical = workbook.add_worksheet("Critical Issues")
@@ -1214,49 +1996,41 @@ def show_downloads(processed_data, equipment_data):
             ws_critical.merge_range('A1:D1', "Critical Maintenance Issues", title_format)
             
             # Add critical machines section
-            critical_machines = equipment_df[equipment_df['maintenance_urgency'] == 'Immediate']
+            critical_machines, severe_anomalies = get_critical_items(equipment_df, anomaly_data)
             
             if len(critical_machines) > 0:
-                ws_critical.write(3, 0, "Machines Requiring Immediate Attention:", workbook.add_format({'bold': True, 'font_size': 12}))
+                ws_critical.write(3, 0, "Machines Requiring Immediate Attention:", section_format)
                 
                 # Add critical machine headers
                 critical_headers = ["Machine ID", "Type", "Failure Probability", "Days to Failure", "Recommendation"]
-                for col, header in enumerate(critical_headers):
-                    ws_critical.write(5, col, header, header_format)
+                ws_critical.write_row(5, 0, critical_headers, header_format)
                 
                 # Add critical machines data
-                for row_idx, (_, data_row) in enumerate(critical_machines.iterrows()):
-                    ws_critical.write(row_idx + 6, 0, str(data_row['machine_id']), cell_format)
-                    ws_critical.write(row_idx + 6, 1, str(data_row['machine_type']), cell_format)
-                    ws_critical.write(row_idx + 6, 2, str(data_row.get('failure_probability', 'N/A')), cell_format)
-                    ws_critical.write(row_idx + 6, 3, str(data_row.get('days_to_failure', 'N/A')), cell_format)
-                    ws_critical.write(row_idx + 6, 4, str(data_row.get('recommendation', 'No recommendation')), cell_format)
+                critical_columns = ['machine_id', 'machine_type', 'failure_probability', 'days_to_failure', 'recommendation']
+                critical_rows = _table_frame(critical_machines, critical_columns, _EQUIPMENT_TABLE_DEFAULTS).astype(str).values.tolist()
+                for row_idx, row in enumerate(critical_rows):
+                    ws_critical.write_row(row_idx + 6, 0, row, cell_format)
             else:
-                ws_critical.write(3, 0, "No machines require immediate attention.", workbook.add_format({'italic': True}))
+                ws_critical.write(3, 0, "No machines require immediate attention.", note_format)
             
             # Add anomalies section if available
             if not anomaly_data.empty:
-                severe_anomalies = anomaly_data[anomaly_data['severity'] == 'High']
-                
                 row_offset = 8 + (len(critical_machines) if len(critical_machines) > 0 else 0)
                 
-                ws_critical.write(row_offset, 0, "Significant Anomalies Detected:", workbook.add_format({'bold': True, 'font_size': 12}))
+                ws_critical.write(row_offset, 0, "Significant Anomalies Detected:", section_format)
                 
                 if len(severe_anomalies) > 0:
                     # Add anomaly headers
                     anomaly_headers = ["Machine ID", "Anomaly Score", "Affected Sensors", "Severity", "Detected At"]
-                    for col, header in enumerate(anomaly_headers):
-                        ws_critical.write(row_offset + 2, col, header, header_format)
+                    ws_critical.write_row(row_offset + 2, 0, anomaly_headers, header_format)
                     
                     # Add anomaly data
-                    for row_idx, (_, data_row) in enumerate(severe_anomalies.iterrows()):
-                        ws_critical.write(row_offset + 3 + row_idx, 0, str(data_row['machine_id']), cell_format)
-                        ws_critical.write(row_offset + 3 + row_idx, 1, str(data_row['anomaly_score']), cell_format)
-                        ws_critical.write(row_offset + 3 + row_idx, 2, str(data_row['affected_sensors']), cell_format)
-                        ws_critical.write(row_offset + 3 + row_idx, 3, str(data_row['severity']), cell_format)
-                        ws_critical.write(row_offset + 3 + row_idx, 4, str(data_row.get('detected_at', 'Unknown')), cell_format)
+                    anomaly_columns = ['machine_id', 'anomaly_score', 'affected_sensors', 'severity', 'detected_at']
+                    anomaly_rows = _table_frame(severe_anomalies, anomaly_columns, {'detected_at': 'Unknown'}).astype(str).values.tolist()
+                    for row_idx, row in enumerate(anomaly_rows):
+                        ws_critical.write_row(row_offset + 3 + row_idx, 0, row, cell_format)
                 else:
-                    ws_critical.write(row_offset + 2, 0, "No significant anomalies detected.", workbook.add_format({'italic': True}))
+                    ws_critical.write(row_offset + 2, 0, "No significant anomalies detected.", note_format)
             
             # Performance Metrics worksheet
             if not metrics_data.empty:
@@ -1267,22 +2041,16 @@ def show_downloads(processed_data, equipment_data):
                 
                 # Add metrics table headers
                 metrics_headers = ["Machine ID", "Overall Health", "OEE", "Availability", "Performance", "Quality", "Power Usage"]
-                for col, header in enumerate(metrics_headers):
-                    ws_metrics.write(3, col, header, header_format)
+                ws_metrics.write_row(3, 0, metrics_headers, header_format)
                 
                 # Set column widths
                 for col in range(len(metrics_headers)):
                     ws_metrics.set_column(col, col, 15)
                 
                 # Add metrics data rows
-                for row_idx, (_, data_row) in enumerate(metrics_data.iterrows()):
-                    ws_metrics.write(row_idx + 4, 0, str(data_row['machine_id']), cell_format)
-                    ws_metrics.write(row_idx + 4, 1, str(data_row['overall_health']), cell_format)
-                    ws_metrics.write(row_idx + 4, 2, str(data_row['oee']), cell_format)
-                    ws_metrics.write(row_idx + 4, 3, str(data_row['availability']), cell_format)
-                    ws_metrics.write(row_idx + 4, 4, str(data_row['performance']), cell_format)
-                    ws_metrics.write(row_idx + 4, 5, str(data_row['quality']), cell_format)
-                    ws_metrics.write(row_idx + 4, 6, str(data_row['power_usage']), cell_format)
+                metrics_rows = _table_frame(metrics_data, _METRICS_TABLE_COLUMNS).astype(str).values.tolist()
+                for row_idx, row in enumerate(metrics_rows):
+                    ws_metrics.write_row(row_idx + 4, 0, row, cell_format)
             
             # Sensor Data worksheet if available
             if not sensor_data.empty:
@@ -1293,8 +2061,7 @@ def show_downloads(processed_data, equipment_data):
                 
                 # Add sensor data table headers
                 sensor_headers = ["Machine ID", "Timestamp", "Temperature (°C)", "Vibration (mm/s)", "Power (%)"]
-                for col, header in enumerate(sensor_headers):
-                    ws_sensors.write(3, col, header, header_format)
+                ws_sensors.write_row(3, 0, sensor_headers, header_format)
                 
                 # Set column widths
                 ws_sensors.set_column('A:A', 12)
@@ -1302,26 +2069,27 @@ def show_downloads(processed_data, equipment_data):
                 ws_sensors.set_column('C:E', 15)
                 
                 # Add sensor data rows
-                for row_idx, (_, data_row) in enumerate(sensor_data.iterrows()):
-                    ws_sensors.write(row_idx + 4, 0, str(data_row['machine_id']), cell_format)
-                    ws_sensors.write(row_idx + 4, 1, str(data_row.get('timestamp', 'Unknown')), cell_format)
+                sensor_rows = _row_tuples(
+                    sensor_data, ['machine_id', 'timestamp', 'temperature', 'vibration', 'power'], 
+                    {'timestamp': 'Unknown', 'temperature': None, 'vibration': None, 'power': None}
+                )
+                for row_idx, (machine_id, timestamp, temp_value, vib_value, power_value) in enumerate(sensor_rows):
+                    ws_sensors.write(row_idx + 4, 0, str(machine_id), cell_format)
+                    ws_sensors.write(row_idx + 4, 1, str(timestamp), cell_format)
                     
                     # Format numeric values properly
-                    temp_value = data_row.get('temperature', None)
                     if temp_value is not None:
-                        ws_sensors.write(row_idx + 4, 2, float(temp_value), workbook.add_format({'border': 1, 'num_format': '0.0'}))
+                        ws_sensors.write(row_idx + 4, 2, float(temp_value), decimal_format)
                     else:
                         ws_sensors.write(row_idx + 4, 2, 'N/A', cell_format)
                         
-                    vib_value = data_row.get('vibration', None)
                     if vib_value is not None:
-                        ws_sensors.write(row_idx + 4, 3, float(vib_value), workbook.add_format({'border': 1, 'num_format': '0.00'}))
+                        ws_sensors.write(row_idx + 4, 3, float(vib_value), hundredths_format)
                     else:
                         ws_sensors.write(row_idx + 4, 3, 'N/A', cell_format)
                         
-                    power_value = data_row.get('power', None)
                     if power_value is not None:
-                        ws_sensors.write(row_idx + 4, 4, float(power_value), workbook.add_format({'border': 1, 'num_format': '0.0'}))
+                        ws_sensors.write(row_idx + 4, 4, float(power_value), decimal_format)
                     else:
                         ws_sensors.write(row_idx + 4, 4, 'N/A', cell_format)
             
@@ -1343,8 +2111,7 @@ def show_downloads(processed_data, equipment_data):
                     available_headers = [trend_headers[i] for i in header_indices]
                     
                     # Add headers
-                    for col, header in enumerate(available_headers):
-                        ws_historical.write(3, col, header, header_format)
+                    ws_historical.write_row(3, 0, available_headers, header_format)
                     
                     # Set column widths
                     ws_historical.set_column('A:A', 15)  # Date
@@ -1352,36 +2119,31 @@ def show_downloads(processed_data, equipment_data):
                     ws_historical.set_column('C:E', 18)  # Metrics
                     
                     # Add historical data rows
-                    for row_idx, data_row in enumerate(historical_data.iterrows()):
-                        _, row = data_row
-                        
-                        # Write each column if it exists
-                        col_idx = 0
-                        for col_name in available_columns:
-                            if col_name == 'date':
-                                ws_historical.write(row_idx + 4, col_idx, str(row[col_name]), cell_format)
-                            elif col_name == 'machine_id':
-                                ws_historical.write(row_idx + 4, col_idx, str(row[col_name]), cell_format)
-                            elif col_name in row and not pd.isna(row[col_name]):
-                                num_format = {'border': 1, 'num_format': '0.00' if col_name == 'vibration' else '0.0'}
-                                ws_historical.write(row_idx + 4, col_idx, float(row[col_name]), workbook.add_format(num_format))
+                    for row_idx, row in enumerate(_row_tuples(historical_data, available_columns)):
+                        # Write each available column
+                        for col_idx, (col_name, value) in enumerate(zip(available_columns, row)):
+                            if col_name in ('date', 'machine_id'):
+                                ws_historical.write(row_idx + 4, col_idx, str(value), cell_format)
+                            elif not pd.isna(value):
+                                num_format = hundredths_format if col_name == 'vibration' else decimal_format
+                                ws_historical.write(row_idx + 4, col_idx, float(value), num_format)
                             else:
                                 ws_historical.write(row_idx + 4, col_idx, 'N/A', cell_format)
-                            col_idx += 1
                 else:
-                    ws_historical.write(3, 0, "Historical trend data is not in the expected format.", workbook.add_format({'italic': True}))
+                    ws_historical.write(3, 0, "Historical trend data is not in the expected format.", note_format)
             
             # Close workbook
             workbook.close()
             
             # Get output value
-            output.seek(0)
-            return output.getvalue()
+            return _read_spooled(output)
             
         def generate_image():
             """Generate a comprehensive JPG image report with data from all components"""
+            from PIL import Image, ImageDraw
+            
             # Get all the data we need
-            equipment_df = get_enhanced_equipment_df()
+            equipment_df = _display_equipment(get_enhanced_equipment_df())
             sensor_data = get_sensor_data_summary()
             anomaly_data = get_anomaly_data()
             metrics_data = get_performance_metrics()
@@ -1391,24 +2153,20 @@ def show_downloads(processed_data, equipment_data):
             img = Image.new('RGB', (width, height), color='white')
             draw = ImageDraw.Draw(img)
             
-            # Try to load a font, use default if not available
-            try:
-                title_font = ImageFont.truetype("Arial", 36)
-                header_font = ImageFont.truetype("Arial", 28)
-                subheader_font = ImageFont.truetype("Arial", 24)
-                normal_font = ImageFont.truetype("Arial", 18)
-                small_font = ImageFont.truetype("Arial", 14)
-            except IOError:
-                title_font = ImageFont.load_default()
-                header_font = ImageFont.load_default()
-                subheader_font = header_font
-                normal_font = ImageFont.load_default()
-                small_font = normal_font
+            # Fonts are cached across reports; missing fonts fall back to the default
+            title_font = _load_report_font("Arial", 36)
+            normal_font = _load_report_font("Arial", 18)
+            small_font = _load_report_font("Arial", 14)
+            
+            def paste_label(xy, text, size):
+                """Paste a cached rendering of a static label"""
+                label = _render_report_label(text, "Arial", size)
+                img.paste(label, xy, label)
             
             # Add title and header information
             title = f"SmartMaintain - {report_type}"
             draw.text((width//2 - 250, 30), title, fill="black", font=title_font)
-            draw.text((width//2 - 200, 80), f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", fill="black", font=normal_font)
+            draw.text((width//2 - 200, 80), f"Generated: {generated_at}", fill="black", font=normal_font)
             draw.text((width//2 - 100, 110), f"Time Period: {time_period}", fill="black", font=normal_font)
             
             # Draw a line below the header
@@ -1416,13 +2174,11 @@ def show_downloads(processed_data, equipment_data):
             
             # EXECUTIVE SUMMARY SECTION
             current_y = 180
-            draw.text((50, current_y), "EXECUTIVE SUMMARY", fill="black", font=header_font)
+            paste_label((50, current_y), "EXECUTIVE SUMMARY", 28)
             current_y += 50
             
             # Calculate summary statistics
-            critical_count = len([r for _, r in equipment_df.iterrows() if 'maintenance_urgency' in r and r['maintenance_urgency'] == 'Immediate'])
-            warning_count = len([r for _, r in equipment_df.iterrows() if 'maintenance_urgency' in r and r['maintenance_urgency'] == 'Soon'])
-            anomaly_count = len([r for _, r in anomaly_data.iterrows() if r['anomaly_detected'] == True])
+            critical_count, warning_count, anomaly_count = _summary_counts(equipment_df, anomaly_data)
             
             # Draw key metrics
             draw.text((70, current_y), f"• Total Equipment: {len(equipment_df)}", fill="black", font=normal_font)
@@ -1437,8 +2193,8 @@ def show_downloads(processed_data, equipment_data):
             # Add key performance metrics if available
             if not metrics_data.empty:
                 try:
-                    avg_health = metrics_data['overall_health'].str.rstrip('%').astype(float).mean()
-                    avg_oee = metrics_data['oee'].str.rstrip('%').astype(float).mean()
+                    avg_health = metrics_data.attrs['average_health']
+                    avg_oee = metrics_data.attrs['average_oee']
                     
                     draw.text((70, current_y), f"• Average Equipment Health: {avg_health:.1f}%", fill="black", font=normal_font)
                     current_y += 30
@@ -1449,148 +2205,98 @@ def show_downloads(processed_data, equipment_data):
                     pass
             
             # MAINTENANCE DISTRIBUTION CHART
-            draw.text((50, current_y), "MAINTENANCE URGENCY DISTRIBUTION", fill="black", font=header_font)
+            paste_label((50, current_y), "MAINTENANCE URGENCY DISTRIBUTION", 28)
             current_y += 50
             
             # Count machines by urgency
-            urgency_counts = {
-                'Immediate': 0,
-                'Soon': 0,
-                'Planned': 0,
-                'Normal': 0
-            }
-            
-            for _, row in equipment_df.iterrows():
-                urgency = row.get('maintenance_urgency', 'Unknown')
-                if urgency in urgency_counts:
-                    urgency_counts[urgency] += 1
-            
-            # Colors for different urgency levels
-            colors = {
-                'Immediate': (255, 0, 0),      # Red
-                'Soon': (255, 165, 0),         # Orange
-                'Planned': (255, 255, 0),      # Yellow
-                'Normal': (0, 128, 0)          # Green
-            }
-            
-            # Calculate the maximum value for scaling
-            max_value = max(urgency_counts.values()) if urgency_counts.values() else 1
+            counts = _urgency_counts(equipment_df)
+            urgency_counts = tuple((k, int(counts.get(k, 0))) for k in _URGENCY_COLORS)
             
-            # Bar chart dimensions
-            bar_width = 120
-            bar_spacing = 60
-            bar_height_scale = 200 / max_value  # Scale bars to fit in 200px height
-            bar_start_x = 150
+            # Paste the cached chart rendering; it is only redrawn when the counts change
+            img.paste(_render_urgency_chart(urgency_counts, width), (0, current_y))
             bar_base_y = current_y + 250
             
-            # Draw bars
-            x = bar_start_x
-            for category, count in urgency_counts.items():
-                bar_height = count * bar_height_scale
-                
-                # Draw the bar
-                draw.rectangle(
-                    [(x, bar_base_y - bar_height), (x + bar_width, bar_base_y)],
-                    fill=colors.get(category, (200, 200, 200)),
-                    outline=(0, 0, 0)  # Black outline
-                )
-                
-                # Draw the category label
-                draw.text((x + bar_width//2 - 35, bar_base_y + 10), category, fill="black", font=normal_font)
-                
-                # Draw the count on top of the bar
-                draw.text((x + bar_width//2 - 10, bar_base_y - bar_height - 25), str(count), fill="black", font=normal_font)
-                
-                x += bar_width + bar_spacing
-            
-            # Draw a horizontal line at the base of the bars
-            draw.line([(100, bar_base_y), (width-100, bar_base_y)], fill="black", width=2)
-            
             # Update current position after chart
             current_y = bar_base_y + 60
             
             # CRITICAL ISSUES SECTION
-            draw.text((50, current_y), "CRITICAL ISSUES", fill="black", font=header_font)
+            paste_label((50, current_y), "CRITICAL ISSUES", 28)
             current_y += 50
             
-            # List machines with immediate maintenance needs
-            critical_machines = equipment_df[equipment_df['maintenance_urgency'] == 'Immediate']
+            # List machines with immediate maintenance needs; only row positions are
+            # needed here, so the filtered frame is never built
+            critical_idx = np.flatnonzero(equipment_df['maintenance_urgency'].eq('Immediate').to_numpy())
             
-            if len(critical_machines) > 0:
-                for idx, (_, row) in enumerate(critical_machines.iterrows()):
-                    if idx >= 3:  # Only show first 3 to avoid overcrowding
-                        draw.text((70, current_y), "... more critical machines ...", fill="black", font=normal_font)
-                        current_y += 30
-                        break
-                        
-                    machine_text = f"{row['machine_id']} ({row['machine_type']}): {row.get('failure_probability', 'N/A')} failure prob."
+            if critical_idx.size > 0:
+                # Only show first 3 to avoid overcrowding
+                top_critical = equipment_df[['machine_id', 'machine_type', 'failure_probability']].iloc[critical_idx[:3]]
+                for machine_id, machine_type, failure_probability in top_critical.itertuples(index=False, name=None):
+                    machine_text = f"{machine_id} ({machine_type}): {failure_probability} failure prob."
                     draw.text((70, current_y), f"• {machine_text}", fill=(255, 0, 0), font=normal_font)
                     current_y += 30
+                
+                if critical_idx.size > 3:
+                    draw.text((70, current_y), "... more critical machines ...", fill="black", font=normal_font)
+                    current_y += 30
             else:
-                draw.text((70, current_y), "No machines require immediate attention", fill="black", font=normal_font)
+                paste_label((70, current_y), "No machines require immediate attention", 18)
                 current_y += 30
             
             # Add some space
             current_y += 20
             
             # ANOMALY DETECTION SECTION
-            draw.text((50, current_y), "ANOMALY DETECTION", fill="black", font=header_font)
+            paste_label((50, current_y), "ANOMALY DETECTION", 28)
             current_y += 50
             
             # Show anomalies if any
             if not anomaly_data.empty:
-                severe_anomalies = anomaly_data[anomaly_data['severity'] == 'High']
-                if len(severe_anomalies) > 0:
-                    for idx, (_, row) in enumerate(severe_anomalies.iterrows()):
-                        if idx >= 3:  # Only show first 3
-                            draw.text((70, current_y), "... more anomalies detected ...", fill="black", font=normal_font)
-                            current_y += 30
-                            break
-                            
-                        anomaly_text = f"{row['machine_id']}: Score {row['anomaly_score']}, {row['affected_sensors']}"
+                severe_idx = np.flatnonzero(anomaly_data['severity'].eq('High').to_numpy())
+                if severe_idx.size > 0:
+                    # Only show first 3
+                    top_anomalies = anomaly_data[['machine_id', 'anomaly_score', 'affected_sensors']].iloc[severe_idx[:3]]
+                    for machine_id, anomaly_score, affected_sensors in top_anomalies.itertuples(index=False, name=None):
+                        anomaly_text = f"{machine_id}: Score {anomaly_score}, {affected_sensors}"
                         draw.text((70, current_y), f"• {anomaly_text}", fill=(255, 0, 0), font=normal_font)
                         current_y += 30
+                    
+                    if severe_idx.size > 3:
+                        draw.text((70, current_y), "... more anomalies detected ...", fill="black", font=normal_font)
+                        current_y += 30
                 else:
-                    draw.text((70, current_y), "No significant anomalies detected", fill="black", font=normal_font)
+                    paste_label((70, current_y), "No significant anomalies detected", 18)
                     current_y += 30
             
             # Add some space
             current_y += 20
             
             # SENSOR READINGS SECTION
-            draw.text((50, current_y), "LATEST SENSOR READINGS", fill="black", font=header_font)
+            paste_label((50, current_y), "LATEST SENSOR READINGS", 28)
             current_y += 50
             
             # Show some sensor data if available
             if not sensor_data.empty:
                 # Table headers
                 header_x = [70, 200, 350, 500, 650]
-                headers = ["Machine ID", "Time", "Temperature", "Vibration", "Power"]
+                headers = ("Machine ID", "Time", "Temperature", "Vibration", "Power")
                 
-                # Draw header row
-                for i, header in enumerate(headers):
-                    draw.text((header_x[i], current_y), header, fill="black", font=subheader_font)
+                # Paste the cached header row and separator line
+                header_strip = _render_table_header(headers, tuple(x - 70 for x in header_x), 24, 730)
+                img.paste(header_strip, (70, current_y), header_strip)
                 
                 current_y += 40
                 
-                # Draw separator line
-                draw.line([(70, current_y - 10), (800, current_y - 10)], fill="black", width=1)
-                
-                # Show a few rows of data
-                rows_to_show = min(3, len(sensor_data))
-                for i in range(rows_to_show):
-                    row = sensor_data.iloc[i]
-                    
-                    # Extract and format data
-                    machine_id = str(row['machine_id'])
-                    timestamp = str(row.get('timestamp', 'Unknown'))
-                    if len(timestamp) > 16:  # Truncate timestamp if too long
-                        timestamp = timestamp[:16]
-                    
-                    temp = f"{row.get('temperature', 0):.1f}°C"
-                    vibration = f"{row.get('vibration', 0):.2f} mm/s" 
-                    power = f"{row.get('power', 0):.1f}%"
-                    
+                # Format a few rows of data as display strings in one pass per column
+                rows = sensor_data.head(3)
+                display_rows = pd.DataFrame({
+                    'machine_id': rows['machine_id'].astype(str),
+                    'timestamp': rows['timestamp'].astype(str).str.slice(0, 16),  # Truncate timestamp if too long
+                    'temperature': _format_fixed(rows['temperature'].fillna(0), 1, '°C'),
+                    'vibration': _format_fixed(rows['vibration'].fillna(0), 2, ' mm/s'),
+                    'power': _format_fixed(rows['power'].fillna(0), 1, '%')
+                })
+                
+                for machine_id, timestamp, temp, vibration, power in display_rows.itertuples(index=False, name=None):
                     # Draw row data
                     draw.text((header_x[0], current_y), machine_id, fill="black", font=normal_font)
                     draw.text((header_x[1], current_y), timestamp, fill="black", font=normal_font)
@@ -1613,229 +2319,99 @@ def show_downloads(processed_data, equipment_data):
             
             # Convert to bytes
             img_byte_array = io.BytesIO()
-            img.save(img_byte_array, format='JPEG', quality=95)
-            img_byte_array.seek(0)
+            img.save(img_byte_array, format='JPEG', quality=85, optimize=True)
             return img_byte_array.getvalue()
         
-        # Generate the appropriate file based on selected format
-        mime_types = {
-            'csv': "text/csv",
-            'pdf': "application/pdf",
-            'doc': "application/msword",
-            'docx': "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            'xls': "application/vnd.ms-excel",
-            'xlsx': "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            'rtf': "application/rtf",
-            'txt': "text/plain",
-            'jpg': "image/jpeg",
-            'jpeg': "image/jpeg",
-            'tiff': "image/tiff",
-            'tif': "image/tiff",
-            'xps': "application/oxps",
-            'zip': "application/zip"
-        }
-        
-        # Special SR&ED report generation function
-        def generate_sred_documentation():
-            """Generate SR&ED-compliant technical documentation package with enhanced formatting"""
-            # Create a ZIP file with multiple document types
+        def generate_all_formats():
+            """Bundle the report in every document format, generating the formats in parallel"""
+            # Build the shared frames up front so the worker threads only read them from the cache
+            for get_frame in (get_enhanced_equipment_df, get_sensor_data_summary, get_anomaly_data, 
+                              get_performance_metrics, get_historical_trends):
+                get_frame()
+            
+            report_name = report_type.lower().replace(" ", "_")
+            bundle_generators = {
+                f"{report_name}_csv.zip": generate_csv,
+                f"{report_name}.pdf": generate_pdf,
+                f"{report_name}.docx": generate_docx,
+                f"{report_name}.xlsx": generate_xlsx,
+                f"{report_name}.txt": generate_txt
+            }
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = {filename: executor.submit(generator) 
+                           for filename, generator in bundle_generators.items()}
+            
+            # Only the text report is deflated; the other formats are already compressed containers
             zip_buffer = io.BytesIO()
+            with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=3) as zipf:
+                for filename, future in futures.items():
+                    compress_type = zipfile.ZIP_DEFLATED if filename.endswith('.txt') else zipfile.ZIP_STORED
+                    _write_zip_entry(zipf, filename, future.result(), compress_type)
             
-            with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                # 1. Create enhanced PDF report specifically formatted for SR&ED
-                # Build a custom PDF with proper formatting for SR&ED documentation
-                pdf = FPDF()
-                
-                # Add a cover page
-                pdf.add_page()
-                pdf.set_fill_color(240, 240, 240)  # Light gray background
-                pdf.rect(0, 0, 210, 297, 'F')  # Fill page with background
-                
-                # Title block
-                pdf.set_font("Arial", "B", 24)
-                pdf.set_text_color(0, 51, 102)  # Navy blue
-                pdf.cell(0, 40, "", 0, 1)  # Spacing
-                pdf.cell(0, 20, "SR&ED Technical Documentation", 0, 1, "C")
-                
-                # Subtitle
-                pdf.set_font("Arial", "I", 16)
-                pdf.set_text_color(102, 102, 102)  # Dark gray
-                pdf.cell(0, 15, "Predictive Maintenance Platform", 0, 1, "C")
-                
-                # Date and confidentiality notice
-                pdf.set_font("Arial", "", 12)
-                pdf.set_text_color(0, 0, 0)  # Black
-                pdf.cell(0, 40, "", 0, 1)  # Spacing
-                pdf.cell(0, 10, f"Generated: {datetime.now().strftime('%B %d, %Y')}", 0, 1, "C")
-                pdf.cell(0, 10, "CONFIDENTIAL", 0, 1, "C")
-                
-                pdf.cell(0, 60, "", 0, 1)  # Spacing
-                
-                # Company info
-                pdf.set_font("Arial", "B", 14)
-                pdf.cell(0, 10, "Prepared By:", 0, 1, "C")
-                pdf.set_font("Arial", "", 12)
-                pdf.cell(0, 10, "Smart Manufacturing Technologies", 0, 1, "C")
-                
-                # Add table of contents
-                pdf.add_page()
-                pdf.set_font("Arial", "B", 18)
-                pdf.set_text_color(0, 51, 102)  # Navy blue
-                pdf.cell(0, 20, "Table of Contents", 0, 1, "L")
-                pdf.line(10, 30, 200, 30)
-                
-                # TOC items
-                pdf.set_font("Arial", "", 12)
-                pdf.set_text_color(0, 0, 0)  # Black
-                toc_items = [
-                    "1. Project Overview",
-                    "2. Technical Uncertainties",
-                    "3. Systematic Investigation",
-                    "4. Technical Advancement",
-                    "5. Project Results",
-                    "6. Experimental Data",
-                    "7. Financial Information",
-                    "8. Supporting Evidence"
-                ]
-                
-                y_pos = 40
-                for item in toc_items:
-                    pdf.set_xy(20, y_pos)
-                    pdf.cell(0, 10, item, 0, 1, "L")
-                    y_pos += 15
-                
-                # Project Overview Section
-                pdf.add_page()
-                pdf.set_font("Arial", "B", 18)
-                pdf.set_text_color(0, 51, 102)  # Navy blue
-                pdf.cell(0, 15, "1. Project Overview", 0, 1, "L")
-                pdf.line(10, 25, 200, 25)
-                
-                pdf.set_font("Arial", "", 11)
-                pdf.set_text_color(0, 0, 0)  # Black
-                pdf.multi_cell(0, 8, """This document outlines the scientific research and experimental development activities undertaken in the development of the Smart Manufacturing Predictive Maintenance Platform.
-
-The project focuses on developing innovative approaches to predictive maintenance for manufacturing equipment through advanced data analytics, machine learning, and IoT sensor integration. This work represents a significant advancement beyond routine engineering and involves overcoming specific technological uncertainties through systematic investigation.
-
-SR&ED activities were conducted from January 2024 through December 2024, involving a multidisciplinary team of data scientists, software engineers, and manufacturing domain experts. This documentation package provides comprehensive evidence of the technological advancement achieved and the systematic approach used to address technical challenges.""")
-                
-                # Technical Uncertainties Section
-                pdf.add_page()
-                pdf.set_font("Arial", "B", 18)
-                pdf.set_text_color(0, 51, 102)  # Navy blue
-                pdf.cell(0, 15, "2. Technical Uncertainties", 0, 1, "L")
-                pdf.line(10, 25, 200, 25)
-                
-                pdf.set_font("Arial", "", 11)
-                pdf.multi_cell(0, 8, """The project addressed several significant technological uncertainties that could not be resolved through routine engineering or the application of standard techniques:""")
-                
-                # Uncertainties in bullet points with enhanced formatting
-                uncertainties = [
-                    {"title": "Real-time Processing of High-Volume Sensor Data", 
-                     "desc": "Developing methods to process and analyze terabytes of streaming sensor data without introducing latency that would compromise the real-time nature of the predictive system."},
-                    {"title": "Reliable Anomaly Detection Algorithms", 
-                     "desc": "Creating algorithms capable of distinguishing between normal variations in equipment operation and early indicators of potential failures, with sufficient sensitivity and specificity."},
-                    {"title": "Integration of Heterogeneous Data Sources", 
-                     "desc": "Combining data from diverse sensors with varying reliability, sampling rates, and formats into a coherent analytical framework."},
-                    {"title": "Predictive Model Accuracy", 
-                     "desc": "Developing models capable of predicting equipment failures with sufficient accuracy and lead time to enable preventative maintenance while minimizing false alarms."}
-                ]
-                
-                y_pos = 40
-                for uncertainty in uncertainties:
-                    pdf.set_font("Arial", "B", 12)
-                    pdf.set_xy(15, y_pos)
-                    pdf.cell(0, 8, f"- {uncertainty['title']}", 0, 1, "L")
-                    pdf.set_font("Arial", "", 11)
-                    pdf.set_xy(20, y_pos + 8)
-                    pdf.multi_cell(170, 6, uncertainty['desc'])
-                    y_pos += 25
-                
-                # Add experimental results and methodology section with professional formatting
-                pdf.add_page()
-                pdf.set_font("Arial", "B", 18)
-                pdf.set_text_color(0, 51, 102)  # Navy blue
-                pdf.cell(0, 15, "6. Experimental Data", 0, 1, "L")
-                pdf.line(10, 25, 200, 25)
-                
-                pdf.set_font("Arial", "B", 14)
-                pdf.set_text_color(0, 0, 0)  # Black
-                pdf.cell(0, 15, "Experiment 1: Anomaly Detection Algorithm Optimization", 0, 1, "L")
-                
-                # Create a table-like structure for experiment data
-                pdf.set_fill_color(240, 240, 240)  # Light gray for table headers
-                pdf.set_font("Arial", "B", 11)
-                pdf.cell(40, 10, "Component", 1, 0, "L", True)
-                pdf.cell(140, 10, "Details", 1, 1, "L", True)
-                
-                # Table rows
-                pdf.set_font("Arial", "", 10)
-                components = [
-                    {"name": "Hypothesis", "value": "Modified isolation forest algorithms can improve anomaly detection accuracy in manufacturing sensor data without increasing computational complexity."},
-                    {"name": "Methodology", "value": "Comparative analysis of 5 algorithm variations using cross-validation on historical failure data. Each algorithm was tested against 3 different data sets representing varied manufacturing environments."},
-                    {"name": "Control Group", "value": "Standard isolation forest implementation with default parameters."},
-                    {"name": "Variables", "value": "1. Contamination parameter optimization\n2. Feature selection methodology\n3. Ensemble composition\n4. Distance metric selection\n5. Adaptive threshold mechanisms"},
-                    {"name": "Results", "value": "23.4% improvement in precision, 18.7% improvement in recall compared to baseline algorithms, with 15% reduction in computational overhead."},
-                    {"name": "Conclusions", "value": "Modified algorithm demonstrates significant improvement over baseline while maintaining real-time processing capabilities."}
-                ]
-                
-                for component in components:
-                    # Multi-cell approach for better wrapping of content
-                    # First cell (component name)
-                    pdf.cell(40, 10, component["name"], 1, 0, "L")
-                    
-                    # Calculate required height for description text
-                    pdf.set_xy(pdf.get_x(), pdf.get_y())
-                    start_y = pdf.get_y()
-                    pdf.multi_cell(140, 6, component["value"], 0, "L")
-                    end_y = pdf.get_y()
-                    height = end_y - start_y
-                    
-                    # Return to starting position and draw the complete cell with border
-                    pdf.set_xy(pdf.get_x() - 140, start_y)
-                    pdf.multi_cell(140, height, component["value"], 1, "L")
+            return zip_buffer.getvalue()
+        
+        # Generator for each selectable format
+        report_generators = {
+            'csv': generate_csv,
+            'pdf': generate_pdf,
+            'doc': generate_docx,
+            'docx': generate_docx,
+            'rtf': generate_docx,
+            'xls': generate_xlsx,
+            'xlsx': generate_xlsx,
+            'txt': generate_txt,
+            'jpg': generate_image,
+            'jpeg': generate_image,
+            'tiff': generate_image,
+            'tif': generate_image,
+            'xps': generate_pdf,
+            'zip': generate_all_formats
+        }
+        
+        # Special SR&ED report generation function
+        def generate_sred_documentation():
+            """Generate SR&ED-compliant technical documentation package with enhanced formatting"""
+            from utils.visualization_generator import get_all_visualization_data
+            
+            # Format the generation date once so the PDF and DOCX always agree
+            generated_date = now.strftime('%B %d, %Y')
+            
+            # Create a ZIP file with multiple document types
+            zip_buffer = io.BytesIO()
+            
+            # The CSV exports don't depend on the PDF, so build them in the background; leaving the
+            # block joins the worker even if writing the package fails. Text entries are deflated;
+            # PDF, PNG and DOCX payloads are already compressed and stored as-is
+            with ThreadPoolExecutor(max_workers=1) as executor, \
+                    zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=3) as zipf:
+                csv_future = executor.submit(generate_csv)
                 
-                # Convert the PDF to bytes for the ZIP file
-                pdf_content = pdf.output(dest='S').encode('latin1')
-                zipf.writestr('SR&ED_Technical_Report.pdf', pdf_content)
+                # 1. Create enhanced PDF report specifically formatted for SR&ED
+                pdf_content = _render_sred_pdf(generated_date)
+                _write_zip_entry(zipf, 'SR&ED_Technical_Report.pdf', pdf_content, zipfile.ZIP_STORED)
                 
                 # 2. Add CSV data exports in a data folder
-                csv_data = generate_csv()  # Get the CSV data ZIP
+                csv_data = csv_future.result()  # Get the CSV data ZIP
                 
                 # Extract CSV files from the nested ZIP and add them directly
                 with zipfile.ZipFile(io.BytesIO(csv_data), 'r') as nested_zip:
-                    for csv_file in nested_zip.namelist():
-                        zipf.writestr(f"Data_Evidence/{csv_file}", nested_zip.read(csv_file))
-                
-                # Add visualizations to the package
-                from utils.visualization_generator import get_all_visualization_data
-                
-                # Get all visualizations
+                    for info in nested_zip.infolist():
+                        # Stream each entry across in chunks instead of holding it in memory; ZipFile.open
+                        # has no level argument, so these entries use zlib's default level
+                        target = _zip_entry(f"Data_Evidence/{info.filename}")
+                        with nested_zip.open(info) as src, zipf.open(target, 'w', force_zip64=True) as dst:
+                            shutil.copyfileobj(src, dst, 1024 * 1024)
+                
+                # Add visualizations to the package; matplotlib's pyplot state is not thread-safe,
+                # so they are rendered on this thread (and cached after the first call)
                 visualizations = get_all_visualization_data()
                 
                 # Add each visualization to the zip file
                 for filename, image_data in visualizations.items():
-                    zipf.writestr(f"Visualizations/{filename}", image_data)
+                    _write_zip_entry(zipf, f"Visualizations/{filename}", image_data, zipfile.ZIP_STORED)
                 
                 # Add a visualization index file
-                visualization_index = """
-# SR&ED Technical Documentation - Visualizations
-
-This directory contains data visualizations that illustrate the technical advancement, 
-experimental results, and systematic investigation methodology for the SR&ED project.
-
-## Available Visualizations
-
-1. **experiment_timeline.png** - Timeline showing the systematic investigation process over 12 months
-2. **anomaly_detection_comparison.png** - Performance comparison of anomaly detection algorithm variations
-3. **prediction_lead_time.png** - Comparison of failure prediction lead times across different model types
-4. **research_methodology.png** - Diagram of the systematic research methodology
-5. **technical_advancement.png** - Chart illustrating technical advancements achieved through SR&ED activities
-
-These visualizations serve as evidence of the systematic investigation process 
-and technological advancement achieved during the SR&ED project.
-"""
-                zipf.writestr("Visualizations/README.md", visualization_index)
+                _write_zip_entry(zipf, "Visualizations/README.md", _SRED_VISUALIZATIONS_README_MD)
                 
                 # Add version tracking information
                 from utils.version_tracker import add_version_info, generate_version_history_file
@@ -1878,338 +2454,59 @@ Maintaining proper version control of technical documentation is essential for S
 as it demonstrates the systematic investigation process and provides evidence of the 
 technological advancement achieved throughout the project.
 """
-                zipf.writestr("version_info.md", version_metadata)
+                _write_zip_entry(zipf, "version_info.md", version_metadata)
                 
                 # Generate and add version history
                 version_history = generate_version_history_file()
-                zipf.writestr("Visualizations/version_history.md", version_history)
+                _write_zip_entry(zipf, "Visualizations/version_history.md", version_history)
                 
                 # 3. Create a professional DOCX version of the technical narrative
-                doc = Document()
-                
-                # Add a styled title page
-                doc.add_heading('SR&ED Technical Documentation', 0)
-                doc.add_paragraph('Predictive Maintenance Platform', 'Subtitle')
-                
-                # Add date and confidentiality
-                p = doc.add_paragraph()
-                p.add_run(f'Generated: {datetime.now().strftime("%B %d, %Y")}').italic = True
-                doc.add_paragraph('CONFIDENTIAL DOCUMENTATION', 'Quote')
-                doc.add_paragraph('Prepared By: Smart Manufacturing Technologies')
-                
-                # Add table of contents marker
-                doc.add_paragraph('Table of Contents', 'TOC Heading')
-                doc.add_paragraph('_TOC_\n\n')  # Placeholder for TOC
-                
-                # Add project overview
-                doc.add_heading('1. Project Overview', 1)
-                doc.add_paragraph("""This document outlines the scientific research and experimental development activities 
-undertaken in the development of the Smart Manufacturing Predictive Maintenance Platform.
-
-The project focuses on developing innovative approaches to predictive maintenance for manufacturing equipment 
-through advanced data analytics, machine learning, and IoT sensor integration. This work represents a significant 
-advancement beyond routine engineering and involves overcoming specific technological uncertainties through systematic investigation.
-
-SR&ED activities were conducted from January 2024 through December 2024, involving a multidisciplinary team of 
-data scientists, software engineers, and manufacturing domain experts. This documentation package provides 
-comprehensive evidence of the technological advancement achieved and the systematic approach used to address technical challenges.""")
-                
-                # Add technical uncertainties section with styled formatting
-                doc.add_heading('2. Technical Uncertainties Addressed', 1)
-                doc.add_paragraph("""The project addressed several significant technological uncertainties that could not be 
-resolved through routine engineering or the application of standard techniques:""")
-                
-                # Add styled bullet points
-                uncertainties = [
-                    {"title": "Real-time Processing of High-Volume Sensor Data", 
-                     "desc": "Developing methods to process and analyze terabytes of streaming sensor data without introducing latency that would compromise the real-time nature of the predictive system."},
-                    {"title": "Reliable Anomaly Detection Algorithms", 
-                     "desc": "Creating algorithms capable of distinguishing between normal variations in equipment operation and early indicators of potential failures, with sufficient sensitivity and specificity."},
-                    {"title": "Integration of Heterogeneous Data Sources", 
-                     "desc": "Combining data from diverse sensors with varying reliability, sampling rates, and formats into a coherent analytical framework."},
-                    {"title": "Predictive Model Accuracy", 
-                     "desc": "Developing models capable of predicting equipment failures with sufficient accuracy and lead time to enable preventative maintenance while minimizing false alarms."}
-                ]
-                
-                for uncertainty in uncertainties:
-                    p = doc.add_paragraph(style='List Bullet')
-                    p.add_run(f"{uncertainty['title']}: ").bold = True
-                    p.add_run(uncertainty['desc'])
-                
-                # Add systematic investigation section
-                doc.add_heading('3. Systematic Investigation', 1)
-                doc.add_paragraph("""Our research methodology followed a rigorous systematic investigation process:""")
-                
-                steps = [
-                    {"step": "Hypothesis formulation", 
-                     "desc": "Development of testable hypotheses regarding potential approaches to failure prediction models."},
-                    {"step": "Experimental design", 
-                     "desc": "Creation of controlled testing environments with appropriate data collection protocols."},
-                    {"step": "Algorithm development", 
-                     "desc": "Implementation of various algorithms with iterative testing and refinement."},
-                    {"step": "Validation", 
-                     "desc": "Comprehensive validation against historical failure data with statistical analysis."},
-                    {"step": "Implementation", 
-                     "desc": "Integration of successful approaches with continuous monitoring and improvement."}
-                ]
-                
-                for i, step in enumerate(steps, 1):
-                    p = doc.add_paragraph(style='List Number')
-                    p.add_run(f"{step['step']}: ").bold = True
-                    p.add_run(step['desc'])
-                
-                # Save the document to the ZIP file
-                docx_buffer = io.BytesIO()
-                doc.save(docx_buffer)
-                docx_buffer.seek(0)
-                zipf.writestr('SR&ED_Documentation/Technical_Narrative.docx', docx_buffer.getvalue())
+                docx_content = _render_sred_narrative_docx(generated_date)
+                _write_zip_entry(zipf, 'SR&ED_Documentation/Technical_Narrative.docx', docx_content, zipfile.ZIP_STORED)
                 
                 # 4. Add technical narrative in markdown format
-                sred_template = """
-# SR&ED Technical Documentation
-
-## 1. Project Overview
-This document outlines the scientific research and experimental development activities 
-undertaken in the development of the Smart Manufacturing Predictive Maintenance Platform.
-
-The project focuses on developing innovative approaches to predictive maintenance for manufacturing equipment 
-through advanced data analytics, machine learning, and IoT sensor integration. This work represents a significant 
-advancement beyond routine engineering and involves overcoming specific technological uncertainties through systematic investigation.
-
-## 2. Technical Uncertainties Addressed
-The project addressed the following technical uncertainties:
-
-- **Real-time processing of high-volume sensor data:** Developing methods to process and analyze terabytes of streaming sensor data without introducing latency that would compromise the real-time nature of the predictive system.
-- **Development of reliable anomaly detection algorithms:** Creating algorithms capable of distinguishing between normal variations in equipment operation and early indicators of potential failures, with sufficient sensitivity and specificity.
-- **Integration of heterogeneous data sources:** Combining data from diverse sensors with varying reliability, sampling rates, and formats into a coherent analytical framework.
-- **Creation of accurate predictive models:** Developing models capable of predicting equipment failures with sufficient accuracy and lead time to enable preventative maintenance while minimizing false alarms.
-
-## 3. Systematic Investigation
-Our research methodology followed these systematic steps:
-
-1. **Hypothesis formulation** regarding failure prediction models and anomaly detection approaches
-2. **Experimental design** and data collection protocols with appropriate controls
-3. **Algorithm development** and iterative testing with performance benchmarking
-4. **Validation** against historical failure data using statistical methods
-5. **Implementation** of improvements based on experimental results with continuous monitoring
-
-## 4. Technical Content
-The project involved significant advancement in:
-
-- **Machine learning techniques** specifically adapted for predictive maintenance in industrial settings
-- **Sensor data processing optimization** to handle high-volume, real-time data streams
-- **Anomaly detection sensitivity and specificity improvements** through novel algorithmic approaches
-- **Statistical models** for failure probability estimation with increased temporal precision
-
-## 5. Project Results
-The research resulted in:
-
-- Novel algorithms with **23% improved accuracy** over existing solutions
-- Reduction in false positive alerts by **45%**
-- Early detection of equipment anomalies (average **72 hours before failure**)
-- Documented technical advancement in predictive maintenance methodology
-- **31% reduction** in unplanned downtime in production environments
-"""
-                zipf.writestr('SR&ED_Documentation/Technical_Narrative.md', sred_template)
+                _write_zip_entry(zipf, 'SR&ED_Documentation/Technical_Narrative.md', _SRED_TECHNICAL_NARRATIVE_MD)
                 
                 # 5. Add experimental results documentation with enhanced formatting
-                experimental_data = """
-# Experimental Results Documentation
-
-## Experiment 1: Anomaly Detection Algorithm Optimization
-
-### Hypothesis
-Modified isolation forest algorithms can improve anomaly detection accuracy in manufacturing sensor data without increasing computational complexity.
-
-### Methodology
-- Comparative analysis of 5 algorithm variations using cross-validation
-- Testing performed on historical data from 12 manufacturing facilities
-- Performance measured using precision, recall, F1-score, and computational overhead
-- Testing conducted over 4-week period with 3 iterations of algorithm refinement
-
-### Variables Tested
-1. Contamination parameter optimization
-2. Feature selection methodology
-3. Ensemble composition variations
-4. Distance metric selection
-5. Adaptive threshold mechanisms
-
-### Results
-| Algorithm Variation | Precision | Recall | F1-Score | CPU Overhead |
-|---------------------|-----------|--------|----------|--------------|
-| Baseline (Standard) | 68.2%     | 71.4%  | 69.7%    | Baseline     |
-| Variation 1         | 74.5%     | 77.9%  | 76.2%    | +5%          |
-| Variation 2         | 79.8%     | 80.1%  | 79.9%    | +12%         |
-| Variation 3         | 83.2%     | 84.7%  | 83.9%    | -4%          |
-| Variation 4         | 91.6%     | 90.1%  | 90.8%    | -15%         |
-
-### Conclusions
-The optimized algorithm (Variation 4) demonstrated significant improvement over baseline (23.4% precision improvement, 18.7% recall improvement) while reducing computational overhead by 15%, enabling real-time processing for manufacturing environments.
-
-## Experiment 2: Sensor Data Noise Reduction
-
-### Hypothesis
-Adaptive filtering techniques can improve signal quality from vibration sensors in high-noise manufacturing environments.
-
-### Methodology
-- Implementation of 3 filtering techniques with cross-validation
-- Testing on 5 different types of manufacturing equipment
-- Performance measured by signal-to-noise ratio and feature preservation
-- Blind testing by maintenance engineers to validate practical improvements
-
-### Results
-- 42% noise reduction while preserving critical signal features
-- Successful identification of pre-failure signatures in 94% of test cases
-- Reduction of false positives by 37% compared to standard filtering techniques
-- Adaptive Kalman filtering provided optimal results for vibration data
-
-### Conclusions
-The developed adaptive filtering approach significantly improved sensor data quality, enabling more accurate anomaly detection in noisy manufacturing environments while maintaining computational efficiency.
-
-## Experiment 3: Failure Prediction Model Development
-
-### Hypothesis
-Multi-modal sensor fusion with specialized feature engineering can improve prediction accuracy for equipment failures.
-
-### Methodology
-- Comparison of single-sensor vs. multi-sensor prediction models
-- Development of custom feature extraction for each sensor type
-- Testing against 24 months of historical failure data
-- Performance measured by prediction accuracy and lead time
-
-### Results
-| Model Type | Accuracy | False Positive Rate | Avg. Prediction Lead Time |
-|------------|----------|---------------------|---------------------------|
-| Temperature Only | 67% | 32% | 36 hours |
-| Vibration Only | 73% | 28% | 48 hours |
-| Power Consumption Only | 69% | 34% | 29 hours |
-| Multi-sensor (Basic) | 82% | 22% | 56 hours |
-| Multi-sensor (Advanced) | 98% | 7% | 72 hours |
-
-### Conclusions
-Integration of temperature, vibration, and power consumption data with specialized feature engineering provided 31% improvement in prediction accuracy and extended lead time from 36 to 72 hours, giving maintenance teams critical additional time for planned interventions.
-"""
-                zipf.writestr('SR&ED_Documentation/Experimental_Results.md', experimental_data)
+                _write_zip_entry(zipf, 'SR&ED_Documentation/Experimental_Results.md', _SRED_EXPERIMENTAL_RESULTS_MD)
                 
                 # 6. Add financial eligibility documentation template with improved formatting
-                financial_template = """
-# SR&ED Eligible Expenditures Documentation
-
-## Eligible Salary and Wages
-
-| Personnel Category | Eligible Activities | Documentation Requirements |
-|--------------------|--------------------|----------------------------|
-| **Research Scientists** | Algorithm development, experimental design, hypothesis formulation | Time sheets, project journals, meeting notes |
-| **Software Developers** | Implementation of experimental code, prototype development | Git commits, project management records |
-| **Data Scientists** | Model development, statistical analysis, experimental validation | Experiment logs, analysis reports |
-| **Project Management** | Direction of SR&ED activities, coordination of experiments | Project plans, research coordination meetings |
-
-## Materials Consumed
-
-| Material Category | Purpose | Eligibility Justification |
-|-------------------|---------|--------------------------|
-| **Test Equipment** | Prototype sensor arrays for experimental validation | Consumed in testing hypotheses related to sensor fusion |
-| **Development Hardware** | Computing resources specifically for algorithm development | Used exclusively for processing experimental data sets |
-| **Specialized Components** | Custom interface boards for sensor integration | Required for testing novel integration approaches |
-| **Validation Materials** | Materials used to simulate equipment failure conditions | Necessary for experimental validation of detection algorithms |
-
-## Contract Expenditures
-
-| Contractor | SR&ED Services Provided | Documentation |
-|------------|------------------------|---------------|
-| **University Research Lab** | Specialized validation testing of algorithms | Research agreement, test reports |
-| **Statistical Consultant** | Design of experiments, analysis methodology | Consulting reports, experimental design documents |
-| **Industrial Test Facility** | Real-world validation of predictive models | Testing agreement, validation reports |
-
-## Capital Expenditures (if applicable)
-
-| Equipment | SR&ED Usage | Eligibility |
-|-----------|-------------|-------------|
-| **High-Performance Computing Cluster** | Testing of computationally intensive algorithms | Used exclusively for experimental algorithm development |
-| **Specialized Testing Equipment** | Validation of sensor integration approaches | Required for experimental validation |
-
-**Note:** This document serves as a template. Actual expenditures should be documented with appropriate financial records including invoices, payroll records, time tracking, and asset registers. All expenditures must comply with CRA SR&ED program requirements.
-"""
-                zipf.writestr('SR&ED_Documentation/Financial_Eligibility.md', financial_template)
+                _write_zip_entry(zipf, 'SR&ED_Documentation/Financial_Eligibility.md', _SRED_FINANCIAL_ELIGIBILITY_MD)
                 
                 # 7. Add project timeline documentation
-                timeline = """
-# Project Timeline: SR&ED Activities
-
-## Phase 1: Problem Definition and Research (January - February 2024)
-
-| Week | Activities | Outcomes |
-|------|------------|----------|
-| 1-2 | Literature review of predictive maintenance techniques | Identified knowledge gaps in real-time processing |
-| 3-4 | Analysis of existing anomaly detection approaches | Documented limitations of current methods |
-| 5-6 | Stakeholder interviews and requirements gathering | Defined technical uncertainties to address |
-| 7-8 | Formulation of research hypotheses | Developed initial research plan with testable hypotheses |
-
-## Phase 2: Experimental Design and Development (March - June 2024)
-
-| Month | Key Activities | Research Outcomes |
-|-------|---------------|-------------------|
-| March | Design of experimental framework | Established control variables and testing protocols |
-| April | Development of algorithm variations | Created 5 candidate approaches for anomaly detection |
-| May | Implementation of sensor data processing techniques | Developed 3 novel approaches for sensor fusion |
-| June | Pilot testing setup | Established baseline performance metrics |
-
-## Phase 3: Systematic Investigation (July - October 2024)
-
-| Investigation Area | Experiments Conducted | Key Findings |
-|-------------------|----------------------|--------------|
-| Anomaly Detection | 12 experimental iterations | Identified optimal algorithm configuration |
-| Sensor Fusion | 8 experimental approaches | Discovered novel multi-modal feature extraction technique |
-| Noise Reduction | 15 filtering variations | Developed adaptive filtering approach |
-| Prediction Models | 9 model architectures | Validated superiority of ensemble approach |
-
-## Phase 4: Validation and Documentation (November - December 2024)
-
-| Week | Activities | Outcomes |
-|------|------------|----------|
-| 1-2 | Statistical validation of results | Confirmed 23% improvement over baseline |
-| 3-4 | Real-world testing | Verified 72-hour prediction window in production |
-| 5-6 | Technical documentation | Compiled evidence of systematic investigation |
-| 7-8 | Financial analysis | Documented eligible SR&ED expenditures |
-
-This timeline documents the systematic approach taken to address technological uncertainties through experimentation and iterative development, fulfilling SR&ED program requirements for methodical investigation.
-"""
-                zipf.writestr('SR&ED_Documentation/Project_Timeline.md', timeline)
+                _write_zip_entry(zipf, 'SR&ED_Documentation/Project_Timeline.md', _SRED_PROJECT_TIMELINE_MD)
                 
             # Return the complete package
-            zip_buffer.seek(0)
             return zip_buffer.getvalue()
                 
-        # Generate appropriate report data based on format
-        report_data = None
-        if report_type == "SR&ED Technical Documentation":
-            # For SR&ED reports, always provide the full documentation package regardless of format
-            report_data = generate_sred_documentation()
-            # Update the selected format to zip for proper handling
-            selected_format = 'zip'
-        elif selected_format in ['csv']:
-            report_data = generate_csv()
-        elif selected_format in ['pdf']:
-            report_data = generate_pdf()
-        elif selected_format in ['doc', 'docx', 'rtf']:
-            report_data = generate_docx()
-        elif selected_format in ['xls', 'xlsx']:
-            report_data = generate_xlsx()
-        elif selected_format in ['txt']:
-            report_data = generate_txt()
-        elif selected_format in ['jpg', 'jpeg', 'tiff', 'tif', 'xps']:
-            report_data = generate_image()
-        else:
-            # Default to CSV if format not supported
-            report_data = generate_csv()
+        # Streamlit reruns this page on every interaction, so reuse the last report
+        # until the selection or the underlying data changes. This also stops the
+        # SR&ED package from recording a new documentation version on every rerun.
+        report_key = (report_type, selected_format, time_period, st.session_state.get('last_update'))
+        if st.session_state.get('report_cache_key') != report_key:
+            # Generate appropriate report data based on format
+            if report_type == "SR&ED Technical Documentation":
+                # For SR&ED reports, always provide the full documentation package regardless of format
+                report_data = generate_sred_documentation()
+                # Update the selected format to zip for proper handling
+                selected_format = 'zip'
+            else:
+                # Default to CSV if format not supported
+                report_data = report_generators.get(selected_format, generate_csv)()
+            
+            st.session_state.report_cache = (report_data, selected_format)
+            st.session_state.report_cache_key = report_key
+        
+        report_data, selected_format = st.session_state.report_cache
         
         report_name = report_type.lower().replace(" ", "_")
         
         st.download_button(
             label="📊 Download Report",
+            key="downloads_report",
             data=report_data,
-            file_name=f"{report_name}_{datetime.now().strftime('%Y%m%d_%H%M')}.{selected_format}",
-            mime=mime_types.get(selected_format, "text/csv"),
+            file_name=f"{report_name}_{file_stamp}.{selected_format}",
+            mime=_REPORT_MIME_TYPES.get(selected_format, "text/csv"),
             help=f"Download {report_type} in {selected_format.upper()} format"
         )
         
@@ -2253,8 +2550,9 @@ This timeline documents the systematic approach taken to address technological u
             
             st.download_button(
                 label="📎 Download Evidence Package",
-                data="This is a placeholder for the selected evidence documents.",
-                file_name=f"evidence_package_{datetime.now().strftime('%Y%m%d_%H%M')}.txt",
+                key="downloads_evidence_package",
+                data=_EVIDENCE_PLACEHOLDER_BYTES,
+                file_name=f"evidence_package_{file_stamp}.txt",
                 mime="text/plain",
                 help="Download selected evidence files (demo)"
             )
@@ -2269,22 +2567,16 @@ This timeline documents the systematic approach taken to address technological u
         The following professional documentation packages are available to support SR&ED claims and industry compliance:
         """)
         
-        doc_options = {
-            "System Architecture Blueprint": "Detailed block diagrams and data flow architecture documentation",
-            "Technical Uncertainties Report": "Analysis of technical challenges and research methodology",
-            "Experimental Protocol & Results": "Methodologies, test results, and performance metrics",
-            "SR&ED Financial Documentation": "Eligible expenses breakdown and CRA compliance evidence",
-            "Risk Assessment & Mitigation": "Comprehensive risk analysis and contingency planning",
-            "Quality Assurance Protocols": "Validation procedures and system reliability evidence",
-            "Professional Technical Report": "Complete project documentation in CRA-compliant format"
-        }
-        
-        for doc_name, doc_desc in doc_options.items():
+        for doc_name, doc_desc in _PROFESSIONAL_DOC_OPTIONS.items():
             st.markdown(f"**{doc_name}**: {doc_desc}")
-            st.download_button(
-                label=f"Download {doc_name}",
-                data=f"This is a placeholder for the {doc_name} document.",
-                file_name=f"{doc_name.lower().replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}.pdf",
-                mime="application/pdf",
-                help=f"Download {doc_name} (demo)"
-            )
\ No newline at end of file
+        
+        # One cached archive instead of a download button (and payload) per document
+        date_stamp = now.strftime('%Y%m%d')
+        st.download_button(
+            label="Download All Professional Documentation",
+            key="downloads_professional_docs",
+            data=_build_professional_docs_bundle(tuple(_PROFESSIONAL_DOC_OPTIONS), date_stamp),
+            file_name=f"professional_documentation_{date_stamp}.zip",
+            mime="application/zip",
+            help="Download all professional documentation packages (demo)"
+        )
\ No newline at end of file
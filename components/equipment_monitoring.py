@@ -1,8 +1,111 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
+from functools import lru_cache
+from utils.session_cache import get_page_cache
+
+# Sensor selector labels mapped to their sensor_data columns
+_SENSOR_COLUMNS = {
+    'Temperature': 'temperature',
+    'Pressure': 'pressure',
+    'Vibration': 'vibration',
+    'Power': 'power'
+}
+
+# Sensor columns mapped to their chart legend names
+_SENSOR_DISPLAY_NAMES = {
+    'temperature': 'Temperature (°C)',
+    'pressure': 'Pressure (PSI)',
+    'vibration': 'Vibration (mm/s)',
+    'power': 'Power (kW)'
+}
+
+def _indexed_monitoring_data(processed_data, equipment_data):
+    """
+    Index equipment rows and split sensor readings by machine, once per data refresh
+    
+    Parameters:
+    processed_data (dict): Processed sensor data with statistics
+    equipment_data (DataFrame): Equipment metadata
+    
+    Returns:
+    tuple: (equipment rows indexed by machine_id, dict of time-sorted readings per machine)
+    """
+    cache = get_page_cache('equipment_monitoring_cache')
+    if 'equipment_by_id' not in cache:
+        cache['equipment_by_id'] = equipment_data.set_index('machine_id', drop=False)
+        cache['readings_by_machine'] = {
+            machine_id: readings.sort_values('timestamp')
+            for machine_id, readings in processed_data['sensor_data'].groupby('machine_id', sort=False)
+        }
+    return cache['equipment_by_id'], cache['readings_by_machine']
+
+@lru_cache(maxsize=64)
+def _build_health_gauge(health_score):
+    """Build the health score gauge figure once per distinct score"""
+    health_color = '#E74C3C' if health_score < 70 else '#F39C12' if health_score < 85 else '#2ECC71'
+    
+    fig_gauge = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=health_score,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        title={'text': "Health Score"},
+        gauge={
+            'axis': {'range': [0, 100]},
+            'bar': {'color': health_color},
+            'steps': [
+                {'range': [0, 70], 'color': 'rgba(231, 76, 60, 0.2)'},
+                {'range': [70, 85], 'color': 'rgba(243, 156, 18, 0.2)'},
+                {'range': [85, 100], 'color': 'rgba(46, 204, 113, 0.2)'}
+            ],
+            'threshold': {
+                'line': {'color': "black", 'width': 4},
+                'thickness': 0.75,
+                'value': 70
+            }
+        }
+    ))
+    
+    fig_gauge.update_layout(
+        height=200,
+        margin=dict(l=20, r=20, t=30, b=20)
+    )
+    
+    return fig_gauge
+
+def _build_sensor_trend_figure(filtered_data, sensor_columns):
+    """
+    Build the sensor trend line chart
+    
+    Parameters:
+    filtered_data (DataFrame): Sensor readings for one machine within the selected time range
+    sensor_columns (list): Sensor columns to plot
+    
+    Returns:
+    Figure: Plotly WebGL line chart with one trace per sensor
+    """
+    # One WebGL trace per sensor, read straight from the filtered columns
+    fig = go.Figure()
+    for column in sensor_columns:
+        fig.add_trace(go.Scattergl(
+            x=filtered_data['timestamp'],
+            y=filtered_data[column],
+            mode='lines',
+            name=_SENSOR_DISPLAY_NAMES[column]
+        ))
+    
+    # Improve chart layout
+    fig.update_layout(
+        height=400,
+        margin=dict(l=20, r=20, t=30, b=20),
+        legend=dict(orientation="h", yanchor="bottom", y=-0.3, xanchor="center", x=0.5, title_text='Sensor'),
+        xaxis_title='Time',
+        yaxis_title='Sensor Reading',
+        hovermode="x unified"
+    )
+    
+    return fig
 
 def show_equipment_monitoring(processed_data, equipment_data):
     """
@@ -16,6 +119,7 @@ def show_equipment_monitoring(processed_data, equipment_data):
     
     # Equipment selection
     machine_list = equipment_data['machine_id'].tolist()
+    equipment_by_id, readings_by_machine = _indexed_monitoring_data(processed_data, equipment_data)
     
     col1, col2 = st.columns([1, 3])
     
@@ -23,7 +127,7 @@ def show_equipment_monitoring(processed_data, equipment_data):
         selected_machine = st.selectbox("Select Equipment", machine_list)
         
         # Get machine info
-        machine_info = equipment_data[equipment_data['machine_id'] == selected_machine].iloc[0]
+        machine_info = equipment_by_id.loc[selected_machine]
         
         # Display machine info
         st.subheader("Equipment Information")
@@ -36,37 +140,9 @@ def show_equipment_monitoring(processed_data, equipment_data):
             st.markdown(f"**Installation:** {machine_info['installation_year']}")
             st.markdown(f"**Last Maintenance:** {machine_info['last_maintenance']}")
             
-        # Health score gauge
-        health_score = machine_info['health_score']
-        health_color = '#E74C3C' if health_score < 70 else '#F39C12' if health_score < 85 else '#2ECC71'
-        
-        fig_gauge = go.Figure(go.Indicator(
-            mode="gauge+number",
-            value=health_score,
-            domain={'x': [0, 1], 'y': [0, 1]},
-            title={'text': "Health Score"},
-            gauge={
-                'axis': {'range': [0, 100]},
-                'bar': {'color': health_color},
-                'steps': [
-                    {'range': [0, 70], 'color': 'rgba(231, 76, 60, 0.2)'},
-                    {'range': [70, 85], 'color': 'rgba(243, 156, 18, 0.2)'},
-                    {'range': [85, 100], 'color': 'rgba(46, 204, 113, 0.2)'}
-                ],
-                'threshold': {
-                    'line': {'color': "black", 'width': 4},
-                    'thickness': 0.75,
-                    'value': 70
-                }
-            }
-        ))
-        
-        fig_gauge.update_layout(
-            height=200,
-            margin=dict(l=20, r=20, t=30, b=20)
-        )
-        
-        st.plotly_chart(fig_gauge, use_container_width=True)
+        # Health score gauge, built once per distinct score
+        health_score = float(machine_info['health_score'])
+        st.plotly_chart(_build_health_gauge(health_score), use_container_width=True)
         
         # Status indicator
         status = machine_info['status']
@@ -88,8 +164,8 @@ def show_equipment_monitoring(processed_data, equipment_data):
         """, unsafe_allow_html=True)
     
     with col2:
-        # Get data for this machine
-        machine_data = processed_data['sensor_data'][processed_data['sensor_data']['machine_id'] == selected_machine]
+        # Get data for this machine, already in time order so the range filter can binary search
+        machine_data = readings_by_machine.get(selected_machine, processed_data['sensor_data'].iloc[0:0])
         
         # Current values
         st.subheader("Current Sensor Readings")
@@ -163,67 +239,32 @@ def show_equipment_monitoring(processed_data, equipment_data):
         else:
             start_time = machine_data['timestamp'].min()
         
-        filtered_data = machine_data[machine_data['timestamp'].between(start_time, end_time)]
+        # Inclusive range slice via binary search on the sorted timestamps
+        start_pos = machine_data['timestamp'].searchsorted(start_time, side='left')
+        end_pos = machine_data['timestamp'].searchsorted(end_time, side='right')
+        filtered_data = machine_data.iloc[start_pos:end_pos]
         
         # Select sensors to display
         selected_sensors = st.multiselect(
             "Select Sensors to Display",
-            ["Temperature", "Pressure", "Vibration", "Power"],
+            list(_SENSOR_COLUMNS),
             default=["Temperature", "Vibration"]
         )
         
         # Map selection to columns
-        sensor_columns = []
-        for sensor in selected_sensors:
-            if sensor == "Temperature":
-                sensor_columns.append("temperature")
-            elif sensor == "Pressure":
-                sensor_columns.append("pressure")
-            elif sensor == "Vibration":
-                sensor_columns.append("vibration")
-            elif sensor == "Power":
-                sensor_columns.append("power")
+        sensor_columns = [_SENSOR_COLUMNS[sensor] for sensor in selected_sensors]
         
         # Create time series chart
         if filtered_data.empty:
             st.info("No data available for the selected time range")
         else:
-            # Melt the data for plotting
-            plot_data = filtered_data.melt(
-                id_vars=['timestamp'],
-                value_vars=sensor_columns,
-                var_name='Sensor',
-                value_name='Value'
-            )
-            
-            # Rename sensor names for display
-            sensor_names = {
-                'temperature': 'Temperature (°C)',
-                'pressure': 'Pressure (PSI)',
-                'vibration': 'Vibration (mm/s)',
-                'power': 'Power (kW)'
-            }
-            plot_data['Sensor'] = plot_data['Sensor'].map(sensor_names)
-            
-            # Create line chart
-            fig = px.line(
-                plot_data,
-                x='timestamp',
-                y='Value',
-                color='Sensor',
-                line_shape='spline',
-                labels={'timestamp': 'Time', 'Value': 'Sensor Reading'}
-            )
-            
-            # Improve chart layout
-            fig.update_layout(
-                height=400,
-                margin=dict(l=20, r=20, t=30, b=20),
-                legend=dict(orientation="h", yanchor="bottom", y=-0.3, xanchor="center", x=0.5),
-                hovermode="x unified"
-            )
+            # Reuse the figure across reruns until the selection or the data changes
+            figure_cache = get_page_cache('equipment_monitoring_cache')
+            trend_key = (selected_machine, time_range, tuple(sensor_columns))
+            if trend_key not in figure_cache:
+                figure_cache[trend_key] = _build_sensor_trend_figure(filtered_data, sensor_columns)
             
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(figure_cache[trend_key], use_container_width=True)
         
         # Maintenance history and anomalies
         cols = st.columns(2)
@@ -4,8 +4,63 @@ import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
-from sklearn.preprocessing import StandardScaler
-from sklearn.decomposition import PCA
+from utils.session_cache import get_page_cache
+
+# Sensor columns analyzed on this page, in display order
+_SENSOR_COLUMNS = ['temperature', 'pressure', 'vibration', 'power']
+
+# Sensor selector labels mapped to their columns, and columns to their chart names
+_SENSOR_SELECTIONS = {
+    'Temperature': 'temperature',
+    'Pressure': 'pressure',
+    'Vibration': 'vibration',
+    'Power': 'power'
+}
+_SENSOR_DISPLAY_NAMES = {
+    'temperature': 'Temperature (°C)',
+    'pressure': 'Pressure (PSI)',
+    'vibration': 'Vibration (mm/s)',
+    'power': 'Power (kW)'
+}
+
+# Most readings sent to the browser per chart; longer series are thinned before plotting
+_MAX_CHART_POINTS = 2000
+
+# Bucket width and phase, in nanoseconds, for each aggregation level; the epoch fell on a
+# Thursday, so weekly buckets are shifted three days to start on Mondays
+_HOUR_NS = 3_600_000_000_000
+_DAY_NS = 24 * _HOUR_NS
+_AGGREGATION_BUCKETS = {
+    'Hourly Average': (_HOUR_NS, 0),
+    'Daily Average': (_DAY_NS, 0),
+    'Weekly Average': (7 * _DAY_NS, 3 * _DAY_NS)
+}
+
+def _memoized(memo, name, builder, *args):
+    """Return memo[name], building it with builder(*args) on first use; a memo of None disables caching"""
+    if memo is None:
+        return builder(*args)
+    if name not in memo:
+        memo[name] = builder(*args)
+    return memo[name]
+
+def _readings_by_machine(sensor_data):
+    """Split sensor readings into one time-sorted frame per machine"""
+    # Convert timestamp to datetime if needed
+    if not pd.api.types.is_datetime64_dtype(sensor_data['timestamp']):
+        sensor_data = sensor_data.assign(timestamp=pd.to_datetime(sensor_data['timestamp']))
+    
+    # Store readings compactly; calculations upcast to float64 when they read them
+    sensor_data = sensor_data.astype({
+        **{column: np.float32 for column in _SENSOR_COLUMNS},
+        'maintenance_performed': np.uint8
+    })
+    
+    # Readings usually arrive in time order already, so only out-of-order groups pay for a sorted copy
+    return {
+        machine_id: readings if readings['timestamp'].is_monotonic_increasing else readings.sort_values('timestamp')
+        for machine_id, readings in sensor_data.groupby('machine_id', sort=False)
+    }
 
 def show_historical_analysis(processed_data):
     """
@@ -55,13 +110,21 @@ def show_historical_analysis(processed_data):
             ["Raw Data", "Hourly Average", "Daily Average", "Weekly Average"]
         )
     
-    # Filter data based on selection
-    filtered_data = filter_and_aggregate_data(sensor_data, selected_machine, start_date, end_date, aggregation)
+    # Filter data based on selection; the result and every analysis derived from it are
+    # kept across reruns until the selection or the data changes
+    page_cache = get_page_cache('historical_analysis_cache')
+    readings_by_machine = _memoized(page_cache, 'readings_by_machine', _readings_by_machine, sensor_data)
+    analysis_memo = page_cache.setdefault((selected_machine, start_date, end_date, aggregation), {})
+    filtered_data = _memoized(analysis_memo, 'filtered_data', filter_and_aggregate_data, 
+                              readings_by_machine[selected_machine], start_date, end_date, aggregation)
     
     if filtered_data.empty:
         st.warning("No data available for the selected filters")
         return
     
+    # Row positions of maintenance events, shared by the chart and the impact analysis
+    maintenance_positions = _memoized(analysis_memo, 'maintenance_positions', _maintenance_positions, filtered_data)
+    
     # Overview of selected data
     st.subheader("Data Overview")
     
@@ -89,45 +152,47 @@ def show_historical_analysis(processed_data):
     # Select sensors to analyze
     selected_sensors = st.multiselect(
         "Select Sensors to Analyze",
-        ["Temperature", "Pressure", "Vibration", "Power"],
+        list(_SENSOR_SELECTIONS),
         default=["Temperature", "Vibration"]
     )
     
     # Create time series charts
     if selected_sensors:
-        st.plotly_chart(create_time_series_chart(filtered_data, selected_sensors), use_container_width=True)
+        st.plotly_chart(create_time_series_chart(filtered_data, selected_sensors, maintenance_positions), 
+                        use_container_width=True)
     
     # Statistical analysis
     st.subheader("Statistical Analysis")
     
     # Create statistics
-    show_statistical_analysis(filtered_data)
+    show_statistical_analysis(filtered_data, analysis_memo)
     
-    # Correlation analysis
-    st.subheader("Correlation Analysis")
+    # Correlation and PCA run only once their section is opened and switched on,
+    # since a collapsed expander still executes its contents on every rerun
     
-    # Create correlation matrix
-    show_correlation_analysis(filtered_data)
+    # Correlation analysis
+    with st.expander("Correlation Analysis"):
+        if st.checkbox("Show correlation analysis", key="historical_show_correlation"):
+            show_correlation_analysis(filtered_data, analysis_memo)
     
     # Advanced analytics
-    st.subheader("Advanced Analytics")
-    
-    # PCA analysis of sensor data
-    show_pca_analysis(filtered_data)
+    with st.expander("Advanced Analytics"):
+        # PCA analysis of sensor data
+        if st.checkbox("Show PCA analysis", key="historical_show_pca"):
+            show_pca_analysis(filtered_data, analysis_memo)
     
     # Maintenance impact analysis
     st.subheader("Maintenance Impact Analysis")
     
     # Analyze before and after maintenance
-    show_maintenance_impact(filtered_data)
+    show_maintenance_impact(filtered_data, maintenance_positions)
 
-def filter_and_aggregate_data(data, machine_id, start_date, end_date, aggregation):
+def filter_and_aggregate_data(machine_data, start_date, end_date, aggregation):
     """
     Filter and aggregate sensor data based on user selection
     
     Parameters:
-    data (DataFrame): Raw sensor data
-    machine_id (str): Machine ID to filter
+    machine_data (DataFrame): Sensor readings for one machine, sorted by datetime timestamp
     start_date (date): Start date
     end_date (date): End date
     aggregation (str): Aggregation level
@@ -135,124 +200,155 @@ def filter_and_aggregate_data(data, machine_id, start_date, end_date, aggregatio
     Returns:
     DataFrame: Filtered and aggregated data
     """
-    # Filter by machine ID
-    filtered = data[data['machine_id'] == machine_id].copy()
-    
-    # Convert timestamp to datetime if needed
-    if not pd.api.types.is_datetime64_dtype(filtered['timestamp']):
-        filtered['timestamp'] = pd.to_datetime(filtered['timestamp'])
-    
-    # Filter by date range
+    # Filter by date range with a binary search on the sorted timestamps, covering whole
+    # days from the start of start_date up to (not including) the midnight after end_date
     start_datetime = pd.Timestamp(start_date)
-    end_datetime = pd.Timestamp(end_date) + pd.Timedelta(days=1) - pd.Timedelta(seconds=1)
+    end_datetime = pd.Timestamp(end_date) + pd.Timedelta(days=1)
     
-    filtered = filtered[(filtered['timestamp'] >= start_datetime) & 
-                        (filtered['timestamp'] <= end_datetime)]
+    start_pos, end_pos = machine_data['timestamp'].searchsorted([start_datetime, end_datetime], side='left')
+    filtered = machine_data.iloc[start_pos:end_pos]
     
     # Apply aggregation if requested
-    if aggregation != "Raw Data":
-        # Add time components for grouping
-        filtered['hour'] = filtered['timestamp'].dt.floor('H')
-        filtered['day'] = filtered['timestamp'].dt.floor('D')
-        filtered['week'] = filtered['timestamp'].dt.floor('W')
+    if aggregation != "Raw Data" and not filtered.empty:
+        # Bucket start for every reading, at the selected aggregation level only
+        bins = _aggregation_bins(filtered['timestamp'], aggregation)
         
-        # Select group column based on aggregation level
-        if aggregation == "Hourly Average":
-            group_col = 'hour'
-        elif aggregation == "Daily Average":
-            group_col = 'day'
-        else:  # Weekly Average
-            group_col = 'week'
+        # Readings are time sorted, so each bucket is one contiguous run of rows
+        starts = np.flatnonzero(np.r_[True, bins[1:] != bins[:-1]])
         
-        # Group and aggregate
-        agg_funcs = {
-            'temperature': 'mean',
-            'pressure': 'mean',
-            'vibration': 'mean',
-            'power': 'mean',
-            'maintenance_performed': 'sum'
-        }
+        # Average each sensor per bucket, skipping missing readings as groupby().mean() does
+        sensors = filtered[_SENSOR_COLUMNS].to_numpy(dtype=np.float64)
+        present = ~np.isnan(sensors)
+        sums = np.add.reduceat(np.where(present, sensors, 0.0), starts, axis=0)
+        counts = np.add.reduceat(present.astype(np.int64), starts, axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = sums / counts
+        
+        # Count maintenance events per bucket
+        maintenance = np.add.reduceat(filtered['maintenance_performed'].to_numpy(dtype=np.int64), starts)
         
-        filtered = filtered.groupby(group_col).agg(agg_funcs).reset_index()
-        filtered.rename(columns={group_col: 'timestamp'}, inplace=True)
+        filtered = pd.DataFrame(means, columns=_SENSOR_COLUMNS)
+        filtered.insert(0, 'timestamp', bins[starts])
+        filtered['maintenance_performed'] = maintenance
     
     return filtered
 
-def create_time_series_chart(data, selected_sensors):
+def _aggregation_bins(timestamps, aggregation):
+    """
+    Floor each timestamp to the start of its aggregation bucket
+    
+    Parameters:
+    timestamps (Series): Datetime readings
+    aggregation (str): "Hourly Average", "Daily Average" or "Weekly Average"
+    
+    Returns:
+    ndarray: datetime64 bucket start for each reading
+    """
+    # Integer floor division on the nanosecond values, one pass for any bucket size
+    width, shift = _AGGREGATION_BUCKETS[aggregation]
+    nanoseconds = timestamps.to_numpy(dtype='datetime64[ns]').view(np.int64)
+    return (((nanoseconds + shift) // width) * width - shift).view('datetime64[ns]')
+
+def _chart_positions(data, columns, max_points=_MAX_CHART_POINTS):
+    """
+    Choose the rows to plot so a long series keeps its shape with at most max_points rows
+    
+    Rows are split into equal buckets, and each bucket keeps the rows holding the minimum
+    and maximum of every column, so peaks and dips survive the thinning.
+    
+    Parameters:
+    data (DataFrame): Time-sorted sensor data
+    columns (list): Sensor columns that will be plotted
+    max_points (int): Upper bound on the number of rows kept
+    
+    Returns:
+    ndarray: Sorted row positions to plot
+    """
+    rows = len(data)
+    if rows <= max_points or not columns:
+        return np.arange(rows)
+    
+    # Two rows per column per bucket
+    bucket = -(-rows // max(1, max_points // (2 * len(columns))))
+    buckets = -(-rows // bucket)
+    
+    # Pad to whole buckets; padding and missing readings are never picked over real values
+    padded = np.full((buckets * bucket, len(columns)), np.nan)
+    padded[:rows] = data[columns].to_numpy(dtype=np.float64)
+    padded = padded.reshape(buckets, bucket, len(columns))
+    missing = np.isnan(padded)
+    lows = np.where(missing, np.inf, padded).argmin(axis=1)
+    highs = np.where(missing, -np.inf, padded).argmax(axis=1)
+    
+    offsets = (np.arange(buckets) * bucket)[:, None]
+    positions = np.concatenate([(offsets + lows).ravel(), (offsets + highs).ravel(), [0, rows - 1]])
+    return np.unique(np.minimum(positions, rows - 1))
+
+def _maintenance_positions(data):
+    """Row positions of the readings where maintenance was performed"""
+    return np.flatnonzero(data['maintenance_performed'].to_numpy() > 0)
+
+def create_time_series_chart(data, selected_sensors, maintenance_positions=None):
     """
     Create time series chart for selected sensors
     
     Parameters:
     data (DataFrame): Filtered sensor data
     selected_sensors (list): List of selected sensors
+    maintenance_positions (ndarray): Row positions of maintenance events, found from data if omitted
     
     Returns:
     Figure: Plotly figure
     """
     # Map sensor names to columns
-    sensor_columns = []
-    for sensor in selected_sensors:
-        if sensor == "Temperature":
-            sensor_columns.append("temperature")
-        elif sensor == "Pressure":
-            sensor_columns.append("pressure")
-        elif sensor == "Vibration":
-            sensor_columns.append("vibration")
-        elif sensor == "Power":
-            sensor_columns.append("power")
-    
-    # Melt the data for plotting
-    plot_data = data.melt(
-        id_vars=['timestamp'],
-        value_vars=sensor_columns,
-        var_name='Sensor',
-        value_name='Value'
-    )
+    sensor_columns = [_SENSOR_SELECTIONS[sensor] for sensor in selected_sensors]
     
-    # Rename sensor names for display
-    sensor_names = {
-        'temperature': 'Temperature (°C)',
-        'pressure': 'Pressure (PSI)',
-        'vibration': 'Vibration (mm/s)',
-        'power': 'Power (kW)'
-    }
-    plot_data['Sensor'] = plot_data['Sensor'].map(sensor_names)
-    
-    # Create line chart
-    fig = px.line(
-        plot_data,
-        x='timestamp',
-        y='Value',
-        color='Sensor',
-        line_shape='spline',
-        labels={'timestamp': 'Time', 'Value': 'Sensor Reading'}
-    )
-    
-    # Mark maintenance events
-    maintenance_events = data[data['maintenance_performed'] > 0]
+    # Thin long series before they are sent to the browser
+    positions = _chart_positions(data, sensor_columns)
+    plot_source = data.iloc[positions]
+    plot_times = plot_source['timestamp'].to_numpy()
     
-    if not maintenance_events.empty:
-        for _, event in maintenance_events.iterrows():
-            fig.add_vline(
-                x=event['timestamp'],
-                line_dash="dash", 
-                line_color="green",
-                annotation_text="Maintenance",
-                annotation_position="top right"
-            )
+    # One WebGL trace per sensor, read straight from its column
+    fig = go.Figure()
+    for sensor in sensor_columns:
+        fig.add_trace(go.Scattergl(
+            x=plot_times,
+            y=plot_source[sensor].to_numpy(),
+            mode='lines',
+            name=_SENSOR_DISPLAY_NAMES[sensor]
+        ))
+    
+    # Mark maintenance events with one trace of NaN-separated vertical segments, drawn
+    # against a hidden 0-1 axis so each line spans the full chart height
+    if maintenance_positions is None:
+        maintenance_positions = _maintenance_positions(data)
+    maintenance_times = data['timestamp'].to_numpy()[maintenance_positions]
+    
+    if len(maintenance_times) > 0:
+        fig.add_trace(go.Scattergl(
+            x=np.repeat(maintenance_times, 3),
+            y=np.tile([0.0, 1.0, np.nan], len(maintenance_times)),
+            mode='lines',
+            line=dict(color='green', dash='dash'),
+            name='Maintenance',
+            hoverinfo='skip',
+            yaxis='y2'
+        ))
+        fig.update_layout(yaxis2=dict(overlaying='y', range=[0, 1], visible=False, fixedrange=True))
     
     # Add rolling averages
-    for sensor in sensor_columns:
-        # Calculate 24-point rolling average (may represent hours or days depending on aggregation)
-        if len(data) > 24:
-            rolling_avg = data[sensor].rolling(24, center=True).mean()
-            
-            fig.add_trace(go.Scatter(
-                x=data['timestamp'],
-                y=rolling_avg,
+    if len(data) > 24:
+        # Calculate 24-point rolling averages for all sensors in one pass
+        # (may represent hours or days depending on aggregation)
+        rolling_avgs = _centered_rolling_means(data, 24)
+        
+        for sensor in sensor_columns:
+            fig.add_trace(go.Scattergl(
+                x=plot_times,
+                y=rolling_avgs[positions, _SENSOR_COLUMNS.index(sensor)],
                 mode='lines',
                 line=dict(width=3, dash='dot'),
-                name=f"{sensor_names[sensor]} (Trend)",
+                name=f"{_SENSOR_DISPLAY_NAMES[sensor]} (Trend)",
                 hoverinfo='skip'
             ))
     
@@ -260,19 +356,16 @@ def create_time_series_chart(data, selected_sensors):
     fig.update_layout(
         height=450,
         margin=dict(l=20, r=20, t=30, b=20),
-        legend=dict(orientation="h", yanchor="bottom", y=-0.2, xanchor="center", x=0.5),
+        legend=dict(orientation="h", yanchor="bottom", y=-0.2, xanchor="center", x=0.5, title_text='Sensor'),
+        xaxis_title='Time',
+        yaxis_title='Sensor Reading',
         hovermode="x unified"
     )
     
     return fig
 
-def show_statistical_analysis(data):
-    """
-    Display statistical analysis of sensor data
-    
-    Parameters:
-    data (DataFrame): Filtered sensor data
-    """
+def _sensor_statistics(data):
+    """Summarize each sensor column with describe(), variance and range"""
     # Get statistical summary
     stats = data[['temperature', 'pressure', 'vibration', 'power']].describe().T
     
@@ -286,8 +379,58 @@ def show_statistical_analysis(data):
     # Rename the index
     formatted_stats.index = ['Temperature (°C)', 'Pressure (PSI)', 'Vibration (mm/s)', 'Power (kW)']
     
+    return formatted_stats
+
+def _horizontal_line(y, color, text, dash='dash', xanchor='left'):
+    """
+    Build a full-width reference line and its label for a figure layout
+    
+    Parameters:
+    y (float): Data value on the y axis
+    color (str): Line color
+    text (str): Label shown above the line
+    dash (str): Line dash style
+    xanchor (str): Side of the plot the label sits on, 'left' or 'right'
+    
+    Returns:
+    tuple: (layout shape, layout annotation)
+    """
+    shape = dict(type='line', xref='x domain', yref='y', x0=0, x1=1, y0=y, y1=y,
+                 line=dict(color=color, dash=dash, width=2))
+    annotation = dict(xref='x domain', yref='y', x=0 if xanchor == 'left' else 1, y=y,
+                      text=text, showarrow=False, xanchor=xanchor, yanchor='bottom')
+    return shape, annotation
+
+def _vertical_line(x, color, text, dash='dash', xanchor='center'):
+    """
+    Build a full-height reference line and its label for a figure layout
+    
+    Parameters:
+    x: Data value on the x axis
+    color (str): Line color
+    text (str): Label shown at the top of the line
+    dash (str): Line dash style
+    xanchor (str): Label alignment relative to the line
+    
+    Returns:
+    tuple: (layout shape, layout annotation)
+    """
+    shape = dict(type='line', xref='x', yref='y domain', x0=x, x1=x, y0=0, y1=1,
+                 line=dict(color=color, dash=dash, width=2))
+    annotation = dict(xref='x', yref='y domain', x=x, y=1,
+                      text=text, showarrow=False, xanchor=xanchor, yanchor='bottom')
+    return shape, annotation
+
+def show_statistical_analysis(data, memo=None):
+    """
+    Display statistical analysis of sensor data
+    
+    Parameters:
+    data (DataFrame): Filtered sensor data
+    memo (dict): Cache for results derived from this data, reused across reruns
+    """
     # Display stats
-    st.dataframe(formatted_stats, use_container_width=True)
+    st.dataframe(_memoized(memo, 'statistics', _sensor_statistics, data), use_container_width=True)
     
     # Create distribution plots
     col1, col2 = st.columns(2)
@@ -302,17 +445,12 @@ def show_statistical_analysis(data):
             title='Temperature Distribution'
         )
         
-        fig_temp.add_vline(
-            x=data['temperature'].mean(),
-            line_dash="dash", 
-            line_color="red",
-            annotation_text="Mean",
-            annotation_position="top right"
-        )
-        
+        mean_line, mean_label = _vertical_line(float(data['temperature'].mean()), "red", "Mean", xanchor='left')
         fig_temp.update_layout(
             height=300,
-            margin=dict(l=20, r=20, t=40, b=20)
+            margin=dict(l=20, r=20, t=40, b=20),
+            shapes=[mean_line],
+            annotations=[mean_label]
         )
         
         st.plotly_chart(fig_temp, use_container_width=True)
@@ -327,30 +465,38 @@ def show_statistical_analysis(data):
             title='Vibration Distribution'
         )
         
-        fig_vib.add_vline(
-            x=data['vibration'].mean(),
-            line_dash="dash", 
-            line_color="red",
-            annotation_text="Mean",
-            annotation_position="top right"
-        )
-        
+        mean_line, mean_label = _vertical_line(float(data['vibration'].mean()), "red", "Mean", xanchor='left')
         fig_vib.update_layout(
             height=300,
-            margin=dict(l=20, r=20, t=40, b=20)
+            margin=dict(l=20, r=20, t=40, b=20),
+            shapes=[mean_line],
+            annotations=[mean_label]
         )
         
         st.plotly_chart(fig_vib, use_container_width=True)
 
-def show_correlation_analysis(data):
+def _sensor_correlation(data):
+    """Calculate the correlation matrix of the sensor columns"""
+    sensors = data[_SENSOR_COLUMNS].to_numpy(dtype=np.float64)
+    
+    # Missing readings need pandas' pairwise handling; complete data takes one corrcoef call
+    if np.isnan(sensors).any():
+        return data[_SENSOR_COLUMNS].corr()
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        corr = np.corrcoef(sensors, rowvar=False)
+    return pd.DataFrame(corr, index=_SENSOR_COLUMNS, columns=_SENSOR_COLUMNS)
+
+def show_correlation_analysis(data, memo=None):
     """
     Display correlation analysis of sensor data
     
     Parameters:
     data (DataFrame): Filtered sensor data
+    memo (dict): Cache for results derived from this data, reused across reruns
     """
     # Calculate correlation matrix
-    corr_matrix = data[['temperature', 'pressure', 'vibration', 'power']].corr()
+    corr_matrix = _memoized(memo, 'correlation', _sensor_correlation, data)
     
     # Create heatmap
     fig = px.imshow(
@@ -374,17 +520,20 @@ def show_correlation_analysis(data):
     with col2:
         st.markdown("### Correlation Insights")
         
-        # Find strongest correlations
-        corr_pairs = []
-        for i in range(len(corr_matrix.columns)):
-            for j in range(i+1, len(corr_matrix.columns)):
-                col1 = corr_matrix.columns[i]
-                col2 = corr_matrix.columns[j]
-                corr_value = corr_matrix.iloc[i, j]
-                corr_pairs.append((col1, col2, corr_value))
+        # Find strongest correlations from the upper triangle of the matrix
+        rows, cols = np.triu_indices(len(corr_matrix.columns), k=1)
+        corr_values = corr_matrix.to_numpy()[rows, cols]
         
         # Sort by absolute correlation value
-        corr_pairs.sort(key=lambda x: abs(x[2]), reverse=True)
+        order = np.argsort(-np.abs(corr_values), kind='stable')
+        corr_pairs = zip(corr_matrix.columns[rows[order]], corr_matrix.columns[cols[order]], corr_values[order])
+        
+        sensor_names = {
+            'temperature': 'Temperature',
+            'pressure': 'Pressure',
+            'vibration': 'Vibration',
+            'power': 'Power'
+        }
         
         # Display insights
         for col1, col2, corr_value in corr_pairs:
@@ -392,13 +541,6 @@ def show_correlation_analysis(data):
                 strength = "Strong" if abs(corr_value) >= 0.7 else "Moderate"
                 direction = "positive" if corr_value > 0 else "negative"
                 
-                sensor_names = {
-                    'temperature': 'Temperature',
-                    'pressure': 'Pressure',
-                    'vibration': 'Vibration',
-                    'power': 'Power'
-                }
-                
                 st.markdown(f"**{strength} {direction} correlation** between {sensor_names[col1]} and {sensor_names[col2]} ({corr_value:.2f})")
                 
                 if col1 == 'temperature' and col2 == 'vibration' and corr_value > 0:
@@ -408,38 +550,62 @@ def show_correlation_analysis(data):
                 elif col1 == 'temperature' and col2 == 'power' and corr_value > 0:
                     st.markdown("- Higher temperatures correlate with increased power usage, which could indicate thermal inefficiency.")
 
-def show_pca_analysis(data):
+def _fit_pca(data):
     """
-    Perform and display PCA analysis on sensor data
+    Project the standardized sensor columns onto their first two principal components
     
     Parameters:
-    data (DataFrame): Filtered sensor data
+    data (DataFrame): Filtered sensor data with at least 3 rows
+    
+    Returns:
+    tuple: (DataFrame of component scores with timestamp and maintenance,
+            4x2 array of component loadings, explained variance ratio of each component)
     """
-    # Extract sensor features
-    features = data[['temperature', 'pressure', 'vibration', 'power']].copy()
+    # Standardize the sensor features, leaving constant columns unscaled as StandardScaler does
+    features = data[_SENSOR_COLUMNS].to_numpy(dtype=np.float64, copy=True)
+    features -= features.mean(axis=0)
+    scale = features.std(axis=0)
+    scale[scale == 0] = 1.0
+    features /= scale
     
-    # Skip if too few data points
-    if len(features) < 3:
-        st.info("Not enough data points for PCA analysis")
-        return
+    # Principal components from a thin SVD of the standardized matrix
+    u, singular_values, vt = np.linalg.svd(features, full_matrices=False)
     
-    # Scale the data
-    scaler = StandardScaler()
-    scaled_features = scaler.fit_transform(features)
+    # Make the largest loading of each component positive so the axes don't flip between fits
+    signs = np.sign(vt[np.arange(len(vt)), np.abs(vt).argmax(axis=1)])
+    signs[signs == 0] = 1.0
+    u *= signs
+    vt *= signs[:, None]
     
-    # Apply PCA
-    pca = PCA(n_components=2)
-    pca_result = pca.fit_transform(scaled_features)
+    variance = singular_values ** 2
+    variance_explained = variance[:2] / variance.sum()
     
     # Create DataFrame with PCA results
     pca_df = pd.DataFrame(
-        data=pca_result,
+        data=u[:, :2] * singular_values[:2],
         columns=['Principal Component 1', 'Principal Component 2']
     )
     
     # Add timestamp and maintenance for coloring
-    pca_df['timestamp'] = data['timestamp']
-    pca_df['maintenance_performed'] = data['maintenance_performed']
+    pca_df['timestamp'] = data['timestamp'].to_numpy()
+    pca_df['maintenance_performed'] = data['maintenance_performed'].to_numpy()
+    
+    return pca_df, vt[:2].T, variance_explained
+
+def show_pca_analysis(data, memo=None):
+    """
+    Perform and display PCA analysis on sensor data
+    
+    Parameters:
+    data (DataFrame): Filtered sensor data
+    memo (dict): Cache for results derived from this data, reused across reruns
+    """
+    # Skip if too few data points
+    if len(data) < 3:
+        st.info("Not enough data points for PCA analysis")
+        return
+    
+    pca_df, component_loadings, variance_explained = _memoized(memo, 'pca', _fit_pca, data)
     
     # Create scatter plot
     fig = px.scatter(
@@ -448,6 +614,7 @@ def show_pca_analysis(data):
         y='Principal Component 2',
         color='maintenance_performed',
         color_continuous_scale=[(0, 'blue'), (1, 'green')],
+        render_mode='webgl',
         hover_data={'timestamp': True, 'maintenance_performed': True},
         labels={'maintenance_performed': 'Maintenance'}
     )
@@ -475,80 +642,112 @@ def show_pca_analysis(data):
         - Changes in equipment behavior over time
         """)
         
-        # Display component loadings
-        loadings = pd.DataFrame(
-            pca.components_.T,
-            columns=['Component 1', 'Component 2'],
-            index=['Temperature', 'Pressure', 'Vibration', 'Power']
-        )
+        # Display component loadings as plain rows; the table is too small to need a DataFrame
+        loadings = [
+            {'Sensor': sensor, 'Component 1': first, 'Component 2': second}
+            for sensor, (first, second) in zip(list(_SENSOR_SELECTIONS), np.round(component_loadings, 3).tolist())
+        ]
         
         st.markdown("#### Component Loadings")
-        st.dataframe(loadings.round(3))
+        st.table(loadings)
         
         # Explain variance
-        variance_explained = pca.explained_variance_ratio_
-        
         st.markdown("#### Variance Explained")
         st.markdown(f"Component 1: {variance_explained[0]:.2%}")
         st.markdown(f"Component 2: {variance_explained[1]:.2%}")
         st.markdown(f"Total: {sum(variance_explained):.2%}")
 
-def show_maintenance_impact(data):
+def _sensor_prefix_sums(data):
+    """
+    Running totals of the sensor columns, so any row range can be averaged with two lookups
+    
+    Parameters:
+    data (DataFrame): Sensor data
+    
+    Returns:
+    tuple: (sums, counts) arrays of shape (rows + 1, sensors); missing readings add to neither
+    """
+    sensors = data[_SENSOR_COLUMNS].to_numpy(dtype=np.float64)
+    present = ~np.isnan(sensors)
+    zeros = np.zeros((1, len(_SENSOR_COLUMNS)))
+    sum_prefix = np.concatenate([zeros, np.cumsum(np.where(present, sensors, 0.0), axis=0)])
+    count_prefix = np.concatenate([zeros, np.cumsum(present, axis=0)])
+    return sum_prefix, count_prefix
+
+def _window_means(sum_prefix, count_prefix, lo, hi):
+    """Mean of each sensor over rows lo[i]:hi[i], one row of means per window"""
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return (sum_prefix[hi] - sum_prefix[lo]) / (count_prefix[hi] - count_prefix[lo])
+
+def _centered_rolling_means(data, window):
+    """
+    Centered rolling mean of every sensor column, matching rolling(window, center=True).mean()
+    
+    Parameters:
+    data (DataFrame): Sensor data with at least `window` rows
+    window (int): Number of readings per window
+    
+    Returns:
+    ndarray: Means of shape (rows, sensors); NaN where the window is incomplete or has a missing reading
+    """
+    sum_prefix, count_prefix = _sensor_prefix_sums(data)
+    rows = len(data)
+    
+    # Each window covers rows end-window..end-1; pandas centers it on row end-1-(window-1)//2
+    ends = np.arange(window, rows + 1)
+    means = _window_means(sum_prefix, count_prefix, ends - window, ends)
+    means[(count_prefix[ends] - count_prefix[ends - window]) < window] = np.nan
+    
+    offset = (window - 1) // 2
+    rolling = np.full((rows, len(_SENSOR_COLUMNS)), np.nan)
+    rolling[window - 1 - offset:rows - offset] = means
+    return rolling
+
+def show_maintenance_impact(data, maintenance_positions=None):
     """
     Analyze and display the impact of maintenance on sensor readings
     
     Parameters:
     data (DataFrame): Filtered sensor data
+    maintenance_positions (ndarray): Row positions of maintenance events, found from data if omitted
     """
     # Check if there are any maintenance events
-    maintenance_events = data[data['maintenance_performed'] > 0]
+    if maintenance_positions is None:
+        maintenance_positions = _maintenance_positions(data)
     
-    if maintenance_events.empty:
+    if len(maintenance_positions) == 0:
         st.info("No maintenance events in the selected data range")
         return
     
-    # For each maintenance event, analyze before and after
-    impact_results = []
+    # Row ranges of the 7 days before and after each event in the time-sorted data
+    timestamps = data['timestamp'].to_numpy()
+    event_times = timestamps[maintenance_positions]
+    window = np.timedelta64(7, 'D')
+    before_lo = np.searchsorted(timestamps, event_times - window, side='left')
+    before_hi = np.searchsorted(timestamps, event_times, side='left')
+    after_lo = np.searchsorted(timestamps, event_times, side='right')
+    after_hi = np.searchsorted(timestamps, event_times + window, side='right')
     
-    for _, event in maintenance_events.iterrows():
-        event_time = event['timestamp']
-        
-        # Get data before maintenance (up to 7 days before)
-        before_start = event_time - pd.Timedelta(days=7)
-        before_data = data[(data['timestamp'] >= before_start) & (data['timestamp'] < event_time)]
-        
-        # Get data after maintenance (up to 7 days after)
-        after_end = event_time + pd.Timedelta(days=7)
-        after_data = data[(data['timestamp'] > event_time) & (data['timestamp'] <= after_end)]
-        
-        # Skip if not enough data
-        if len(before_data) < 5 or len(after_data) < 5:
-            continue
-        
-        # Calculate metrics
-        metrics = {}
-        
-        for sensor in ['temperature', 'pressure', 'vibration', 'power']:
-            before_avg = before_data[sensor].mean()
-            after_avg = after_data[sensor].mean()
-            change_pct = ((after_avg - before_avg) / before_avg) * 100
-            
-            metrics[sensor] = {
-                'before': before_avg,
-                'after': after_avg,
-                'change_pct': change_pct
-            }
-        
-        impact_results.append({
-            'event_time': event_time,
-            'metrics': metrics
-        })
+    # Skip events without enough data on either side
+    enough_data = np.flatnonzero(((before_hi - before_lo) >= 5) & ((after_hi - after_lo) >= 5))
     
     # Display results
-    if not impact_results:
+    if len(enough_data) == 0:
         st.info("Not enough data around maintenance events for analysis")
         return
     
+    # Parallel arrays over the usable events, with one column per sensor
+    event_times = event_times[enough_data]
+    window_lo = before_lo[enough_data]
+    window_hi = after_hi[enough_data]
+    
+    # Average every sensor over every window at once
+    sum_prefix, count_prefix = _sensor_prefix_sums(data)
+    before = _window_means(sum_prefix, count_prefix, window_lo, before_hi[enough_data])
+    after = _window_means(sum_prefix, count_prefix, after_lo[enough_data], window_hi)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        change_pct = (after - before) / before * 100
+    
     # Create visualization of before/after
     col1, col2 = st.columns(2)
     
@@ -556,40 +755,35 @@ def show_maintenance_impact(data):
         # Select metrics to display
         selected_event = st.selectbox(
             "Select Maintenance Event",
-            range(len(impact_results)),
-            format_func=lambda i: impact_results[i]['event_time'].strftime('%Y-%m-%d %H:%M')
+            range(len(event_times)),
+            format_func=lambda i: pd.Timestamp(event_times[i]).strftime('%Y-%m-%d %H:%M')
         )
         
         # Get the selected event data
-        event_data = impact_results[selected_event]
-        event_time = event_data['event_time']
-        metrics = event_data['metrics']
+        event_time = pd.Timestamp(event_times[selected_event])
+        event_before = before[selected_event]
+        event_after = after[selected_event]
+        event_change = change_pct[selected_event]
         
         # Create summary table
-        summary_data = []
-        
-        for sensor, values in metrics.items():
-            summary_data.append({
+        summary_data = [
+            {
                 'Sensor': sensor.capitalize(),
-                'Before': round(values['before'], 2),
-                'After': round(values['after'], 2),
-                'Change (%)': round(values['change_pct'], 2)
-            })
+                'Before': round(float(event_before[j]), 2),
+                'After': round(float(event_after[j]), 2),
+                'Change (%)': round(float(event_change[j]), 2)
+            }
+            for j, sensor in enumerate(_SENSOR_COLUMNS)
+        ]
         
-        summary_df = pd.DataFrame(summary_data)
-        st.dataframe(summary_df, use_container_width=True)
+        st.table(summary_data)
     
     with col2:
         # Create bar chart of changes
-        change_data = []
-        
-        for sensor, values in metrics.items():
-            change_data.append({
-                'Sensor': sensor.capitalize(),
-                'Change (%)': values['change_pct']
-            })
-        
-        change_df = pd.DataFrame(change_data)
+        change_df = pd.DataFrame({
+            'Sensor': [sensor.capitalize() for sensor in _SENSOR_COLUMNS],
+            'Change (%)': event_change
+        })
         
         fig = px.bar(
             change_df,
@@ -611,12 +805,8 @@ def show_maintenance_impact(data):
     # Show detailed time series around the event
     st.subheader("Time Series Around Maintenance Event")
     
-    # Get data from 7 days before to 7 days after
-    event_time = impact_results[selected_event]['event_time']
-    window_start = event_time - pd.Timedelta(days=7)
-    window_end = event_time + pd.Timedelta(days=7)
-    
-    window_data = data[(data['timestamp'] >= window_start) & (data['timestamp'] <= window_end)]
+    # Get data from 7 days before to 7 days after, using the row range found above
+    window_data = data.iloc[window_lo[selected_event]:window_hi[selected_event]]
     
     # Select sensor to visualize
     selected_sensor = st.selectbox(
@@ -627,57 +817,31 @@ def show_maintenance_impact(data):
     # Map selection to column name
     sensor_column = selected_sensor.lower()
     
-    # Create time series plot
+    # Create time series plot from a thinned copy of the window, with the points
+    # and their connecting line drawn by a single trace
     fig = px.scatter(
-        window_data,
+        window_data.iloc[_chart_positions(window_data, [sensor_column])],
         x='timestamp',
         y=sensor_column,
-        labels={'timestamp': 'Time', sensor_column: f"{selected_sensor} Reading"}
+        labels={'timestamp': 'Time', sensor_column: f"{selected_sensor} Reading"},
+        render_mode='webgl'
     )
+    fig.update_traces(mode='lines+markers', line=dict(color='rgba(0,0,255,0.3)'))
     
-    # Add line connecting points
-    fig.add_trace(go.Scatter(
-        x=window_data['timestamp'],
-        y=window_data[sensor_column],
-        mode='lines',
-        line=dict(color='rgba(0,0,255,0.3)'),
-        showlegend=False
-    ))
-    
-    # Add before and after averages
-    before_avg = window_data[window_data['timestamp'] < event_time][sensor_column].mean()
-    after_avg = window_data[window_data['timestamp'] > event_time][sensor_column].mean()
-    
-    fig.add_hline(
-        y=before_avg,
-        line_dash="dash", 
-        line_color="blue",
-        annotation_text="Before Avg",
-        annotation_position="top left"
-    )
-    
-    fig.add_hline(
-        y=after_avg,
-        line_dash="dash", 
-        line_color="green",
-        annotation_text="After Avg",
-        annotation_position="top right"
-    )
+    # Add before and after averages, already computed for the selected event
+    sensor_index = _SENSOR_COLUMNS.index(sensor_column)
+    before_line, before_label = _horizontal_line(float(event_before[sensor_index]), "blue", "Before Avg", xanchor='left')
+    after_line, after_label = _horizontal_line(float(event_after[sensor_index]), "green", "After Avg", xanchor='right')
     
     # Add maintenance event line
-    fig.add_vline(
-        x=event_time,
-        line_dash="solid", 
-        line_width=2,
-        line_color="red",
-        annotation_text="Maintenance",
-        annotation_position="top"
-    )
+    event_line, event_label = _vertical_line(event_time, "red", "Maintenance", dash='solid')
     
     fig.update_layout(
         height=400,
         margin=dict(l=20, r=20, t=30, b=20),
-        hovermode="closest"
+        hovermode="closest",
+        shapes=[before_line, after_line, event_line],
+        annotations=[before_label, after_label, event_label]
     )
     
     st.plotly_chart(fig, use_container_width=True)
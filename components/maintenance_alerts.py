@@ -3,17 +3,28 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
+from utils.session_cache import get_page_cache
 
-def show_maintenance_alerts(processed_data, equipment_data):
+def _maintenance_tables(processed_data, equipment_data, current_date):
     """
-    Display maintenance alerts and recommendations
+    Build the maintenance status and timeline tables, once per data refresh and day
     
     Parameters:
     processed_data (dict): Processed sensor data with predictions
     equipment_data (DataFrame): Equipment metadata
-    """
-    st.header("Maintenance Alerts")
+    current_date (date): Date the timeline counts days to failure from
     
+    Returns:
+    tuple: (maintenance DataFrame sorted by urgency, timeline DataFrame sorted by date)
+    """
+    cache = get_page_cache('maintenance_alerts_cache')
+    if cache.get('tables_date') != current_date:
+        cache['tables_date'] = current_date
+        cache['tables'] = _build_maintenance_tables(processed_data, equipment_data, current_date)
+    return cache['tables']
+
+def _build_maintenance_tables(processed_data, equipment_data, current_date):
+    """Build the maintenance status and timeline tables"""
     # Create dataframe with all equipment and their maintenance status
     maintenance_data = []
     
@@ -73,6 +84,39 @@ def show_maintenance_alerts(processed_data, equipment_data):
     # Convert to dataframe and sort by urgency
     maintenance_df = pd.DataFrame(maintenance_data).sort_values('sort_value')
     
+    # Create timeline data
+    timeline_data = []
+    
+    for _, row in maintenance_df.iterrows():
+        if row['days_to_failure'] is not None:
+            maintenance_date = current_date + timedelta(days=row['days_to_failure'])
+            
+            timeline_data.append({
+                'machine_id': row['machine_id'],
+                'date': maintenance_date,
+                'urgency': row['urgency'],
+                'days_away': row['days_to_failure']
+            })
+    
+    # Sort by date
+    timeline_df = pd.DataFrame(timeline_data).sort_values('date')
+    
+    return maintenance_df, timeline_df
+
+def show_maintenance_alerts(processed_data, equipment_data):
+    """
+    Display maintenance alerts and recommendations
+    
+    Parameters:
+    processed_data (dict): Processed sensor data with predictions
+    equipment_data (DataFrame): Equipment metadata
+    """
+    st.header("Maintenance Alerts")
+    
+    # Tables are rebuilt only when the data is refreshed or the date changes
+    current_date = datetime.now().date()
+    maintenance_df, timeline_df = _maintenance_tables(processed_data, equipment_data, current_date)
+    
     # Display maintenance summary
     st.subheader("Maintenance Summary")
     
@@ -94,24 +138,6 @@ def show_maintenance_alerts(processed_data, equipment_data):
     # Display maintenance timeline
     st.subheader("Maintenance Timeline")
     
-    # Create timeline data
-    timeline_data = []
-    current_date = datetime.now().date()
-    
-    for _, row in maintenance_df.iterrows():
-        if row['days_to_failure'] is not None:
-            maintenance_date = current_date + timedelta(days=row['days_to_failure'])
-            
-            timeline_data.append({
-                'machine_id': row['machine_id'],
-                'date': maintenance_date,
-                'urgency': row['urgency'],
-                'days_away': row['days_to_failure']
-            })
-    
-    # Sort by date
-    timeline_df = pd.DataFrame(timeline_data).sort_values('date')
-    
     # Calculate date range for x-axis
     if not timeline_df.empty:
         min_date = current_date
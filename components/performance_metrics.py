@@ -4,6 +4,7 @@ import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
+from utils.session_cache import get_page_cache
 
 def show_performance_metrics(processed_data, equipment_data):
     """
@@ -18,12 +19,17 @@ def show_performance_metrics(processed_data, equipment_data):
     # Get sensor data
     sensor_data = processed_data['sensor_data']
     
+    # Derived metrics are reused across reruns until the data is refreshed
+    page_cache = get_page_cache('performance_metrics_cache')
+    
     # Calculate overall metrics
     total_machines = len(equipment_data)
     avg_health_score = equipment_data['health_score'].mean()
     
     # Calculate operational metrics
-    operational_data = calculate_operational_metrics(sensor_data, equipment_data)
+    if 'operational' not in page_cache:
+        page_cache['operational'] = calculate_operational_metrics(sensor_data, equipment_data)
+    operational_data = page_cache['operational']
     
     # Display overall metrics
     st.subheader("Overall Equipment Performance")
@@ -102,7 +108,10 @@ def show_performance_metrics(processed_data, equipment_data):
     )
     
     # Calculate trends based on selected grouping
-    trend_data = calculate_performance_trends(sensor_data, time_grouping)
+    trend_key = ('trends', time_grouping)
+    if trend_key not in page_cache:
+        page_cache[trend_key] = calculate_performance_trends(sensor_data, time_grouping)
+    trend_data = page_cache[trend_key]
     
     # Display trend chart
     st.plotly_chart(create_trend_chart(trend_data, time_grouping), use_container_width=True)
@@ -135,7 +144,9 @@ def show_performance_metrics(processed_data, equipment_data):
     # Maintenance impact analysis
     st.subheader("Maintenance Impact Analysis")
     
-    impact_data = analyze_maintenance_impact(sensor_data)
+    if 'impact' not in page_cache:
+        page_cache['impact'] = analyze_maintenance_impact(sensor_data)
+    impact_data = page_cache['impact']
     
     col1, col2 = st.columns(2)
     
@@ -502,23 +513,22 @@ def analyze_maintenance_impact(sensor_data):
     pre_maintenance_slope = -0.5  # Performance loss per day before maintenance
     post_maintenance_slope = 0.1  # Performance loss per day after maintenance
     
-    # Calculate performance values
-    avg_performance = []
-    for day in days_relative:
-        if day < 0:
-            # Before maintenance: gradually decreasing
-            perf = base_performance + day * pre_maintenance_slope
-        else:
-            # After maintenance: immediate improvement, then slow decrease
-            immediate_improvement = 10  # Performance boost right after maintenance
-            perf = base_performance + immediate_improvement - day * post_maintenance_slope
-        
-        # Add some noise
-        perf += np.random.normal(0, 1)
-        
-        # Cap between 60 and 100
-        perf = max(60, min(100, perf))
-        avg_performance.append(perf)
+    # Calculate performance values for all days at once
+    days = np.array(days_relative)
+    immediate_improvement = 10  # Performance boost right after maintenance
+    perf = np.where(
+        days < 0,
+        # Before maintenance: gradually decreasing
+        base_performance + days * pre_maintenance_slope,
+        # After maintenance: immediate improvement, then slow decrease
+        base_performance + immediate_improvement - days * post_maintenance_slope
+    )
+    
+    # Add some noise
+    perf = perf + np.random.normal(0, 1, size=days.size)
+    
+    # Cap between 60 and 100
+    avg_performance = np.clip(perf, 60, 100).tolist()
     
     # Calculate metrics
     before_maintenance = avg_performance[29]  # Day before maintenance
@@ -0,0 +1,23 @@
+"""
+Session cache module for the dashboard pages.
+
+This module provides per-page caches kept in Streamlit session state across reruns.
+"""
+import streamlit as st
+
+def get_page_cache(session_key):
+    """
+    Return a page's cache, cleared whenever the sensor data is refreshed
+    
+    Parameters:
+    session_key (str): Session state key holding the page's cache
+    
+    Returns:
+    dict: Cache that lives until st.session_state.last_update changes
+    """
+    cache = st.session_state.setdefault(session_key, {})
+    data_key = st.session_state.get('last_update')
+    if cache.get('data_key') != data_key:
+        cache.clear()
+        cache['data_key'] = data_key
+    return cache
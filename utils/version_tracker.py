@@ -9,13 +9,16 @@ import json
 from datetime import datetime
 import hashlib
 import os
+from functools import lru_cache
+
+DEFAULT_VERSION_FILE = 'assets/sred_visuals/version_history.json'
 
 class SREDVersionTracker:
     """
     Class for tracking versions of SR&ED documentation.
     """
     
-    def __init__(self, version_file='assets/sred_visuals/version_history.json'):
+    def __init__(self, version_file=DEFAULT_VERSION_FILE):
         """
         Initialize the version tracker.
         
@@ -194,12 +197,33 @@ def add_version_info(sred_type="Technical Documentation", changes=None):
     }
 
 
+@lru_cache(maxsize=1)
+def _cached_version_markdown(version_file, modified_ns):
+    """
+    Render the version history markdown for a given state of the version file.
+    
+    Args:
+        version_file (str): Path to the version history file
+        modified_ns (int): Modification time of the file, used as the cache key
+        
+    Returns:
+        str: Markdown version history
+    """
+    tracker = SREDVersionTracker(version_file)
+    return tracker.generate_version_markdown()
+
+
 def generate_version_history_file():
     """
     Generate version history file.
     
+    The markdown is only rebuilt when the version file has changed on disk.
+    
     Returns:
         str: Markdown version history
     """
-    tracker = SREDVersionTracker()
-    return tracker.generate_version_markdown()
\ No newline at end of file
+    try:
+        modified_ns = os.stat(DEFAULT_VERSION_FILE).st_mtime_ns
+    except OSError:
+        modified_ns = None
+    return _cached_version_markdown(DEFAULT_VERSION_FILE, modified_ns)
\ No newline at end of file
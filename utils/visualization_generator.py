@@ -6,13 +6,13 @@ showing experimental results and research findings in a visual format.
 """
 
 import io
+from functools import lru_cache
 import numpy as np
 import matplotlib
 matplotlib.use('Agg')  # Required for non-interactive environments
 import matplotlib.pyplot as plt
 from matplotlib.patches import Patch
 import pandas as pd
-from PIL import Image, ImageDraw, ImageFont
 
 def generate_experiment_timeline():
     """
@@ -63,7 +63,6 @@ def generate_experiment_timeline():
     plt.tight_layout()
     fig.savefig(buffer, format='png', dpi=300)
     plt.close(fig)
-    buffer.seek(0)
     return buffer.getvalue()
 
 def generate_anomaly_detection_comparison():
@@ -120,7 +119,6 @@ def generate_anomaly_detection_comparison():
     plt.tight_layout(rect=[0, 0.03, 1, 0.97])
     fig.savefig(buffer, format='png', dpi=300)
     plt.close(fig)
-    buffer.seek(0)
     return buffer.getvalue()
 
 def generate_prediction_lead_time_chart():
@@ -184,7 +182,6 @@ def generate_prediction_lead_time_chart():
     plt.tight_layout(rect=[0, 0.03, 1, 0.97])
     fig.savefig(buffer, format='png', dpi=300)
     plt.close(fig)
-    buffer.seek(0)
     return buffer.getvalue()
 
 def generate_research_methodology_diagram():
@@ -194,6 +191,8 @@ def generate_research_methodology_diagram():
     Returns:
         bytes: PNG image data
     """
+    from PIL import Image, ImageDraw, ImageFont
+    
     # Create a new PIL image
     width, height = 1200, 800
     background_color = (255, 255, 255)
@@ -294,7 +293,6 @@ def generate_research_methodology_diagram():
     # Save to bytesio
     buffer = io.BytesIO()
     image.save(buffer, format='PNG')
-    buffer.seek(0)
     return buffer.getvalue()
 
 def generate_technical_advancement_chart():
@@ -362,13 +360,16 @@ def generate_technical_advancement_chart():
     plt.tight_layout(rect=[0, 0.03, 1, 0.97])
     fig.savefig(buffer, format='png', dpi=300)
     plt.close(fig)
-    buffer.seek(0)
     return buffer.getvalue()
 
+@lru_cache(maxsize=1)
 def get_all_visualization_data():
     """
     Generate all visualizations and return them as a dictionary.
     
+    The charts are built from fixed research data, so they are rendered once
+    per process and reused by every documentation package.
+    
     Returns:
         dict: Dictionary with all visualization data
     """